@@ -0,0 +1,28 @@
+"""add gene cost profile
+
+Revision ID: 4a1e2c9d7b30
+Revises: 153cf7d88a0b
+Create Date: 2026-10-17 10:12:04.118532
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4a1e2c9d7b30'
+down_revision: Union[str, Sequence[str], None] = '153cf7d88a0b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('genes', sa.Column('cost_profile', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('genes', 'cost_profile')
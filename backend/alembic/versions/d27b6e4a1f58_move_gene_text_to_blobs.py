@@ -0,0 +1,131 @@
+"""move gene text to blobs
+
+Revision ID: d27b6e4a1f58
+Revises: 9c3f5a2e8d41
+Create Date: 2026-10-17 17:05:22.734190
+
+"""
+import hashlib
+import zlib
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd27b6e4a1f58'
+down_revision: Union[str, Sequence[str], None] = '9c3f5a2e8d41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Mirrors Blob.COMPRESS_MIN_BYTES at the time of this revision
+COMPRESS_MIN_BYTES = 256
+
+blobs = sa.table(
+    'blobs',
+    sa.column('hash', sa.String),
+    sa.column('encoding', sa.String),
+    sa.column('size', sa.Integer),
+    sa.column('data', sa.LargeBinary),
+    sa.column('created_at', sa.DateTime),
+)
+genes = sa.table(
+    'genes',
+    sa.column('id', sa.String),
+    sa.column('implementation', sa.Text),
+    sa.column('prompt_template', sa.Text),
+    sa.column('implementation_hash', sa.String),
+    sa.column('prompt_hash', sa.String),
+)
+
+
+def _encode(text: str) -> dict:
+    raw = text.encode()
+    data, encoding = raw, 'raw'
+    if len(raw) >= COMPRESS_MIN_BYTES:
+        compressed = zlib.compress(raw)
+        if len(compressed) < len(raw):
+            data, encoding = compressed, 'zlib'
+    return {
+        'hash': hashlib.sha256(raw).hexdigest(),
+        'encoding': encoding,
+        'size': len(raw),
+        'data': data,
+        'created_at': datetime.utcnow(),
+    }
+
+
+def _decode(encoding: str, data: bytes) -> str:
+    return (zlib.decompress(data) if encoding == 'zlib' else data).decode()
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('blobs',
+    sa.Column('hash', sa.String(length=64), nullable=False),
+    sa.Column('encoding', sa.String(length=10), nullable=False),
+    sa.Column('size', sa.Integer(), nullable=False),
+    sa.Column('data', sa.LargeBinary(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('hash')
+    )
+    with op.batch_alter_table('genes') as batch_op:
+        batch_op.add_column(sa.Column('implementation_hash', sa.String(length=64), nullable=True))
+        batch_op.add_column(sa.Column('prompt_hash', sa.String(length=64), nullable=True))
+        batch_op.create_foreign_key('fk_genes_implementation_hash', 'blobs', ['implementation_hash'], ['hash'])
+        batch_op.create_foreign_key('fk_genes_prompt_hash', 'blobs', ['prompt_hash'], ['hash'])
+
+    # Copy existing text into blobs, one row per distinct content
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.select(genes.c.id, genes.c.implementation, genes.c.prompt_template)
+    ).all()
+    stored = set()
+    for gene_id, implementation, prompt_template in rows:
+        hashes = {}
+        for column, text in (('implementation_hash', implementation), ('prompt_hash', prompt_template)):
+            if text is None:
+                continue
+            blob = _encode(text)
+            if blob['hash'] not in stored:
+                bind.execute(blobs.insert().values(**blob))
+                stored.add(blob['hash'])
+            hashes[column] = blob['hash']
+        if hashes:
+            bind.execute(genes.update().where(genes.c.id == gene_id).values(**hashes))
+
+    with op.batch_alter_table('genes') as batch_op:
+        batch_op.drop_column('implementation')
+        batch_op.drop_column('prompt_template')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('genes') as batch_op:
+        batch_op.add_column(sa.Column('implementation', sa.Text(), nullable=True))
+        batch_op.add_column(sa.Column('prompt_template', sa.Text(), nullable=True))
+
+    bind = op.get_bind()
+    texts = {
+        blob_hash: _decode(encoding, data)
+        for blob_hash, encoding, data in bind.execute(
+            sa.select(blobs.c.hash, blobs.c.encoding, blobs.c.data)
+        )
+    }
+    rows = bind.execute(
+        sa.select(genes.c.id, genes.c.implementation_hash, genes.c.prompt_hash)
+    ).all()
+    for gene_id, implementation_hash, prompt_hash in rows:
+        bind.execute(genes.update().where(genes.c.id == gene_id).values(
+            implementation=texts.get(implementation_hash),
+            prompt_template=texts.get(prompt_hash),
+        ))
+
+    with op.batch_alter_table('genes') as batch_op:
+        batch_op.drop_constraint('fk_genes_prompt_hash', type_='foreignkey')
+        batch_op.drop_constraint('fk_genes_implementation_hash', type_='foreignkey')
+        batch_op.drop_column('prompt_hash')
+        batch_op.drop_column('implementation_hash')
+    op.drop_table('blobs')
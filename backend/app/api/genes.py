@@ -5,26 +5,35 @@ from typing import Annotated, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from app.database import get_session
 from app.models import Gene
 from app.schemas import Gene as GeneSchema
-from app.schemas import GeneCreate, GeneUpdate
+from app.schemas import GeneCreate, GeneSummary, GeneUpdate
+from app.services.gene_index import gene_index
 
 router = APIRouter()
 
 # Type alias for database session dependency
 DBSession = Annotated[AsyncSession, Depends(get_session)]
 
+# Loads implementation and prompt text along with a gene
+WITH_TEXT = (selectinload(Gene.implementation_blob), selectinload(Gene.prompt_blob))
 
-@router.get("", response_model=list[GeneSchema])
+
+@router.get("", response_model=list[GeneSummary])
 async def list_genes(
     db: DBSession,
     skip: Annotated[int, Query(ge=0)] = 0,
     limit: Annotated[int, Query(ge=1, le=100)] = 100,
     status: Optional[str] = None,
 ):
-    """List all genes with optional filtering and pagination."""
+    """List all genes with optional filtering and pagination.
+
+    Implementation and prompt text are not loaded; fetch a single gene
+    for them.
+    """
     query = select(Gene).offset(skip).limit(limit)
 
     if status:
@@ -55,6 +64,7 @@ async def create_gene(
     db.add(db_gene)
     await db.commit()
     await db.refresh(db_gene)
+    gene_index.upsert(db_gene)
     return db_gene
 
 
@@ -65,7 +75,7 @@ async def get_gene(
 ):
     """Get a gene by ID."""
     result = await db.execute(
-        select(Gene).where(Gene.id == gene_id)
+        select(Gene).where(Gene.id == gene_id).options(*WITH_TEXT)
     )
     gene = result.scalar_one_or_none()
 
@@ -83,7 +93,7 @@ async def update_gene(
 ):
     """Update a gene."""
     result = await db.execute(
-        select(Gene).where(Gene.id == gene_id)
+        select(Gene).where(Gene.id == gene_id).options(*WITH_TEXT)
     )
     gene = result.scalar_one_or_none()
 
@@ -97,6 +107,7 @@ async def update_gene(
 
     await db.commit()
     await db.refresh(gene)
+    gene_index.upsert(gene)
     return gene
 
 
@@ -116,4 +127,5 @@ async def delete_gene(
 
     await db.delete(gene)
     await db.commit()
+    gene_index.remove(gene_id)
     return None
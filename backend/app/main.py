@@ -1,11 +1,30 @@
 """FastAPI application entry point."""
+import asyncio
+import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
 from app.api import api_router
 from app.config import settings
-from app.database import init_db
+from app.database import async_session, init_db
+from app.services.gene_index import gene_index
+from app.services.sandbox import SandboxPool
+from app.services.templates import template_registry
+
+logger = logging.getLogger(__name__)
+
+
+async def refresh_templates(interval_seconds: float) -> None:
+    """Reload changed mutation templates from the database periodically."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            async with async_session() as session:
+                await template_registry.load(session)
+        except Exception:
+            # Keep serving the templates already loaded; retry next interval
+            logger.exception("Mutation template refresh failed")
 
 
 @asynccontextmanager
@@ -13,8 +32,25 @@ async def lifespan(app: FastAPI):
     """Application lifespan handler."""
     # Startup
     await init_db()
+    async with async_session() as session:
+        await gene_index.load(session)
+        await template_registry.load(session)
+    refresher = None
+    if settings.template_refresh_seconds > 0:
+        refresher = asyncio.create_task(refresh_templates(settings.template_refresh_seconds))
+    app.state.sandbox = None
+    if settings.sandbox_workers > 0:
+        app.state.sandbox = SandboxPool(
+            size=settings.sandbox_workers,
+            max_jobs_per_worker=settings.sandbox_max_jobs_per_worker,
+        )
+        await asyncio.to_thread(app.state.sandbox.warm_up)
     yield
     # Shutdown
+    if refresher is not None:
+        refresher.cancel()
+    if app.state.sandbox is not None:
+        app.state.sandbox.close()
 
 
 app = FastAPI(
@@ -1,8 +1,31 @@
 """SQLAlchemy models for GEP data structures."""
+import hashlib
+import itertools
+import zlib
 from datetime import datetime
-from typing import Optional
-from sqlalchemy import String, Text, Float, Integer, JSON, ForeignKey, Table, Column
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from typing import Any, Optional
+from sqlalchemy import (
+    String, Text, Float, Integer, JSON, LargeBinary, ForeignKey, Table, Column, event,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column, relationship
+
+# Dialects with INSERT ... ON CONFLICT DO NOTHING
+_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def insert_ignore(dialect_name: str, model: Any):
+    """Build an INSERT for model that skips rows conflicting with existing ones.
+
+    Raises:
+        NotImplementedError: If the dialect has no ON CONFLICT support.
+    """
+    if dialect_name not in _INSERTS:
+        raise NotImplementedError(f"INSERT ... ON CONFLICT is not supported on {dialect_name}")
+    return _INSERTS[dialect_name](model).on_conflict_do_nothing()
 
 
 class Base(DeclarativeBase):
@@ -10,6 +33,52 @@ class Base(DeclarativeBase):
     pass
 
 
+class Blob(Base):
+    """Blob model - content-addressed text shared by genes.
+
+    Implementations and prompts are stored once per distinct content,
+    keyed by the SHA-256 of the text. Texts of at least
+    ``COMPRESS_MIN_BYTES`` are zlib-compressed when that makes them smaller.
+    """
+    __tablename__ = "blobs"
+
+    COMPRESS_MIN_BYTES = 256
+
+    hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    encoding: Mapped[str] = mapped_column(String(10), nullable=False, default="raw")
+    size: Mapped[int] = mapped_column(Integer, nullable=False)
+    data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow)
+
+    @staticmethod
+    def hash_text(text: str) -> str:
+        """Return the content hash of a text."""
+        return hashlib.sha256(text.encode()).hexdigest()
+
+    @classmethod
+    def encode(cls, text: str) -> dict:
+        """Build the blob row for a text."""
+        raw = text.encode()
+        data, encoding = raw, "raw"
+        if len(raw) >= cls.COMPRESS_MIN_BYTES:
+            compressed = zlib.compress(raw)
+            if len(compressed) < len(raw):
+                data, encoding = compressed, "zlib"
+        return {
+            "hash": hashlib.sha256(raw).hexdigest(),
+            "encoding": encoding,
+            "size": len(raw),
+            "data": data,
+            "created_at": datetime.utcnow(),
+        }
+
+    @property
+    def text(self) -> str:
+        """Decoded content."""
+        data = zlib.decompress(self.data) if self.encoding == "zlib" else self.data
+        return data.decode()
+
+
 # Association table for Gene-Capsule M:N relationship
 gene_capsule_association = Table(
     "gene_capsule",
@@ -30,8 +99,16 @@ class Gene(Base):
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
     name: Mapped[str] = mapped_column(String(100), nullable=False, unique=True)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    implementation: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    prompt_template: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    implementation_hash: Mapped[Optional[str]] = mapped_column(
+        String(64),
+        ForeignKey("blobs.hash"),
+        nullable=True,
+    )
+    prompt_hash: Mapped[Optional[str]] = mapped_column(
+        String(64),
+        ForeignKey("blobs.hash"),
+        nullable=True,
+    )
     status: Mapped[str] = mapped_column(
         String(20),
         nullable=False,
@@ -39,6 +116,7 @@ class Gene(Base):
     )
     success_rate: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
     context_tags: Mapped[list] = mapped_column(JSON, nullable=False, default=list)
+    cost_profile: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
     created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow)
     updated_at: Mapped[datetime] = mapped_column(
         default=datetime.utcnow,
@@ -50,6 +128,84 @@ class Gene(Base):
         secondary=gene_capsule_association,
         back_populates="genes",
     )
+    # Text blobs load only when requested with selectinload
+    implementation_blob: Mapped[Optional["Blob"]] = relationship(
+        foreign_keys=[implementation_hash],
+        viewonly=True,
+        lazy="raise_on_sql",
+    )
+    prompt_blob: Mapped[Optional["Blob"]] = relationship(
+        foreign_keys=[prompt_hash],
+        viewonly=True,
+        lazy="raise_on_sql",
+    )
+
+    @property
+    def implementation(self) -> Optional[str]:
+        """Code implementation.
+
+        Raises:
+            sqlalchemy.exc.InvalidRequestError: If the gene was loaded
+                without ``selectinload(Gene.implementation_blob)``.
+        """
+        return self._blob_text("implementation")
+
+    @implementation.setter
+    def implementation(self, text: Optional[str]) -> None:
+        self._set_blob_text("implementation", text)
+
+    @property
+    def prompt_template(self) -> Optional[str]:
+        """Prompt template.
+
+        Raises:
+            sqlalchemy.exc.InvalidRequestError: If the gene was loaded
+                without ``selectinload(Gene.prompt_blob)``.
+        """
+        return self._blob_text("prompt_template")
+
+    @prompt_template.setter
+    def prompt_template(self, text: Optional[str]) -> None:
+        self._set_blob_text("prompt_template", text)
+
+    def _blob_text(self, field: str) -> Optional[str]:
+        if field in self._pending_text:
+            return self._pending_text[field]
+        # Normal attribute access, so an unloaded blob raises instead of
+        # reading as missing text
+        blob = getattr(self, GENE_BLOB_FIELDS[field][1])
+        return blob.text if blob is not None else None
+
+    def _set_blob_text(self, field: str, text: Optional[str]) -> None:
+        # Stored by the before_flush hook; kept for reads on this instance
+        self._pending_text[field] = text
+        setattr(self, GENE_BLOB_FIELDS[field][0], Blob.hash_text(text) if text is not None else None)
+
+    @property
+    def _pending_text(self) -> dict[str, Optional[str]]:
+        return self.__dict__.setdefault("_gene_pending_text", {})
+
+
+# Text attribute of Gene -> (hash column, blob relationship)
+GENE_BLOB_FIELDS = {
+    "implementation": ("implementation_hash", "implementation_blob"),
+    "prompt_template": ("prompt_hash", "prompt_blob"),
+}
+
+
+@event.listens_for(Session, "before_flush")
+def _store_gene_blobs(session: Session, flush_context: Any, instances: Any) -> None:
+    """Insert the blobs referenced by new or changed genes."""
+    rows = {}
+    for obj in itertools.chain(session.new, session.dirty):
+        if isinstance(obj, Gene):
+            for text in obj._pending_text.values():
+                if text is not None:
+                    row = Blob.encode(text)
+                    rows[row["hash"]] = row
+    if rows:
+        connection = session.connection()
+        connection.execute(insert_ignore(connection.dialect.name, Blob).values(list(rows.values())))
 
 
 class Capsule(Base):
@@ -104,3 +260,24 @@ class Event(Base):
 
     # Relationships
     capsule: Mapped[Optional["Capsule"]] = relationship(back_populates="events")
+
+
+class MutationTemplate(Base):
+    """MutationTemplate model - runtime-editable mutation template.
+
+    Templates use ``${name}`` placeholders filled from intent context;
+    ``params`` declares each parameter's type and default. Workers reload
+    changed templates without restarting.
+    """
+    __tablename__ = "mutation_templates"
+
+    id: Mapped[str] = mapped_column(String(100), primary_key=True)
+    kind: Mapped[str] = mapped_column(String(20), nullable=False, default="code")
+    source: Mapped[str] = mapped_column(Text, nullable=False)
+    params: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow)
+    updated_at: Mapped[datetime] = mapped_column(
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+    )
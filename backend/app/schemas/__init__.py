@@ -1,10 +1,10 @@
 """Pydantic schemas for GEP data structures."""
-from app.schemas.gene import Gene, GeneCreate, GeneUpdate
+from app.schemas.gene import Gene, GeneCreate, GeneUpdate, GeneSummary
 from app.schemas.capsule import Capsule, CapsuleCreate, CapsuleUpdate
 from app.schemas.event import Event, EventCreate
 
 __all__ = [
-    "Gene", "GeneCreate", "GeneUpdate",
+    "Gene", "GeneCreate", "GeneUpdate", "GeneSummary",
     "Capsule", "CapsuleCreate", "CapsuleUpdate",
     "Event", "EventCreate",
 ]
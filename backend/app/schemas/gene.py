@@ -1,6 +1,6 @@
 """Pydantic schemas for Gene model."""
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Dict
 from pydantic import BaseModel, Field, ConfigDict
 
 
@@ -25,6 +25,10 @@ class GeneBase(BaseModel):
         default_factory=list,
         description="Tags for context matching",
     )
+    cost_profile: Optional[Dict[str, float]] = Field(
+        None,
+        description="Resource usage measured during validation",
+    )
 
 
 class GeneCreate(GeneBase):
@@ -41,6 +45,7 @@ class GeneUpdate(BaseModel):
     status: Optional[str] = Field(None, pattern="^(draft|validated|deprecated)$")
     success_rate: Optional[float] = Field(None, ge=0.0, le=1.0)
     context_tags: Optional[List[str]] = None
+    cost_profile: Optional[Dict[str, float]] = None
 
 
 class Gene(GeneBase):
@@ -48,5 +53,24 @@ class Gene(GeneBase):
     model_config = ConfigDict(from_attributes=True)
 
     id: str = Field(..., description="Unique gene identifier")
+    implementation_hash: Optional[str] = Field(None, description="Content hash of the implementation")
+    prompt_hash: Optional[str] = Field(None, description="Content hash of the prompt template")
+    created_at: datetime
+    updated_at: datetime
+
+
+class GeneSummary(BaseModel):
+    """Schema for listing Genes without implementation and prompt text."""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    name: str
+    description: Optional[str] = None
+    status: str
+    success_rate: float
+    context_tags: List[str] = Field(default_factory=list)
+    cost_profile: Optional[Dict[str, float]] = None
+    implementation_hash: Optional[str] = None
+    prompt_hash: Optional[str] = None
     created_at: datetime
     updated_at: datetime
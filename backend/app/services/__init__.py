@@ -1,18 +1,38 @@
 """GEP Loop services."""
-from app.services.scanner import Scanner, ScanResult
+from app.services.scanner import Scanner, ScanResult, StagnationDetector
 from app.services.signal import SignalGenerator, EvolutionSignal
 from app.services.intent import IntentClassifier, Intent
 from app.services.mutator import Mutator, MutationResult
 from app.services.validator import Validator, ValidationResult
+from app.services.sandbox import SandboxPool
+from app.services.validation_cache import ValidationCache
+from app.services.tournament import Tournament, Candidate
+from app.services.mutation_backend import (
+    MutationBackend, TemplateBackend, FakeBackend, BatchingMutator,
+)
 from app.services.solidifier import Solidifier
+from app.services.bloom import BloomFilter
+from app.services.gene_store import GeneWriter
+from app.services.dedup import Deduplicator
+from app.services.scheduler import SignalScheduler
+from app.services.coalescer import SignalCoalescer
+from app.services.gene_index import GeneIndex, gene_index
+from app.services.metrics import LatencyHistogram, LoopMetrics
 from app.services.gep_loop import GEPLoop
 
 __all__ = [
-    "Scanner", "ScanResult",
+    "Scanner", "ScanResult", "StagnationDetector",
     "SignalGenerator", "EvolutionSignal",
     "IntentClassifier", "Intent",
     "Mutator", "MutationResult",
-    "Validator", "ValidationResult",
-    "Solidifier",
+    "Validator", "ValidationResult", "SandboxPool", "ValidationCache",
+    "Tournament", "Candidate",
+    "MutationBackend", "TemplateBackend", "FakeBackend", "BatchingMutator",
+    "Solidifier", "BloomFilter", "GeneWriter",
+    "Deduplicator",
+    "SignalScheduler",
+    "SignalCoalescer",
+    "GeneIndex", "gene_index",
+    "LatencyHistogram", "LoopMetrics",
     "GEPLoop",
 ]
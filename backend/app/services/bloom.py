@@ -0,0 +1,63 @@
+"""Bloom filter for compact set-membership checks."""
+import hashlib
+import math
+from typing import Iterable
+
+
+class BloomFilter:
+    """Probabilistic set of strings with no false negatives.
+
+    ``key in bloom`` is False only for keys never added; for other keys it
+    is True except with probability about ``error_rate`` once ``capacity``
+    keys have been added. Positions come from double hashing one BLAKE2b
+    digest, so each operation costs a single hash.
+    """
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 1e-6):
+        """Size the filter.
+
+        Args:
+            capacity: Number of keys the error rate is computed for.
+            error_rate: Target false-positive probability at capacity.
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if not 0.0 < error_rate < 1.0:
+            raise ValueError("error_rate must be between 0 and 1")
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def __contains__(self, key: str) -> bool:
+        bits = self._bits
+        return all(bits[p >> 3] & (1 << (p & 7)) for p in self._positions(key))
+
+    def __len__(self) -> int:
+        return self.count
+
+    def add(self, key: str) -> None:
+        """Add a key."""
+        bits = self._bits
+        for p in self._positions(key):
+            bits[p >> 3] |= 1 << (p & 7)
+        self.count += 1
+
+    def update(self, keys: Iterable[str]) -> None:
+        """Add several keys."""
+        for key in keys:
+            self.add(key)
+
+    def clear(self) -> None:
+        """Remove all keys."""
+        self._bits = bytearray(len(self._bits))
+        self.count = 0
+
+    def _positions(self, key: str) -> list[int]:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
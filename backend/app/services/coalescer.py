@@ -0,0 +1,129 @@
+"""Signal coalescing service."""
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable
+
+from app.services.signal import EvolutionSignal
+
+
+@dataclass
+class _Group:
+    """Signals with the same key collected within one window."""
+    opened_at: float
+    signal: EvolutionSignal
+    occurrences: int = 0
+    priority: int = 0
+    items: list[Any] = field(default_factory=list)
+
+
+class SignalCoalescer:
+    """Merges signals describing the same problem within a time window.
+
+    Signals are considered the same problem when they share ``signal_type``,
+    the set of patterns and ``source``. The first signal of a key opens a
+    window of ``window_seconds``; every matching signal that arrives before
+    the window closes is folded into it. When the window closes, one merged
+    signal is emitted whose ``occurrences`` is the number of folded signals
+    and whose priority rises by ``log2(occurrences)``, capped at 10.
+    """
+
+    MAX_PRIORITY = 10
+
+    def __init__(
+        self,
+        window_seconds: float = 1.0,
+        max_groups: int = 10000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize coalescer.
+
+        Args:
+            window_seconds: How long a key collects matching signals.
+            max_groups: Maximum number of open windows; the oldest window is
+                closed early when the limit is reached.
+            clock: Monotonic time source.
+        """
+        if max_groups < 1:
+            raise ValueError("max_groups must be at least 1")
+
+        self.window_seconds = window_seconds
+        self.max_groups = max_groups
+        self.clock = clock
+        self._groups: OrderedDict[tuple, _Group] = OrderedDict()
+        self.signals_in = 0
+        self.signals_out = 0
+
+    @staticmethod
+    def key(signal: EvolutionSignal) -> tuple:
+        """Return the coalescing key of a signal."""
+        return (signal.signal_type, frozenset(signal.patterns), signal.source)
+
+    def add(self, signal: EvolutionSignal, item: Any = None) -> list[tuple[EvolutionSignal, list[Any]]]:
+        """Add a signal, closing any windows that have expired.
+
+        Args:
+            signal: Signal to coalesce.
+            item: Caller data to hand back with the merged signal.
+
+        Returns:
+            List of (merged signal, items) for every window closed by this call.
+        """
+        now = self.clock()
+        ready = self._expire(now)
+        self.signals_in += 1
+
+        key = self.key(signal)
+        group = self._groups.get(key)
+        if group is None:
+            if len(self._groups) >= self.max_groups:
+                ready.append(self._close(next(iter(self._groups))))
+            group = self._groups[key] = _Group(opened_at=now, signal=signal)
+        group.occurrences += signal.occurrences
+        group.priority = max(group.priority, signal.priority)
+        group.items.append(item)
+        return ready
+
+    def flush(self) -> list[tuple[EvolutionSignal, list[Any]]]:
+        """Close all open windows.
+
+        Returns:
+            List of (merged signal, items) in the order the windows opened.
+        """
+        return [self._close(key) for key in list(self._groups)]
+
+    def pending(self) -> int:
+        """Return the number of open windows."""
+        return len(self._groups)
+
+    def stats(self) -> dict:
+        """Return counts of signals received and emitted."""
+        return {
+            "signals_in": self.signals_in,
+            "signals_out": self.signals_out,
+            "open_windows": len(self._groups),
+        }
+
+    def _expire(self, now: float) -> list[tuple[EvolutionSignal, list[Any]]]:
+        """Close windows opened more than window_seconds ago."""
+        ready = []
+        # Windows are kept in opening order, so expired ones are at the front
+        while self._groups:
+            key, group = next(iter(self._groups.items()))
+            if now - group.opened_at < self.window_seconds:
+                break
+            ready.append(self._close(key))
+        return ready
+
+    def _close(self, key: tuple) -> tuple[EvolutionSignal, list[Any]]:
+        """Remove a window and build its merged signal."""
+        group = self._groups.pop(key)
+        boost = int(math.log2(group.occurrences)) if group.occurrences > 1 else 0
+        merged = replace(
+            group.signal,
+            occurrences=group.occurrences,
+            priority=min(group.priority + boost, self.MAX_PRIORITY),
+        )
+        self.signals_out += 1
+        return merged, group.items
@@ -0,0 +1,224 @@
+"""Error fingerprinting and deduplication for the GEP loop."""
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Optional
+
+# Variable parts of log messages, most specific first
+_VARIABLE_PARTS = re.compile(
+    r"(?P<uuid>\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b)"
+    r"|(?P<ip>\b\d{1,3}(?:\.\d{1,3}){3}(?::\d+)?\b)"
+    r"|(?P<hex>\b0[xX][0-9a-fA-F]+\b|\b(?=[0-9a-fA-F]*\d)(?=[0-9a-fA-F]*[a-fA-F])[0-9a-fA-F]{8,}\b)"
+    r"|(?P<path>(?:[A-Za-z]:)?(?:[\\/][\w.\-]+){2,}[\\/]?)"
+    r"|(?P<num>\d+(?:\.\d+)?)"
+)
+
+
+def _mask(match: re.Match) -> str:
+    return f"<{match.lastgroup}>"
+
+
+def normalize_message(message: str) -> str:
+    """Mask UUIDs, IPs, hex values, paths and numbers in a log message.
+
+    Args:
+        message: Raw log message.
+
+    Returns:
+        Message with variable parts replaced by placeholders such as ``<ip>``.
+    """
+    return _VARIABLE_PARTS.sub(_mask, message)
+
+
+def fingerprint(log_entry: dict) -> str:
+    """Compute a stable fingerprint for a log entry.
+
+    Entries that differ only in hosts, ports, IDs and similar variable parts
+    share a fingerprint.
+
+    Args:
+        log_entry: Log entry with level, message and source.
+
+    Returns:
+        Hex fingerprint string.
+    """
+    key = "|".join((
+        str(log_entry.get("level", "")).upper(),
+        str(log_entry.get("source", "")),
+        normalize_message(str(log_entry.get("message", ""))),
+    ))
+    return hashlib.sha256(key.encode()).hexdigest()[:16]
+
+
+class Deduplicator:
+    """Remembers recent loop results by log fingerprint.
+
+    Entries are kept for ``ttl_seconds`` after they were first processed;
+    the cache holds at most ``max_entries`` fingerprints, evicting the least
+    recently used.
+
+    Fingerprints still being processed can be claimed, so duplicates that
+    arrive before the first result is stored wait for it instead of being
+    processed again; see ``claim``.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 60.0,
+        max_entries: int = 10000,
+        reuse_results: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize deduplicator.
+
+        Args:
+            ttl_seconds: How long a processed fingerprint suppresses repeats.
+            max_entries: Maximum number of fingerprints remembered.
+            reuse_results: Return the earlier result for duplicates; if False,
+                duplicates are counted and reported as skipped.
+            clock: Time source for TTL expiry.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.reuse_results = reuse_results
+        self.clock = clock
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._duplicate_counts: dict[str, int] = {}
+        self._in_flight: dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __getstate__(self) -> dict:
+        # Worker processes receive copies with a fresh lock
+        state = self.__dict__.copy()
+        del state["_lock"]
+        state["_in_flight"] = {}  # claims belong to this process
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def fingerprint(self, log_entry: dict) -> str:
+        """Compute the fingerprint of a log entry."""
+        return fingerprint(log_entry)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Look up the result stored for a fingerprint.
+
+        Args:
+            key: Fingerprint.
+
+        Returns:
+            The stored result if it has not expired, otherwise None.
+        """
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                self._duplicate_counts[key] = self._duplicate_counts.get(key, 0) + 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+                self._duplicate_counts.pop(key, None)
+            self.misses += 1
+            return None
+
+    def claim(self, key: str) -> tuple[bool, Future]:
+        """Mark a fingerprint whose ``get`` missed as being processed.
+
+        The first caller owns the fingerprint and must end its claim with
+        ``put`` or ``release``. Later callers get the owner's future, which
+        resolves to the stored result; they count as deduplicated.
+
+        Args:
+            key: Fingerprint.
+
+        Returns:
+            Tuple of (True if the caller owns the claim, future of the result).
+        """
+        with self._lock:
+            future = self._in_flight.get(key)
+            if future is None:
+                entry = self._entries.get(key)
+                if entry is None or entry[0] <= self.clock():
+                    future = self._in_flight[key] = Future()
+                    future.set_running_or_notify_cancel()  # waiters cannot cancel it
+                    return True, future
+                # Stored since the caller's get missed
+                future = Future()
+                future.set_result(entry[1])
+            self.misses -= 1
+            self.hits += 1
+            self._duplicate_counts[key] = self._duplicate_counts.get(key, 0) + 1
+            return False, future
+
+    def release(self, key: str, claim: Future, error: Optional[BaseException] = None) -> None:
+        """End a claim without storing a result.
+
+        Duplicates waiting on the claim receive ``error``. Does nothing if
+        the claim already ended.
+
+        Args:
+            key: Fingerprint.
+            claim: Future returned to the owner by ``claim``.
+            error: Why processing did not finish.
+        """
+        with self._lock:
+            if self._in_flight.get(key) is not claim:
+                return
+            del self._in_flight[key]
+        claim.set_exception(error or RuntimeError(f"Processing of fingerprint {key} was abandoned"))
+
+    def put(self, key: str, result: Any) -> None:
+        """Store the result for a fingerprint and end any claim on it.
+
+        Args:
+            key: Fingerprint.
+            result: Result to reuse for duplicates.
+        """
+        with self._lock:
+            self._entries[key] = (self.clock() + self.ttl_seconds, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                evicted, _ = self._entries.popitem(last=False)
+                self._duplicate_counts.pop(evicted, None)
+            claim = self._in_flight.pop(key, None)
+        if claim is not None:
+            claim.set_result(result)
+
+    def clear(self) -> None:
+        """Forget all fingerprints and reset counters; claims stay open."""
+        with self._lock:
+            self._entries.clear()
+            self._duplicate_counts.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """Return deduplication counters.
+
+        Returns:
+            Dictionary with seen, unique and deduplicated entry counts, the
+            number of cached fingerprints and the most repeated fingerprints.
+        """
+        with self._lock:
+            top = sorted(self._duplicate_counts.items(), key=lambda item: item[1], reverse=True)[:10]
+            seen = self.hits + self.misses
+            return {
+                "seen": seen,
+                "unique": self.misses,
+                "deduplicated": self.hits,
+                "dedup_ratio": self.hits / seen if seen else 0.0,
+                "cached": len(self._entries),
+                "top_duplicates": dict(top),
+            }
@@ -0,0 +1,186 @@
+"""In-memory index of validated genes for reuse lookups."""
+import bisect
+import sys
+import threading
+from typing import Any, Iterable, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.models import Gene
+
+# Context tag prefixes that record which target a gene solves and how
+TARGET_TAG_PREFIX = "target:"
+ACTION_TAG_PREFIX = "action:"
+
+GENE_FIELDS = (
+    "id",
+    "name",
+    "description",
+    "implementation",
+    "prompt_template",
+    "status",
+    "success_rate",
+    "context_tags",
+)
+
+
+def target_tag(target: str) -> str:
+    """Return the context tag marking a gene as solving target."""
+    # Interned: every gene and lookup for a target carries the same tag
+    return sys.intern(f"{TARGET_TAG_PREFIX}{target}")
+
+
+def action_tag(action: str) -> str:
+    """Return the context tag marking a gene as produced by an intent action."""
+    return sys.intern(f"{ACTION_TAG_PREFIX}{action}")
+
+
+def gene_target(context_tags: Iterable[str]) -> Optional[str]:
+    """Extract the target from a gene's context tags, if any."""
+    for tag in context_tags:
+        if tag.startswith(TARGET_TAG_PREFIX):
+            return tag[len(TARGET_TAG_PREFIX):]
+    return None
+
+
+class GeneIndex:
+    """Index of validated genes by target, ordered by success rate.
+
+    Genes declare their target with a ``target:<name>`` context tag. Each
+    target keeps its genes sorted by descending success rate, so a lookup
+    returns the best match after inspecting only the genes above the
+    requested rate that lack the requested tags.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._genes: dict[str, tuple[dict, frozenset[str], Optional[str]]] = {}
+        self._by_target: dict[str, list[tuple[float, str]]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._genes)
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def upsert(self, gene: Any) -> None:
+        """Add or refresh a gene.
+
+        Genes that are not validated or have no target tag are removed from
+        the index.
+
+        Args:
+            gene: Gene model instance or gene data dictionary.
+        """
+        data = self._as_dict(gene)
+        tags = frozenset(data.get("context_tags") or ())
+        target = gene_target(tags)
+
+        with self._lock:
+            self._discard(data["id"])
+            if data.get("status") != "validated" or target is None:
+                return
+            self._genes[data["id"]] = (data, tags, target)
+            entries = self._by_target.setdefault(target, [])
+            bisect.insort(entries, (-float(data.get("success_rate") or 0.0), data["id"]))
+
+    def remove(self, gene_id: str) -> None:
+        """Remove a gene from the index if present.
+
+        Args:
+            gene_id: ID of the gene.
+        """
+        with self._lock:
+            self._discard(gene_id)
+
+    def clear(self) -> None:
+        """Remove all genes."""
+        with self._lock:
+            self._genes.clear()
+            self._by_target.clear()
+
+    def lookup(
+        self,
+        target: Optional[str],
+        tags: Iterable[str] = (),
+        min_success_rate: float = 0.8,
+    ) -> Optional[dict]:
+        """Find the best validated gene for a target.
+
+        Args:
+            target: Target the gene must solve.
+            tags: Context tags the gene must carry.
+            min_success_rate: Minimum success rate to accept.
+
+        Returns:
+            Copy of the gene data with the highest success rate, or None.
+        """
+        if target is None:
+            return None
+        required = frozenset(tags)
+
+        with self._lock:
+            for neg_rate, gene_id in self._by_target.get(target, ()):
+                if -neg_rate < min_success_rate:
+                    break
+                data, gene_tags, _ = self._genes[gene_id]
+                if required <= gene_tags:
+                    return {**data, "context_tags": list(data["context_tags"])}
+        return None
+
+    async def load(self, session: AsyncSession) -> int:
+        """Rebuild the index from validated genes in the database.
+
+        Args:
+            session: Database session.
+
+        Returns:
+            Number of genes indexed.
+        """
+        result = await session.execute(
+            select(Gene)
+            .where(Gene.status == "validated")
+            .options(selectinload(Gene.implementation_blob), selectinload(Gene.prompt_blob))
+        )
+        genes = result.scalars().all()
+        self.clear()
+        for gene in genes:
+            self.upsert(gene)
+        return len(self)
+
+    def _discard(self, gene_id: str) -> None:
+        """Remove a gene; caller holds the lock."""
+        existing = self._genes.pop(gene_id, None)
+        if existing is None:
+            return
+        data, _, target = existing
+        entries = self._by_target[target]
+        key = (-float(data.get("success_rate") or 0.0), gene_id)
+        position = bisect.bisect_left(entries, key)
+        if position < len(entries) and entries[position] == key:
+            del entries[position]
+        if not entries:
+            del self._by_target[target]
+
+    @staticmethod
+    def _as_dict(gene: Any) -> dict:
+        """Convert a gene model or dictionary to plain gene data."""
+        if isinstance(gene, dict):
+            data = {field: gene.get(field) for field in GENE_FIELDS}
+        else:
+            data = {field: getattr(gene, field, None) for field in GENE_FIELDS}
+        data["context_tags"] = list(data["context_tags"] or [])
+        return data
+
+
+# Process-wide index kept in sync by the gene API
+gene_index = GeneIndex()
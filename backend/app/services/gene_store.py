@@ -0,0 +1,141 @@
+"""Bulk persistence of solidified genes."""
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import GENE_BLOB_FIELDS, Blob, Gene, insert_ignore
+from app.services.bloom import BloomFilter
+
+GENE_COLUMNS = (
+    "id",
+    "name",
+    "description",
+    "status",
+    "success_rate",
+    "context_tags",
+    "cost_profile",
+)
+
+
+class GeneWriter:
+    """Writes batches of solidified genes with one statement per batch.
+
+    Solidified genes are content addressed, so writing the same gene twice
+    is a no-op: each batch is one ``INSERT ... ON CONFLICT DO NOTHING``
+    for the distinct implementation and prompt blobs, one for the genes
+    (each split every ``max_rows`` rows) and one commit.
+    Gene IDs known to be stored are remembered in a Bloom filter and such
+    genes are dropped before they reach the database. A false positive
+    drops a new gene with probability about ``bloom.error_rate``.
+    """
+
+    def __init__(self, bloom: Optional[BloomFilter] = None, max_rows: int = 1000):
+        """Initialize writer.
+
+        Args:
+            bloom: Filter of stored gene IDs; a filter for one million
+                genes is created if None.
+            max_rows: Rows per INSERT statement, keeping bound parameters
+                under database limits.
+        """
+        if max_rows < 1:
+            raise ValueError("max_rows must be at least 1")
+
+        self.bloom = bloom if bloom is not None else BloomFilter()
+        self.max_rows = max_rows
+        self.written = 0
+        self.skipped = 0
+
+    async def load(self, session: AsyncSession) -> int:
+        """Seed the filter with the IDs of genes already stored.
+
+        Args:
+            session: Database session.
+
+        Returns:
+            Number of IDs added.
+        """
+        result = await session.execute(select(Gene.id))
+        ids = result.scalars().all()
+        self.bloom.update(ids)
+        return len(ids)
+
+    async def write_batch(self, session: AsyncSession, genes: list[dict]) -> list[str]:
+        """Insert solidified genes that are not stored yet.
+
+        Args:
+            session: Database session; committed after the insert.
+            genes: Gene data dictionaries from ``Solidifier.solidify``.
+
+        Returns:
+            IDs of the genes actually inserted.
+
+        Raises:
+            NotImplementedError: If the database dialect has no upsert support.
+        """
+        now = datetime.utcnow()
+        rows: dict[str, dict] = {}
+        blobs: dict[str, dict] = {}
+        for gene in genes:
+            if gene["id"] in rows or gene["id"] in self.bloom:
+                self.skipped += 1
+                continue
+            row = {column: gene.get(column) for column in GENE_COLUMNS}
+            row["context_tags"] = list(row["context_tags"] or [])
+            row["created_at"] = row["updated_at"] = now
+            for field, (hash_column, _) in GENE_BLOB_FIELDS.items():
+                text = gene.get(field)
+                row[hash_column] = None
+                if text is not None:
+                    row[hash_column] = Blob.hash_text(text)
+                    if row[hash_column] not in blobs:
+                        blobs[row[hash_column]] = Blob.encode(text)
+            rows[gene["id"]] = row
+        if not rows:
+            return []
+
+        dialect = session.bind.dialect.name
+        await self._insert(session, insert_ignore(dialect, Blob), list(blobs.values()))
+        inserted = await self._insert(
+            session,
+            insert_ignore(dialect, Gene).returning(Gene.id),
+            list(rows.values()),
+            returning=True,
+        )
+        await session.commit()
+
+        # Conflicting rows are stored too, under this ID or this name
+        self.bloom.update(rows)
+        self.written += len(inserted)
+        self.skipped += len(rows) - len(inserted)
+        return inserted
+
+    async def _insert(
+        self,
+        session: AsyncSession,
+        statement: Any,
+        values: list[dict],
+        returning: bool = False,
+    ) -> list:
+        """Execute an insert in chunks of ``max_rows``; collect RETURNING values."""
+        returned = []
+        for start in range(0, len(values), self.max_rows):
+            result = await session.execute(statement.values(values[start:start + self.max_rows]))
+            if returning:
+                returned.extend(result.scalars().all())
+        return returned
+
+    def stats(self) -> dict:
+        """Return write counters.
+
+        Returns:
+            Dictionary with genes written, genes skipped as duplicates and
+            IDs in the filter.
+        """
+        return {
+            "written": self.written,
+            "skipped": self.skipped,
+            "known": len(self.bloom),
+        }
@@ -1,6 +1,12 @@
 """GEP Loop orchestrator - main evolution loop."""
-from typing import Optional, Any
-from dataclasses import dataclass
+import asyncio
+import math
+import os
+import threading
+from time import perf_counter_ns
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, as_completed
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, Optional, Any, Union
+from dataclasses import dataclass, field
 
 from app.services.scanner import Scanner, ScanResult
 from app.services.signal import SignalGenerator, EvolutionSignal
@@ -8,9 +14,16 @@ from app.services.intent import IntentClassifier, Intent
 from app.services.mutator import Mutator, MutationResult
 from app.services.validator import Validator, ValidationResult
 from app.services.solidifier import Solidifier
+from app.services.dedup import Deduplicator
+from app.services.scheduler import SignalScheduler
+from app.services.coalescer import SignalCoalescer
+from app.services.gene_index import GeneIndex, action_tag
+from app.services.tournament import Tournament, Candidate
+from app.services.mutation_backend import BatchingMutator
+from app.services.metrics import LoopMetrics
 
 
-@dataclass
+@dataclass(slots=True)
 class LoopResult:
     """Result of processing a log through the GEP loop."""
     status: str  # success, failed, skipped
@@ -21,6 +34,115 @@ class LoopResult:
     validation: Optional[ValidationResult] = None
     gene_data: Optional[dict] = None
     error: Optional[str] = None
+    reused: bool = False  # gene_data came from the gene index
+    candidates: list[Candidate] = field(default_factory=list)  # tournament entrants
+    timings: dict[str, int] = field(default_factory=dict)  # nanoseconds per stage
+
+
+@dataclass
+class _PendingEntry:
+    """Entry that passed Scan and Signal and awaits the remaining stages."""
+    scan_result: ScanResult
+    signal: EvolutionSignal
+    fingerprint: Optional[str] = None
+    timings: dict[str, int] = field(default_factory=dict)
+    claim: Optional[Future] = None  # deduplicator claim on the fingerprint
+
+
+@dataclass
+class _InFlight:
+    """Duplicate of an entry whose processing has not finished yet."""
+    fingerprint: str
+    claim: Future  # resolves to the first entry's result
+    timings: dict[str, int] = field(default_factory=dict)
+
+
+# Stages of the pipeline run by ``GEPLoop.process_pipeline``, in order
+PIPELINE_STAGES = ("prepare", "intent", "mutate", "validate", "solidify")
+
+# Workers per pipeline stage unless overridden
+PIPELINE_CONCURRENCY = {"prepare": 1, "intent": 1, "mutate": 8, "validate": 4, "solidify": 1}
+
+# Marks the end of a pipeline queue
+_END = object()
+
+
+@dataclass
+class _PipelineJob:
+    """Log entry travelling through the pipeline stages."""
+    log_entry: dict
+    pending: Optional[_PendingEntry] = None
+    duplicate: Optional[_InFlight] = None
+    followers: list["_PipelineJob"] = field(default_factory=list)  # delivered with this job
+    intent: Optional[Intent] = None
+    mutations: list[MutationResult] = field(default_factory=list)
+    validated: Optional["_Validated"] = None
+    result: Optional[LoopResult] = None  # set once the entry needs no further stages
+    timings: dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class _Validated:
+    """Outcome of the Validate stage for one intent."""
+    mutation: MutationResult
+    validation: Optional[ValidationResult] = None
+    candidates: list[Candidate] = field(default_factory=list)
+    error: Optional[str] = None  # set if the entry fails before Solidify
+    elapsed_ns: int = 0
+
+
+def _validate_mutations(
+    validator: Validator,
+    tournament: Optional[Tournament],
+    mutations: list[MutationResult],
+) -> _Validated:
+    """Run the Validate stage for generated mutations.
+
+    A module-level function of picklable arguments, so the stage can run in
+    a process pool as long as the validator has no sandbox or cache.
+
+    Args:
+        validator: Validator for the mutations.
+        tournament: Optional tournament comparing all mutations; it uses
+            ``validator`` unless it has its own.
+        mutations: The mutation first, followed by any further tournament
+            candidates.
+
+    Returns:
+        The mutation to solidify with its validation, or an error.
+    """
+    start = perf_counter_ns()
+    outcome = _validate(validator, tournament, mutations)
+    outcome.elapsed_ns = perf_counter_ns() - start
+    return outcome
+
+
+def _validate(
+    validator: Validator,
+    tournament: Optional[Tournament],
+    mutations: list[MutationResult],
+) -> _Validated:
+    mutation = mutations[0]
+    if not mutation.success:
+        return _Validated(mutation, error="Mutation generation failed")
+
+    # Phase 5: Validate
+    if tournament is not None:
+        candidates = tournament.run(mutations, validator)
+        winner = tournament.best(candidates)
+        outcome = _Validated(winner.mutation, winner.validation, candidates)
+    elif mutation.code and mutation.tests:
+        outcome = _Validated(mutation, validator.validate_with_tests(mutation.code, mutation.tests))
+    elif mutation.code:
+        outcome = _Validated(mutation, validator.validate_code(mutation.code))
+    elif mutation.prompt:
+        outcome = _Validated(mutation, validator.validate_prompt(mutation.prompt))
+    else:
+        return _Validated(mutation, error="No code or prompt to validate")
+
+    if not outcome.validation.passed:
+        outcome.error = f"Validation failed: {outcome.validation.error}"
+    return outcome
 
 
 class GEPLoop:
@@ -37,6 +159,15 @@ class GEPLoop:
         mutator: Optional[Mutator] = None,
         validator: Optional[Validator] = None,
         solidifier: Optional[Solidifier] = None,
+        deduplicator: Optional[Deduplicator] = None,
+        scheduler: Optional[SignalScheduler] = None,
+        coalescer: Optional[SignalCoalescer] = None,
+        gene_index: Optional[GeneIndex] = None,
+        reuse_min_success_rate: float = 0.8,
+        tournament: Optional[Tournament] = None,
+        mutation_backend: Optional[BatchingMutator] = None,
+        metrics: Optional[LoopMetrics] = None,
+        compact: bool = False,
     ):
         """Initialize GEP loop with optional service overrides.
 
@@ -47,13 +178,48 @@ class GEPLoop:
             mutator: Mutation generation service.
             validator: Validation service.
             solidifier: Gene solidification service.
+            deduplicator: Optional fingerprint cache; repeated issues within
+                its TTL skip the remaining stages.
+            scheduler: Priority scheduler used by ``process_scheduled``.
+            coalescer: Signal coalescer used by ``process_coalesced``.
+            gene_index: Optional index of validated genes; a matching gene
+                for the intent's target is returned instead of mutating.
+            reuse_min_success_rate: Minimum success rate of a reused gene.
+            tournament: Optional tournament; when set, the mutator generates
+                ``tournament.size`` candidates, all are validated together
+                (with ``validator`` unless the tournament has its own) and
+                the fittest is solidified.
+            mutation_backend: Async mutation source used by ``process_async``
+                and ``process_batch_async``; defaults to the template
+                mutator behind a BatchingMutator.
+            metrics: Stage latency histograms and status counters fed by
+                every processing mode; see ``stats``.
+            compact: Default to a compact scanner and signal generator, whose
+                results share immutable patterns and contexts and drop
+                ``raw_log``; for holding the results of large batches.
         """
-        self.scanner = scanner or Scanner()
-        self.signal_generator = signal_generator or SignalGenerator()
+        self.scanner = scanner or Scanner(compact=compact, keep_raw_log=not compact)
+        self.signal_generator = signal_generator or SignalGenerator(compact=compact)
         self.intent_classifier = intent_classifier or IntentClassifier()
         self.mutator = mutator or Mutator()
         self.validator = validator or Validator()
         self.solidifier = solidifier or Solidifier()
+        self.deduplicator = deduplicator
+        self.scheduler = scheduler if scheduler is not None else SignalScheduler()
+        self.coalescer = coalescer or SignalCoalescer()
+        self.gene_index = gene_index
+        self.reuse_min_success_rate = reuse_min_success_rate
+        self.tournament = tournament
+        self.mutation_backend = mutation_backend
+        self.metrics = metrics or LoopMetrics()
+
+    def __getstate__(self) -> dict:
+        # Copies for worker processes carry only what ``process`` uses
+        state = self.__dict__.copy()
+        state["scheduler"] = None
+        state["coalescer"] = None
+        state["mutation_backend"] = None
+        return state
 
     def process(self, log_entry: dict) -> LoopResult:
         """Process a log entry through the full GEP loop.
@@ -64,96 +230,314 @@ class GEPLoop:
         Returns:
             LoopResult with the outcome of processing.
         """
+        timings: dict[str, int] = {}
         try:
-            # Phase 1: Scan
-            scan_result = self.scanner.scan(log_entry)
-            if not scan_result.has_issue:
-                return LoopResult(
-                    status="skipped",
-                    scan_result=scan_result,
-                    error="No issue detected in log entry",
-                )
+            prepared = self._prepare(log_entry, timings)
+            if isinstance(prepared, LoopResult):
+                result = prepared
+            else:
+                result = self._finish(prepared)
 
-            # Phase 2: Signal
-            signal = self.signal_generator.generate(scan_result)
-            if signal.signal_type == "none":
-                return LoopResult(
-                    status="skipped",
-                    scan_result=scan_result,
-                    signal=signal,
-                    error="No evolution signal generated",
-                )
+        except Exception as e:
+            result = self._exception_result(e)
+        return self._observe(result, timings)
 
-            # Phase 3: Intent
-            intent = self.intent_classifier.classify(signal)
-
-            # Phase 4: Mutate
-            mutation = self.mutator.mutate(intent)
-            if not mutation.success:
-                return LoopResult(
-                    status="failed",
-                    scan_result=scan_result,
-                    signal=signal,
-                    intent=intent,
-                    mutation=mutation,
-                    error="Mutation generation failed",
-                )
+    def stats(self) -> dict:
+        """Return a snapshot of the loop's metrics.
 
-            # Phase 5: Validate
-            if mutation.code:
-                validation = self.validator.validate_code(mutation.code)
-            elif mutation.prompt:
-                validation = self.validator.validate_prompt(mutation.prompt)
-            else:
-                return LoopResult(
-                    status="failed",
-                    scan_result=scan_result,
-                    signal=signal,
-                    intent=intent,
-                    mutation=mutation,
-                    error="No code or prompt to validate",
-                )
+        Returns:
+            Dictionary with ``statuses`` (results per status) and ``stages``
+            (latency summary per stage, in nanoseconds).
+        """
+        return self.metrics.snapshot()
 
-            if not validation.passed:
-                return LoopResult(
-                    status="failed",
-                    scan_result=scan_result,
-                    signal=signal,
-                    intent=intent,
-                    mutation=mutation,
-                    validation=validation,
-                    error=f"Validation failed: {validation.error}",
-                )
+    def _observe(self, result: LoopResult, timings: dict[str, int]) -> LoopResult:
+        """Record an entry's outcome and attach its stage timings.
 
-            # Phase 6: Solidify
-            gene_data = self.solidifier.solidify(mutation, validation)
-            if not gene_data:
-                return LoopResult(
-                    status="failed",
-                    scan_result=scan_result,
-                    signal=signal,
-                    intent=intent,
-                    mutation=mutation,
-                    validation=validation,
-                    error="Failed to solidify gene",
-                )
+        Results shared with earlier entries, such as deduplicated or
+        coalesced ones, keep the timings of the entry that produced them.
+        """
+        if not result.timings:
+            result.timings = timings
+        self.metrics.record(result.status, timings)
+        return result
+
+    def _prepare(
+        self,
+        log_entry: dict,
+        timings: dict[str, int],
+    ) -> Union[LoopResult, _PendingEntry, _InFlight]:
+        """Run the Scan and Signal stages for a log entry.
+
+        An entry that passes both claims its fingerprint in the
+        deduplicator, so copies arriving while it is processed wait for its
+        result rather than running the remaining stages again.
+
+        Args:
+            log_entry: Log entry to process.
+            timings: Stage timings of the entry, updated in place.
+
+        Returns:
+            A final LoopResult if the entry needs no further stages (no issue,
+            duplicate, or no signal), an _InFlight if a copy is still being
+            processed, otherwise the pending entry.
+        """
+        # Phase 1: Scan
+        start = perf_counter_ns()
+        scan_result = self.scanner.scan(log_entry)
+        timings["scan"] = perf_counter_ns() - start
+        if not scan_result.has_issue:
+            return LoopResult(
+                status="skipped",
+                scan_result=scan_result,
+                error="No issue detected in log entry",
+            )
+
+        # Repeated issues reuse the earlier outcome
+        fingerprint = None
+        if self.deduplicator is not None:
+            fingerprint = self.deduplicator.fingerprint(log_entry)
+            cached = self.deduplicator.get(fingerprint)
+            if cached is not None:
+                if self.deduplicator.reuse_results:
+                    return cached
+                return self._duplicate_result(scan_result, fingerprint)
+
+        # Phase 2: Signal
+        start = perf_counter_ns()
+        signal = self.signal_generator.generate(scan_result)
+        timings["signal"] = perf_counter_ns() - start
+        if signal.signal_type == "none":
+            return LoopResult(
+                status="skipped",
+                scan_result=scan_result,
+                signal=signal,
+                error="No evolution signal generated",
+            )
 
+        claim = None
+        if fingerprint is not None:
+            owner, claim = self.deduplicator.claim(fingerprint)
+            if not owner:
+                if self.deduplicator.reuse_results:
+                    return _InFlight(fingerprint, claim, timings)
+                return self._duplicate_result(scan_result, fingerprint)
+
+        return _PendingEntry(
+            scan_result=scan_result, signal=signal, fingerprint=fingerprint, timings=timings, claim=claim
+        )
+
+    def _finish(self, pending: Union[_PendingEntry, _InFlight]) -> LoopResult:
+        """Run the remaining stages for a pending entry and record duplicates.
+
+        Args:
+            pending: Entry that passed Scan and Signal, or a copy of an entry
+                in flight, whose result is awaited.
+
+        Returns:
+            LoopResult with the outcome of processing.
+        """
+        if isinstance(pending, _InFlight):
+            return pending.claim.result()
+        try:
+            result = self._execute(pending.scan_result, pending.signal, pending.timings)
+        except BaseException as e:
+            self._release(pending, e)
+            raise
+        if pending.fingerprint is not None:
+            self.deduplicator.put(pending.fingerprint, result)
+        return result
+
+    def _release(self, pending: Optional[_PendingEntry], error: Optional[BaseException] = None) -> None:
+        """End a pending entry's fingerprint claim if it is still open."""
+        if pending is not None and pending.claim is not None:
+            self.deduplicator.release(pending.fingerprint, pending.claim, error)
+
+    @staticmethod
+    def _duplicate_result(scan_result: ScanResult, fingerprint: str) -> LoopResult:
+        """Build the skipped result for a duplicate that is not reused."""
+        return LoopResult(
+            status="skipped",
+            scan_result=scan_result,
+            error=f"Duplicate of fingerprint {fingerprint}",
+        )
+
+    @staticmethod
+    def _exception_result(e: Exception) -> LoopResult:
+        """Build the failed result for an unexpected exception."""
+        return LoopResult(
+            status="failed",
+            error=f"Exception in GEP loop: {type(e).__name__}: {e}",
+        )
+
+    def _execute(
+        self,
+        scan_result: ScanResult,
+        signal: EvolutionSignal,
+        timings: dict[str, int],
+    ) -> LoopResult:
+        """Run the Intent → Mutate → Validate → Solidify stages for a signal.
+
+        Args:
+            scan_result: Scan result the signal was generated from.
+            signal: Evolution signal to act on.
+            timings: Stage timings of the entry, updated in place.
+
+        Returns:
+            LoopResult with the outcome of processing.
+        """
+        # Phase 3: Intent
+        start = perf_counter_ns()
+        intent = self.intent_classifier.classify(signal)
+        reused = self._reuse(scan_result, signal, intent)
+        end = perf_counter_ns()
+        timings["intent"] = end - start
+        if reused is not None:
+            return reused
+
+        # Phase 4: Mutate
+        start = end
+        if self.tournament is not None:
+            mutations = self.mutator.mutate_candidates(intent, self.tournament.size)
+        else:
+            mutations = [self.mutator.mutate(intent)]
+        end = perf_counter_ns()
+        timings["mutate"] = end - start
+        return self._complete(scan_result, signal, intent, mutations, timings, end)
+
+    def _reuse(
+        self,
+        scan_result: ScanResult,
+        signal: EvolutionSignal,
+        intent: Intent,
+    ) -> Optional[LoopResult]:
+        """Inherit a validated gene for the intent instead of recomputing one.
+
+        Only genes produced by the same action, carrying what the mutator
+        would produce for the intent (code or a prompt), are inherited.
+        Intents without a known target never reuse a gene, since one gene
+        would otherwise serve every unclassified signal.
+
+        Returns:
+            A successful LoopResult with the indexed gene, or None.
+        """
+        if self.gene_index is None or intent.target in (None, "unknown"):
+            return None
+        tags = [action_tag(intent.action)]
+        kind = self.mutator.output_kind(intent)
+        if kind is not None:
+            tags.append(kind)
+        gene_data = self.gene_index.lookup(
+            intent.target, tags, min_success_rate=self.reuse_min_success_rate
+        )
+        if gene_data is None:
+            return None
+        return LoopResult(
+            status="success",
+            scan_result=scan_result,
+            signal=signal,
+            intent=intent,
+            gene_data=gene_data,
+            reused=True,
+        )
+
+    def _complete(
+        self,
+        scan_result: ScanResult,
+        signal: EvolutionSignal,
+        intent: Intent,
+        mutations: list[MutationResult],
+        timings: dict[str, int],
+        start: Optional[int] = None,
+    ) -> LoopResult:
+        """Run the Validate and Solidify stages for generated mutations.
+
+        Args:
+            scan_result: Scan result the signal was generated from.
+            signal: Evolution signal being acted on.
+            intent: Intent the mutations were generated for.
+            mutations: The mutation first, followed by any further
+                tournament candidates.
+            timings: Stage timings of the entry, updated in place.
+            start: ``perf_counter_ns`` reading at the end of the previous
+                stage, so each boundary costs one clock read.
+
+        Returns:
+            LoopResult with the outcome of processing.
+        """
+        if start is None:
+            start = perf_counter_ns()
+        outcome = _validate(self.validator, self.tournament, mutations)
+        end = perf_counter_ns()
+        timings["validate"] = end - start
+        return self._solidify(scan_result, signal, intent, outcome, timings, end)
+
+    def _solidify(
+        self,
+        scan_result: ScanResult,
+        signal: EvolutionSignal,
+        intent: Intent,
+        outcome: "_Validated",
+        timings: dict[str, int],
+        start: Optional[int] = None,
+    ) -> LoopResult:
+        """Run the Solidify stage for a validated mutation.
+
+        Args:
+            scan_result: Scan result the signal was generated from.
+            signal: Evolution signal being acted on.
+            intent: Intent the mutation was generated for.
+            outcome: Result of the Validate stage.
+            timings: Stage timings of the entry, updated in place.
+            start: ``perf_counter_ns`` reading at the end of Validate, if
+                it ran in this thread just before.
+
+        Returns:
+            LoopResult with the outcome of processing.
+        """
+        mutation, validation, candidates = outcome.mutation, outcome.validation, outcome.candidates
+        if outcome.error is not None:
             return LoopResult(
-                status="success",
+                status="failed",
                 scan_result=scan_result,
                 signal=signal,
                 intent=intent,
                 mutation=mutation,
                 validation=validation,
-                gene_data=gene_data,
+                error=outcome.error,
+                candidates=candidates,
             )
 
-        except Exception as e:
+        # Phase 6: Solidify
+        if start is None:
+            start = perf_counter_ns()
+        gene_data = self.solidifier.solidify(mutation, validation)
+        if gene_data and self.gene_index is not None:
+            self.gene_index.upsert(gene_data)
+        timings["solidify"] = perf_counter_ns() - start
+        if not gene_data:
             return LoopResult(
                 status="failed",
-                error=f"Exception in GEP loop: {type(e).__name__}: {e}",
+                scan_result=scan_result,
+                signal=signal,
+                intent=intent,
+                mutation=mutation,
+                validation=validation,
+                error="Failed to solidify gene",
+                candidates=candidates,
             )
 
+        return LoopResult(
+            status="success",
+            scan_result=scan_result,
+            signal=signal,
+            intent=intent,
+            mutation=mutation,
+            validation=validation,
+            gene_data=gene_data,
+            candidates=candidates,
+        )
+
     def process_batch(self, log_entries: list[dict]) -> list[LoopResult]:
         """Process multiple log entries.
 
@@ -163,4 +547,575 @@ class GEPLoop:
         Returns:
             List of LoopResults for each entry.
         """
-        return [self.process(entry) for entry in log_entries]
+        return list(self.iter_process(log_entries))
+
+    def iter_process(
+        self,
+        log_entries: Iterable[dict],
+        statuses: Optional[Iterable[str]] = None,
+    ) -> Iterator[LoopResult]:
+        """Process log entries lazily, one at a time.
+
+        Each entry is pulled from the iterable only when the previous
+        result has been consumed, so unbounded input such as a file or a
+        pipe is processed in constant memory.
+
+        Args:
+            log_entries: Iterable of log entries.
+            statuses: Only yield results with these statuses, e.g.
+                ``{"success", "failed"}`` to drop skipped entries; all if
+                None. Filtered results are still recorded in ``stats``.
+
+        Yields:
+            LoopResult for each (matching) entry, in input order.
+        """
+        if statuses is None:
+            for entry in log_entries:
+                yield self.process(entry)
+            return
+
+        wanted = frozenset(statuses)
+        for entry in log_entries:
+            result = self.process(entry)
+            if result.status in wanted:
+                yield result
+
+    async def process_async(self, log_entry: dict) -> LoopResult:
+        """Process a log entry, awaiting the mutation backend.
+
+        Scan, Signal and Intent run on the event loop; the mutation is
+        awaited from ``self.mutation_backend``, so many entries can wait on
+        a slow generator at once. Validate and Solidify run in the default
+        executor.
+
+        Args:
+            log_entry: Log entry to process.
+
+        Returns:
+            LoopResult with the outcome of processing.
+        """
+        timings: dict[str, int] = {}
+        prepared = None
+        try:
+            prepared = self._prepare(log_entry, timings)
+            if isinstance(prepared, LoopResult):
+                return self._observe(prepared, timings)
+            if isinstance(prepared, _InFlight):
+                return self._observe(await asyncio.wrap_future(prepared.claim), timings)
+
+            start = perf_counter_ns()
+            intent = self.intent_classifier.classify(prepared.signal)
+            result = self._reuse(prepared.scan_result, prepared.signal, intent)
+            timings["intent"] = perf_counter_ns() - start
+            if result is None:
+                if self.mutation_backend is None:
+                    self.mutation_backend = BatchingMutator()
+                start = perf_counter_ns()
+                mutation = await self.mutation_backend.mutate(intent)
+                timings["mutate"] = perf_counter_ns() - start
+                result = await asyncio.get_running_loop().run_in_executor(
+                    None, self._complete,
+                    prepared.scan_result, prepared.signal, intent, [mutation], timings,
+                )
+
+            if prepared.fingerprint is not None:
+                self.deduplicator.put(prepared.fingerprint, result)
+
+        except Exception as e:
+            result = self._exception_result(e)
+            if isinstance(prepared, _PendingEntry):
+                self._release(prepared, e)
+        finally:
+            # Also ends the claim if the task is cancelled
+            if isinstance(prepared, _PendingEntry):
+                self._release(prepared)
+        return self._observe(result, timings)
+
+    async def process_batch_async(self, log_entries: list[dict]) -> list[LoopResult]:
+        """Process log entries concurrently, awaiting mutations together.
+
+        Args:
+            log_entries: List of log entries to process.
+
+        Returns:
+            List of LoopResults for each entry, in input order.
+        """
+        return list(await asyncio.gather(*(self.process_async(entry) for entry in log_entries)))
+
+    def process_scheduled(self, log_entries: Iterable[dict], workers: int = 4) -> list[LoopResult]:
+        """Process log entries with signals served by priority.
+
+        Scan and Signal run on the calling thread in arrival order. Signals
+        are then queued in ``self.scheduler`` and the Intent → Solidify
+        stages run on ``workers`` threads, highest (aged) priority first.
+        The calling thread blocks while the scheduler is full. Copies of an
+        entry still in flight are not scheduled; they receive its result.
+
+        Args:
+            log_entries: Log entries to process.
+            workers: Number of worker threads for the post-signal stages.
+
+        Returns:
+            List of LoopResults in input order.
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+
+        results: dict[int, LoopResult] = {}
+        in_flight: list[tuple[int, _InFlight]] = []
+        scheduler = self.scheduler
+        scheduler.reopen()
+
+        def work() -> None:
+            while (job := scheduler.get()) is not None:
+                index, pending = job
+                try:
+                    result = self._finish(pending)
+                except Exception as e:
+                    result = self._exception_result(e)
+                results[index] = self._observe(result, pending.timings)
+
+        threads = [threading.Thread(target=work, daemon=True) for _ in range(workers)]
+        for thread in threads:
+            thread.start()
+
+        count = 0
+        try:
+            for index, log_entry in enumerate(log_entries):
+                count = index + 1
+                timings: dict[str, int] = {}
+                try:
+                    prepared = self._prepare(log_entry, timings)
+                except Exception as e:
+                    prepared = self._exception_result(e)
+                if isinstance(prepared, LoopResult):
+                    results[index] = self._observe(prepared, timings)
+                elif isinstance(prepared, _InFlight):
+                    in_flight.append((index, prepared))
+                else:
+                    scheduler.put(prepared.signal, (index, prepared))
+        finally:
+            scheduler.close()
+            for thread in threads:
+                thread.join()
+
+        self._collect_in_flight(in_flight, results)
+        return [results[index] for index in range(count)]
+
+    def process_coalesced(self, log_entries: Iterable[dict]) -> list[LoopResult]:
+        """Process log entries, running later stages once per distinct problem.
+
+        Signals that share type, patterns and source within the coalescer's
+        window are merged; Intent → Solidify runs once for the merged signal
+        and every entry in the group receives that same LoopResult. Windows
+        still open at the end of the input are flushed. Copies of an entry
+        already in a window receive its result.
+
+        Args:
+            log_entries: Log entries to process.
+
+        Returns:
+            List of LoopResults in input order.
+        """
+        results: dict[int, LoopResult] = {}
+        in_flight: list[tuple[int, _InFlight]] = []
+
+        def run(ready: list[tuple[EvolutionSignal, list]]) -> None:
+            for signal, members in ready:
+                first = members[0][1]
+                try:
+                    result = self._execute(first.scan_result, signal, first.timings)
+                except Exception as e:
+                    result = self._exception_result(e)
+                for index, pending in members:
+                    results[index] = self._observe(result, pending.timings)
+                    if pending.fingerprint is not None:
+                        self.deduplicator.put(pending.fingerprint, result)
+
+        count = 0
+        for index, log_entry in enumerate(log_entries):
+            count = index + 1
+            timings: dict[str, int] = {}
+            try:
+                prepared = self._prepare(log_entry, timings)
+            except Exception as e:
+                prepared = self._exception_result(e)
+            if isinstance(prepared, LoopResult):
+                results[index] = self._observe(prepared, timings)
+            elif isinstance(prepared, _InFlight):
+                in_flight.append((index, prepared))
+            else:
+                run(self.coalescer.add(prepared.signal, (index, prepared)))
+        run(self.coalescer.flush())
+
+        self._collect_in_flight(in_flight, results)
+        return [results[index] for index in range(count)]
+
+    def _collect_in_flight(
+        self,
+        in_flight: list[tuple[int, _InFlight]],
+        results: dict[int, LoopResult],
+    ) -> None:
+        """Wait for the results of copies of in-flight entries, by input index."""
+        for index, duplicate in in_flight:
+            try:
+                result = duplicate.claim.result()
+            except Exception as e:
+                result = self._exception_result(e)
+            results[index] = self._observe(result, duplicate.timings)
+
+    async def process_stream(
+        self,
+        log_entries: AsyncIterable[dict],
+        max_in_flight: int = 32,
+        executor: Optional[Executor] = None,
+    ) -> AsyncIterator[LoopResult]:
+        """Process log entries from an async source as they arrive.
+
+        Entries are pulled from the source only while fewer than
+        ``max_in_flight`` are being processed, so memory stays bounded no
+        matter how long the stream is. Each entry runs through ``process``
+        in the executor; results are yielded in completion order.
+
+        Args:
+            log_entries: Async iterable of log entries.
+            max_in_flight: Maximum number of entries processed concurrently.
+            executor: Executor for ``process`` calls; defaults to the event
+                loop's default thread pool.
+
+        Yields:
+            LoopResult for each entry, as soon as it finishes.
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+
+        loop = asyncio.get_running_loop()
+        pending: set[asyncio.Future] = set()
+        try:
+            async for entry in log_entries:
+                pending.add(loop.run_in_executor(executor, self.process, entry))
+                if len(pending) < max_in_flight:
+                    continue
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    yield future.result()
+
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    yield future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def process_pipeline(
+        self,
+        log_entries: Union[Iterable[dict], AsyncIterable[dict]],
+        concurrency: Optional[dict[str, int]] = None,
+        executors: Optional[dict[str, Executor]] = None,
+        queue_size: int = 16,
+    ) -> AsyncIterator[LoopResult]:
+        """Process log entries through a pipeline of concurrent stages.
+
+        Each of ``PIPELINE_STAGES`` is a group of workers reading from a
+        bounded queue and writing to the next one, so a slow Validate stage
+        no longer leaves Scan, Intent and Mutate idle. When a queue is full
+        its producers wait, and the wait travels back to the source, which
+        is only pulled while the first queue has room.
+
+        Validate runs in the event loop's default thread pool unless an
+        executor is given; the other stages run on the event loop unless
+        given one. Only Validate may use a ProcessPoolExecutor, since the
+        other stages update the deduplicator and gene index; the validator
+        and tournament must then be picklable. Mutate awaits
+        ``self.mutation_backend`` when it is set. Results and statuses are
+        those of ``process``, yielded in completion order. A copy of an
+        entry still in the pipeline skips the stages and is yielded right
+        after it.
+
+        Args:
+            log_entries: Iterable or async iterable of log entries.
+            concurrency: Workers per stage, overriding
+                ``PIPELINE_CONCURRENCY``.
+            executors: Executor per stage.
+            queue_size: Capacity of each queue between stages.
+
+        Yields:
+            LoopResult for each entry, as soon as it finishes.
+
+        Raises:
+            ValueError: If a stage name, worker count or executor is invalid.
+        """
+        concurrency = {**PIPELINE_CONCURRENCY, **(concurrency or {})}
+        executors = executors or {}
+        for name in set(concurrency) | set(executors):
+            if name not in PIPELINE_STAGES:
+                raise ValueError(f"Unknown pipeline stage: {name}")
+        for name, workers in concurrency.items():
+            if workers < 1:
+                raise ValueError(f"Concurrency of stage {name} must be at least 1")
+        for name, executor in executors.items():
+            if isinstance(executor, ProcessPoolExecutor) and name != "validate":
+                raise ValueError(f"Stage {name} cannot run in a process pool")
+        if queue_size < 1:
+            raise ValueError("queue_size must be at least 1")
+
+        queues = [asyncio.Queue(queue_size) for _ in range(len(PIPELINE_STAGES) + 1)]
+        leaders: dict[str, _PipelineJob] = {}  # jobs holding a fingerprint claim
+
+        async def feed() -> None:
+            try:
+                if isinstance(log_entries, AsyncIterable):
+                    async for entry in log_entries:
+                        await queues[0].put(_PipelineJob(entry))
+                else:
+                    for entry in log_entries:
+                        await queues[0].put(_PipelineJob(entry))
+            finally:
+                await queues[0].put(_END)
+
+        async def work(name: str, inbox: asyncio.Queue, outbox: asyncio.Queue) -> None:
+            while (job := await inbox.get()) is not _END:
+                if job.result is None:
+                    try:
+                        await self._run_stage(name, job, executors.get(name))
+                    except Exception as e:
+                        job.result = self._exception_result(e)
+                        self._release(job.pending, e)
+                if job.duplicate is not None and job.result is None:
+                    leader = leaders.get(job.duplicate.fingerprint)
+                    if leader is not None:
+                        leader.followers.append(job)
+                        continue
+                    # The first copy is being processed outside this pipeline
+                    try:
+                        job.result = await asyncio.wrap_future(job.duplicate.claim)
+                    except Exception as e:
+                        job.result = self._exception_result(e)
+                elif name == "prepare" and job.pending is not None and job.pending.claim is not None:
+                    leaders[job.pending.fingerprint] = job
+                await outbox.put(job)
+            # Let the stage's other workers see the end too
+            await inbox.put(_END)
+
+        async def stage(index: int, name: str) -> None:
+            inbox, outbox = queues[index], queues[index + 1]
+            await asyncio.gather(*(work(name, inbox, outbox) for _ in range(concurrency[name])))
+            await outbox.put(_END)
+
+        feeder = asyncio.create_task(feed())
+        stages = [asyncio.create_task(stage(i, name)) for i, name in enumerate(PIPELINE_STAGES)]
+        try:
+            while (job := await queues[-1].get()) is not _END:
+                yield self._observe(job.result, job.timings)
+                if job.pending is not None and leaders.get(job.pending.fingerprint) is job:
+                    del leaders[job.pending.fingerprint]
+                for follower in job.followers:
+                    yield self._observe(job.result, follower.timings)
+            await feeder
+        finally:
+            for task in (feeder, *stages):
+                task.cancel()
+            for job in leaders.values():
+                self._release(job.pending)
+
+    async def _run_stage(self, name: str, job: _PipelineJob, executor: Optional[Executor]) -> None:
+        """Run one pipeline stage for a job, setting its result when final."""
+        loop = asyncio.get_running_loop()
+
+        if name == "prepare":
+            prepared = self._prepare(job.log_entry, job.timings)
+            if isinstance(prepared, LoopResult):
+                job.result = prepared
+            elif isinstance(prepared, _InFlight):
+                job.duplicate = prepared
+            else:
+                job.pending = prepared
+
+        elif name == "intent":
+            pending = job.pending
+            start = perf_counter_ns()
+            job.intent = self.intent_classifier.classify(pending.signal)
+            reused = self._reuse(pending.scan_result, pending.signal, job.intent)
+            job.timings["intent"] = perf_counter_ns() - start
+            if reused is not None:
+                self._settle(job, reused)
+
+        elif name == "mutate":
+            start = perf_counter_ns()
+            if self.mutation_backend is not None:
+                job.mutations = [await self.mutation_backend.mutate(job.intent)]
+            elif self.tournament is not None:
+                job.mutations = await self._call(
+                    executor, self.mutator.mutate_candidates, job.intent, self.tournament.size
+                )
+            else:
+                job.mutations = [await self._call(executor, self.mutator.mutate, job.intent)]
+            job.timings["mutate"] = perf_counter_ns() - start
+
+        elif name == "validate":
+            job.validated = await loop.run_in_executor(
+                executor, _validate_mutations, self.validator, self.tournament, job.mutations
+            )
+            job.timings["validate"] = job.validated.elapsed_ns
+
+        else:
+            pending = job.pending
+            result = await self._call(
+                executor, self._solidify,
+                pending.scan_result, pending.signal, job.intent, job.validated, job.timings,
+            )
+            self._settle(job, result)
+
+    @staticmethod
+    async def _call(executor: Optional[Executor], func: Any, *args: Any) -> Any:
+        """Call func on the event loop, or in executor if one is given."""
+        if executor is None:
+            return func(*args)
+        return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
+
+    def _settle(self, job: _PipelineJob, result: LoopResult) -> None:
+        """Set a pipeline job's final result and record duplicates."""
+        job.result = result
+        if job.pending.fingerprint is not None:
+            self.deduplicator.put(job.pending.fingerprint, result)
+
+    def process_batch_parallel(
+        self,
+        log_entries: Iterable[dict],
+        workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+    ) -> list[LoopResult]:
+        """Process log entries across worker processes.
+
+        Args:
+            log_entries: Log entries to process.
+            workers: Number of worker processes; defaults to the CPU count.
+            chunk_size: Entries sent to a worker per task; see
+                ``iter_parallel``.
+
+        Returns:
+            List of LoopResults in input order.
+        """
+        return [result for _, result in self.iter_parallel(log_entries, workers, chunk_size)]
+
+    def iter_parallel(
+        self,
+        log_entries: Iterable[dict],
+        workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        ordered: bool = True,
+    ) -> Iterator[tuple[int, LoopResult]]:
+        """Process log entries across worker processes, yielding as they finish.
+
+        Entries are sent to a ProcessPoolExecutor in chunks, so the cost of
+        pickling and IPC is paid per chunk rather than per entry. The
+        default chunk size gives each worker about four chunks, which keeps
+        the workers evenly loaded. Each worker runs ``process`` on a copy
+        of this loop made when the pool starts, so the stage services must
+        be picklable; the deduplicator and gene index are copied as they
+        are at that moment. Fingerprints and genes produced by the workers
+        are recorded in this loop's deduplicator and gene index as their
+        chunks arrive. Gene names derive from content hashes, so workers
+        never produce colliding names.
+
+        Args:
+            log_entries: Log entries to process.
+            workers: Number of worker processes; defaults to the CPU count.
+            chunk_size: Entries sent to a worker per task.
+            ordered: Yield in input order; if False, yield each chunk as
+                soon as it finishes.
+
+        Yields:
+            Tuples of input index and LoopResult.
+
+        Raises:
+            ValueError: If workers or chunk_size is less than 1.
+        """
+        entries = list(log_entries)
+        workers = workers or os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if chunk_size is None:
+            chunk_size = max(1, math.ceil(len(entries) / (workers * 4)))
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        if not entries:
+            return
+
+        pool = ProcessPoolExecutor(
+            max_workers=min(workers, math.ceil(len(entries) / chunk_size)),
+            initializer=_init_worker,
+            initargs=(self,),
+        )
+        try:
+            futures = {}
+            for start in range(0, len(entries), chunk_size):
+                chunk = entries[start:start + chunk_size]
+                futures[pool.submit(_process_chunk, chunk)] = (start, len(chunk))
+            for future in (futures if ordered else as_completed(futures)):
+                start, size = futures[future]
+                for offset, result in enumerate(self._collect_chunk(future, size)):
+                    yield start + offset, result
+        finally:
+            pool.shutdown(cancel_futures=True)
+
+    def _collect_chunk(self, future: Any, size: int) -> list[LoopResult]:
+        """Record a finished chunk's fingerprints, genes and metrics and return its results."""
+        try:
+            outcomes, metrics = future.result()
+        except Exception as e:
+            # A crashed worker fails only the entries of its chunk
+            return [self._observe(self._exception_result(e), {}) for _ in range(size)]
+
+        self.metrics.merge(metrics)
+        results = []
+        for result, fingerprint in outcomes:
+            if fingerprint is not None:
+                self.deduplicator.put(fingerprint, result)
+            if self.gene_index is not None and result.gene_data and not result.reused:
+                self.gene_index.upsert(result.gene_data)
+            results.append(result)
+        return results
+
+
+# Copy of the loop in a worker process of ``GEPLoop.iter_parallel``
+_worker_loop: Optional[GEPLoop] = None
+
+
+def _init_worker(loop: GEPLoop) -> None:
+    """Install the loop copy of a worker process."""
+    global _worker_loop
+    _worker_loop = loop
+
+
+def _process_chunk(
+    entries: list[dict],
+) -> tuple[list[tuple[LoopResult, Optional[str]]], LoopMetrics]:
+    """Process a chunk in a worker process.
+
+    Returns:
+        Tuples of result and the fingerprint to record for it, if any, and
+        the metrics recorded for the chunk.
+    """
+    loop = _worker_loop
+    loop.metrics.reset()
+    outcomes = []
+    for entry in entries:
+        fingerprint = None
+        timings: dict[str, int] = {}
+        try:
+            prepared = loop._prepare(entry, timings)
+            if isinstance(prepared, LoopResult):
+                result = prepared
+            else:
+                result = loop._finish(prepared)
+                fingerprint = prepared.fingerprint
+        except Exception as e:
+            result = loop._exception_result(e)
+        outcomes.append((loop._observe(result, timings), fingerprint))
+    return outcomes, loop.metrics
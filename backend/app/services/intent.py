@@ -1,11 +1,12 @@
 """Intent classification service."""
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 
 from app.services.signal import EvolutionSignal
 
 
-@dataclass
+@dataclass(slots=True)
 class Intent:
     """Classified intent for evolution action."""
     action: str  # fix, optimize, innovate, explore
@@ -33,6 +34,24 @@ class IntentClassifier:
         "NotFoundError": "resource_lookup",
     }
 
+    def __init__(self, cache_size: int = 1024):
+        """Initialize classifier.
+
+        Args:
+            cache_size: Maximum number of memoized classifications.
+        """
+        self._resolve = lru_cache(maxsize=cache_size)(self._resolve_uncached)
+
+    def __getstate__(self) -> dict:
+        # The memo is rebuilt empty in copies sent to worker processes
+        state = self.__dict__.copy()
+        state["_resolve"] = self._resolve.cache_info().maxsize
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._resolve = lru_cache(maxsize=state["_resolve"])(self._resolve_uncached)
+
     def classify(self, signal: EvolutionSignal) -> Intent:
         """Classify an evolution signal into an intent.
 
@@ -42,14 +61,61 @@ class IntentClassifier:
         Returns:
             Intent with action, target, and context.
         """
-        action = self.ACTION_MAP.get(signal.signal_type, "fix")
+        action, target, confidence = self._resolve(self._key(signal))
+        return self._build(signal, action, target, confidence)
 
-        # Infer target from patterns
-        target = self._infer_target(signal.patterns)
+    def classify_batch(self, signals: list[EvolutionSignal]) -> list[Intent]:
+        """Classify many signals, resolving each distinct key once.
 
-        # Calculate confidence based on pattern match
-        confidence = self._calculate_confidence(signal)
+        Args:
+            signals: Evolution signals to classify.
+
+        Returns:
+            Intents in the same order as the signals.
+        """
+        resolved: dict[tuple, tuple[str, Optional[str], float]] = {}
+        intents = []
+        for signal in signals:
+            key = self._key(signal)
+            outcome = resolved.get(key)
+            if outcome is None:
+                outcome = resolved[key] = self._resolve(key)
+            intents.append(self._build(signal, *outcome))
+        return intents
+
+    def cache_info(self) -> dict:
+        """Return memo hit/miss counters.
 
+        Returns:
+            Dictionary with hits, misses, hit rate, current size and capacity.
+        """
+        info = self._resolve.cache_info()
+        lookups = info.hits + info.misses
+        return {
+            "hits": info.hits,
+            "misses": info.misses,
+            "hit_rate": info.hits / lookups if lookups else 0.0,
+            "size": info.currsize,
+            "max_size": info.maxsize,
+        }
+
+    def cache_clear(self) -> None:
+        """Drop all memoized classifications."""
+        self._resolve.cache_clear()
+
+    @staticmethod
+    def _key(signal: EvolutionSignal) -> tuple:
+        """Normalize the inputs that determine a classification."""
+        return (signal.signal_type, frozenset(signal.patterns), signal.priority)
+
+    @staticmethod
+    def _build(
+        signal: EvolutionSignal,
+        action: str,
+        target: Optional[str],
+        confidence: float,
+    ) -> Intent:
+        """Create the Intent for a signal from a resolved classification."""
         return Intent(
             action=action,
             target=target,
@@ -61,25 +127,49 @@ class IntentClassifier:
             confidence=confidence,
         )
 
-    def _infer_target(self, patterns: list[str]) -> Optional[str]:
+    def _resolve_uncached(self, key: tuple) -> tuple[str, Optional[str], float]:
+        """Compute action, target and confidence for a normalized key.
+
+        Args:
+            key: Tuple of (signal_type, frozenset of patterns, priority).
+
+        Returns:
+            Tuple of (action, target, confidence).
+        """
+        signal_type, patterns, priority = key
+        action = self.ACTION_MAP.get(signal_type, "fix")
+
+        # Infer target from patterns
+        target = self._infer_target(patterns)
+
+        # Calculate confidence based on pattern match
+        confidence = self._calculate_confidence(patterns, priority)
+
+        return action, target, confidence
+
+    def _infer_target(self, patterns: frozenset[str]) -> Optional[str]:
         """Infer target component from error patterns.
 
+        Targets are checked in TARGET_PATTERNS order, which is also the order
+        in which Scanner reports these patterns.
+
         Args:
-            patterns: List of detected patterns.
+            patterns: Set of detected patterns.
 
         Returns:
             Inferred target or None.
         """
-        for pattern in patterns:
-            if pattern in self.TARGET_PATTERNS:
-                return self.TARGET_PATTERNS[pattern]
+        for pattern, target in self.TARGET_PATTERNS.items():
+            if pattern in patterns:
+                return target
         return "unknown"
 
-    def _calculate_confidence(self, signal: EvolutionSignal) -> float:
+    def _calculate_confidence(self, patterns: frozenset[str], priority: int) -> float:
         """Calculate confidence score for classification.
 
         Args:
-            signal: Evolution signal.
+            patterns: Set of detected patterns.
+            priority: Signal priority.
 
         Returns:
             Confidence score between 0 and 1.
@@ -87,9 +177,9 @@ class IntentClassifier:
         base_confidence = 0.7
 
         # More patterns = higher confidence
-        pattern_bonus = min(len(signal.patterns) * 0.1, 0.2)
+        pattern_bonus = min(len(patterns) * 0.1, 0.2)
 
         # Higher priority = higher confidence
-        priority_bonus = signal.priority * 0.01
+        priority_bonus = priority * 0.01
 
         return min(base_confidence + pattern_bonus + priority_bonus, 1.0)
@@ -0,0 +1,109 @@
+"""Multi-pattern substring matcher (Aho-Corasick automaton)."""
+import sys
+from collections import deque
+from typing import Iterable, Optional
+
+
+class PatternMatcher:
+    """Finds every known pattern occurring in a text in a single pass.
+
+    The automaton is built once from the pattern list; matching cost is then
+    proportional to the text length rather than patterns × text length.
+    Results are reported in the order the patterns were given, each at most
+    once, which matches a plain ``[p for p in patterns if p in text]`` loop.
+
+    For small pattern sets the per-character Python loop of the automaton is
+    slower than a handful of C-level ``in`` checks, so below
+    ``automaton_threshold`` patterns the matcher falls back to substring scans
+    (see ``benchmarks/bench_scanner.py`` for the crossover).
+    """
+
+    # Pattern count at which the automaton beats repeated substring scans
+    AUTOMATON_THRESHOLD = 128
+
+    def __init__(self, patterns: Iterable[str], automaton_threshold: Optional[int] = None):
+        """Build the automaton.
+
+        Args:
+            patterns: Patterns to match. Empty strings and duplicates are ignored.
+            automaton_threshold: Minimum pattern count for automaton matching;
+                defaults to AUTOMATON_THRESHOLD.
+        """
+        self.patterns: list[str] = []
+        seen = set()
+        for pattern in patterns:
+            if pattern and pattern not in seen:
+                seen.add(pattern)
+                self.patterns.append(sys.intern(pattern))
+
+        # State 0 is the root. Each state has a goto table, a failure link and
+        # the indices of the patterns that end there (including via failure links).
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[frozenset[int]] = []
+
+        outputs: list[set[int]] = [set()]
+        for index, pattern in enumerate(self.patterns):
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    outputs.append(set())
+                state = next_state
+            outputs[state].add(index)
+
+        # Breadth-first pass to compute failure links and merge outputs.
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                outputs[next_state] |= outputs[self._fail[next_state]]
+
+        self._out = [frozenset(found) for found in outputs]
+
+        if automaton_threshold is None:
+            automaton_threshold = self.AUTOMATON_THRESHOLD
+        self.uses_automaton = len(self.patterns) >= automaton_threshold
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def find_all(self, text: str) -> list[str]:
+        """Find all patterns occurring in text.
+
+        Args:
+            text: Text to search.
+
+        Returns:
+            Matched patterns in pattern-list order, without duplicates.
+        """
+        if not self.uses_automaton:
+            return [pattern for pattern in self.patterns if pattern in text]
+
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        matched: set[int] = set()
+
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state]:
+                matched.update(out[state])
+
+        if not matched:
+            return []
+        patterns = self.patterns
+        return [patterns[index] for index in sorted(matched)]
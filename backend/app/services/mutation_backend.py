@@ -0,0 +1,239 @@
+"""Pluggable asynchronous mutation backends."""
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from app.services.intent import Intent
+from app.services.mutator import Mutator, MutationResult
+
+
+class MutationBackend(ABC):
+    """Interface for services that generate mutations, such as an LLM.
+
+    Backends receive intents in batches so services with per-request
+    overhead can serve several intents in one call.
+    """
+
+    @abstractmethod
+    async def generate_batch(self, intents: list[Intent]) -> list[MutationResult]:
+        """Generate one mutation per intent.
+
+        Args:
+            intents: Intents to generate mutations for.
+
+        Returns:
+            MutationResults in the same order as the intents.
+        """
+
+
+class TemplateBackend(MutationBackend):
+    """Backend serving the built-in ``Mutator`` templates."""
+
+    def __init__(self, mutator: Optional[Mutator] = None):
+        """Initialize backend.
+
+        Args:
+            mutator: Template mutator to delegate to.
+        """
+        self.mutator = mutator or Mutator()
+
+    async def generate_batch(self, intents: list[Intent]) -> list[MutationResult]:
+        """Generate template mutations."""
+        return [self.mutator.mutate(intent) for intent in intents]
+
+
+class FakeBackend(TemplateBackend):
+    """Template backend with simulated service latency, for tests.
+
+    Each batch takes ``latency_seconds`` plus ``per_item_seconds`` for
+    every intent in it. Batch sizes are recorded in ``batches``.
+    """
+
+    def __init__(
+        self,
+        latency_seconds: float = 0.05,
+        per_item_seconds: float = 0.0,
+        mutator: Optional[Mutator] = None,
+    ):
+        """Initialize backend.
+
+        Args:
+            latency_seconds: Simulated latency of every batch call.
+            per_item_seconds: Simulated extra latency per intent.
+            mutator: Template mutator producing the results.
+        """
+        super().__init__(mutator)
+        self.latency_seconds = latency_seconds
+        self.per_item_seconds = per_item_seconds
+        self.batches: list[int] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def generate_batch(self, intents: list[Intent]) -> list[MutationResult]:
+        """Sleep for the simulated latency, then generate template mutations."""
+        self.batches.append(len(intents))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency_seconds + self.per_item_seconds * len(intents))
+        finally:
+            self.in_flight -= 1
+        return await super().generate_batch(intents)
+
+
+class BatchingMutator:
+    """Async front end that batches and throttles calls to a backend.
+
+    Requests arriving within ``batch_window_seconds`` of the first request
+    of a batch are sent to the backend together, up to ``max_batch_size``.
+    At most ``max_concurrency`` batches are in flight at once. A request
+    that misses its deadline resolves to a failed MutationResult; if its
+    batch has not been sent yet it is dropped from the batch.
+
+    The semaphore, window timer and pending batch belong to the event loop
+    that made the latest request. A request from another loop, such as a
+    later ``asyncio.run``, replaces them, so one mutator can serve
+    successive loops but not several loops at once.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[MutationBackend] = None,
+        max_concurrency: int = 8,
+        max_batch_size: int = 16,
+        batch_window_seconds: float = 0.005,
+        deadline_seconds: Optional[float] = None,
+    ):
+        """Initialize batching mutator.
+
+        Args:
+            backend: Mutation backend; defaults to the built-in templates.
+            max_concurrency: Maximum batches sent to the backend at once.
+            max_batch_size: Maximum intents per backend call.
+            batch_window_seconds: How long a batch waits for more requests.
+            deadline_seconds: Default per-call deadline, or None for none.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+
+        self.backend = backend or TemplateBackend()
+        self.max_concurrency = max_concurrency
+        self.max_batch_size = max_batch_size
+        self.batch_window_seconds = batch_window_seconds
+        self.deadline_seconds = deadline_seconds
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._batch: list[tuple[Intent, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: set[asyncio.Task] = set()
+        self.requests = 0
+        self.batches = 0
+        self.deadline_misses = 0
+
+    async def mutate(self, intent: Intent, deadline_seconds: Optional[float] = None) -> MutationResult:
+        """Generate a mutation for an intent.
+
+        Args:
+            intent: Classified intent for evolution.
+            deadline_seconds: Seconds to wait for the result; defaults to
+                ``self.deadline_seconds``.
+
+        Returns:
+            The backend's MutationResult, or a failed result if the deadline
+            passed or the backend raised.
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._bind(loop)
+        future = loop.create_future()
+        self.requests += 1
+        self._batch.append((intent, future))
+        if len(self._batch) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.batch_window_seconds, self._flush)
+
+        timeout = deadline_seconds if deadline_seconds is not None else self.deadline_seconds
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            self.deadline_misses += 1
+            return MutationResult(
+                success=False,
+                description=f"Mutation deadline of {timeout}s exceeded",
+                target=intent.target,
+            )
+
+    def stats(self) -> dict:
+        """Return request, batch and deadline counters.
+
+        Returns:
+            Dictionary with request and batch counts, mean batch size and
+            missed deadlines.
+        """
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "mean_batch_size": self.requests / self.batches if self.batches else 0.0,
+            "deadline_misses": self.deadline_misses,
+        }
+
+    def _bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Start over on a new event loop.
+
+        Any batch and timer left by the previous loop are dropped: their
+        futures belong to that loop, which no longer runs them.
+        """
+        self._loop = loop
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._batch = []
+        self._timer = None
+        self._tasks = set()
+
+    def _flush(self) -> None:
+        """Send the collected batch to the backend."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._batch = self._batch, []
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._dispatch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, batch: list[tuple[Intent, asyncio.Future]]) -> None:
+        """Call the backend for a batch and resolve its futures."""
+        async with self._semaphore:
+            batch = [(intent, future) for intent, future in batch if not future.done()]
+            if not batch:
+                return
+            self.batches += 1
+            try:
+                results = await self.backend.generate_batch([intent for intent, _ in batch])
+            except Exception as e:
+                results = [
+                    MutationResult(
+                        success=False,
+                        description=f"Mutation backend error: {type(e).__name__}: {e}",
+                        target=intent.target,
+                    )
+                    for intent, _ in batch
+                ]
+
+        if len(results) != len(batch):
+            # Intents without a result would otherwise wait forever
+            description = f"Mutation backend returned {len(results)} results for {len(batch)} intents"
+            results = list(results[:len(batch)]) + [
+                MutationResult(success=False, description=description, target=intent.target)
+                for intent, _ in batch[len(results):]
+            ]
+
+        for (intent, future), result in zip(batch, results):
+            if result.target is None:
+                result.target = intent.target
+            if result.action is None:
+                result.action = intent.action
+            if not future.done():
+                future.set_result(result)
@@ -1,8 +1,10 @@
 """Mutation generation service."""
+import itertools
 from dataclasses import dataclass, field
 from typing import Optional
 
 from app.services.intent import Intent
+from app.services.templates import TemplateRegistry, template_registry
 
 
 @dataclass
@@ -13,6 +15,9 @@ class MutationResult:
     prompt: Optional[str] = None
     description: str = ""
     changes: list[str] = field(default_factory=list)
+    target: Optional[str] = None
+    action: Optional[str] = None  # action of the intent it was generated for
+    tests: list[str] = field(default_factory=list)  # run against code when validating
 
 
 class Mutator:
@@ -21,7 +26,7 @@ class Mutator:
     # Template mutations for common fixes
     FIX_TEMPLATES = {
         "database_connection": {
-            "code": '''def safe_connect(retries=3, delay=1):
+            "code": '''def safe_connect(retries=${retries}, delay=${delay}):
     """Safe database connection with retry logic."""
     import time
     for attempt in range(retries):
@@ -33,24 +38,76 @@ class Mutator:
             time.sleep(delay * (attempt + 1))
 ''',
             "description": "Add retry logic for database connections",
+            "params": {
+                "retries": {"type": "int", "default": 3},
+                "delay": {"type": "float", "default": 1.0},
+            },
+            # Called with delay=0 so retries do not sleep; the fix must ride
+            # out two refused attempts in a row
+            "tests": [
+                """def connect_to_database():
+    return "conn"
+assert safe_connect(delay=0) == "conn"
+""",
+                """attempts = []
+def connect_to_database():
+    attempts.append(1)
+    if len(attempts) < 3:
+        raise ConnectionError("refused")
+    return "conn"
+assert safe_connect(delay=0) == "conn"
+""",
+                """def connect_to_database():
+    raise ConnectionError("refused")
+try:
+    safe_connect(delay=0)
+except ConnectionError:
+    pass
+else:
+    raise AssertionError("expected ConnectionError once retries run out")
+""",
+            ],
+            "sweep": {"retries": [3, 2, 5], "delay": [1.0, 0.5]},
         },
         "api_timeout": {
-            "code": '''def call_with_timeout(api_func, timeout=30):
+            "code": '''def call_with_timeout(api_func, timeout=${timeout}):
     """Call API with configurable timeout."""
-    import signal
+    from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
 
-    def timeout_handler(signum, frame):
-        raise TimeoutError(f"API call exceeded {timeout}s timeout")
-
-    signal.signal(signal.SIGALRM, timeout_handler)
-    signal.alarm(timeout)
+    executor = ThreadPoolExecutor(max_workers=1)
+    future = executor.submit(api_func)
     try:
-        result = api_func()
+        return future.result(timeout=timeout)
+    except FutureTimeout:
+        raise TimeoutError(f"API call exceeded {timeout}s timeout") from None
     finally:
-        signal.alarm(0)
-    return result
+        executor.shutdown(wait=False)
 ''',
             "description": "Add timeout handling for API calls",
+            "params": {"timeout": {"type": "int", "default": 30}},
+            # Timeouts are passed explicitly so tests do not wait on defaults
+            "tests": [
+                """assert call_with_timeout(lambda: "ok") == "ok"
+""",
+                """def api_func():
+    raise ConnectionError("refused")
+try:
+    call_with_timeout(api_func)
+except ConnectionError:
+    pass
+else:
+    raise AssertionError("expected the API error to propagate")
+""",
+                """import time
+try:
+    call_with_timeout(lambda: time.sleep(0.2), timeout=0.01)
+except TimeoutError:
+    pass
+else:
+    raise AssertionError("expected TimeoutError")
+""",
+            ],
+            "sweep": {"timeout": [30, 10, 60]},
         },
         "data_access": {
             "code": '''def safe_get(data, *keys, default=None):
@@ -69,7 +126,7 @@ class Mutator:
     # Prompt templates for optimization
     PROMPT_TEMPLATES = {
         "optimize": {
-            "prompt": """When processing {target}:
+            "prompt": """When processing ${target}:
 1. Cache results when possible
 2. Use batch processing for multiple items
 3. Implement early termination for failed cases
@@ -79,6 +136,32 @@ class Mutator:
         },
     }
 
+    def __init__(self, registry: Optional[TemplateRegistry] = None):
+        """Initialize mutator.
+
+        Args:
+            registry: Template registry to render from; defaults to the
+                process-wide registry. The built-in templates are registered
+                unless the registry already holds an override.
+        """
+        self.registry = registry if registry is not None else template_registry
+        for target, template in self.FIX_TEMPLATES.items():
+            self.registry.register_default(
+                f"fix:{target}",
+                template["code"],
+                params=template.get("params"),
+                kind="code",
+                description=template["description"],
+            )
+        for target, template in self.PROMPT_TEMPLATES.items():
+            self.registry.register_default(
+                f"optimize:{target}",
+                template["prompt"],
+                params=template.get("params"),
+                kind="prompt",
+                description=template["description"],
+            )
+
     def mutate(self, intent: Intent) -> MutationResult:
         """Generate a mutation based on intent.
 
@@ -89,13 +172,104 @@ class Mutator:
             MutationResult with code or prompt changes.
         """
         if intent.action == "fix":
-            return self._generate_fix(intent)
+            result = self._generate_fix(intent)
         elif intent.action == "optimize":
-            return self._generate_optimization(intent)
+            result = self._generate_optimization(intent)
         elif intent.action == "explore":
-            return self._generate_exploration(intent)
+            result = self._generate_exploration(intent)
+        else:
+            return MutationResult(success=False, description="Unknown action type")
+
+        result.target = intent.target
+        result.action = intent.action
+        return result
+
+    def output_kind(self, intent: Intent) -> Optional[str]:
+        """Return what ``mutate`` produces for an intent.
 
-        return MutationResult(success=False, description="Unknown action type")
+        Args:
+            intent: Classified intent for evolution.
+
+        Returns:
+            "code" or "prompt", or None for an unknown action.
+        """
+        if intent.action == "fix":
+            template = self.registry.get(f"fix:{intent.target or 'unknown'}")
+            return template.kind if template is not None else "code"
+        if intent.action == "optimize":
+            template = self.registry.get(f"optimize:{intent.target or 'general'}")
+            return template.kind if template is not None else "prompt"
+        if intent.action == "explore":
+            return "prompt"
+        return None
+
+    def mutate_candidates(self, intent: Intent, count: int = 4) -> list[MutationResult]:
+        """Generate the mutation for an intent plus parameter variants.
+
+        Fix templates may declare a ``sweep`` of parameter values to try,
+        listing the template's own default first. Variants render the
+        template with those values, e.g. ``retries=5, delay=0.5``. They
+        are only generated when the mutation carries tests, since without
+        them the tournament cannot tell variants apart.
+
+        Args:
+            intent: Classified intent for evolution.
+            count: Maximum number of candidates to return.
+
+        Returns:
+            The regular mutation first, followed by up to ``count - 1``
+            distinct variants.
+        """
+        base = self.mutate(intent)
+        candidates = [base]
+        if not base.success or intent.action != "fix" or not base.tests:
+            return candidates
+
+        template_id = f"fix:{intent.target}"
+        sweep = self.FIX_TEMPLATES.get(intent.target or "", {}).get("sweep", {})
+        if template_id not in self.registry:
+            return candidates
+        for values in itertools.product(*sweep.values()):
+            if len(candidates) >= count:
+                break
+            params = dict(zip(sweep, values))
+            code = self.registry.render(template_id, {**intent.context, **params})
+            if code == base.code:
+                continue
+            settings = ", ".join(f"{name}={value}" for name, value in params.items())
+            candidates.append(MutationResult(
+                success=True,
+                code=code,
+                description=f"{base.description} ({settings})",
+                changes=base.changes + [f"Tuned {settings}"],
+                target=base.target,
+                action=base.action,
+                tests=base.tests,
+            ))
+        return candidates
+
+    def _render(self, template_id: str, intent: Intent, target: str) -> Optional[MutationResult]:
+        """Render a registered template with parameters from the intent.
+
+        Returns:
+            MutationResult with the rendered text in ``code`` or ``prompt``
+            by template kind, a failed result if the intent context holds
+            invalid parameter values, or None if no such template exists.
+        """
+        template = self.registry.get(template_id)
+        if template is None:
+            return None
+        try:
+            text = self.registry.render(template_id, {**intent.context, "target": target})
+        except (KeyError, ValueError) as e:
+            return MutationResult(success=False, description=f"Invalid template parameters: {e}")
+
+        result = MutationResult(success=True, description=template.description)
+        if template.kind == "prompt":
+            result.prompt = text
+        else:
+            result.code = text
+        return result
 
     def _generate_fix(self, intent: Intent) -> MutationResult:
         """Generate a fix mutation.
@@ -108,14 +282,16 @@ class Mutator:
         """
         target = intent.target or "unknown"
 
-        if target in self.FIX_TEMPLATES:
-            template = self.FIX_TEMPLATES[target]
-            return MutationResult(
-                success=True,
-                code=template["code"],
-                description=template["description"],
-                changes=[f"Added fix for {target}"],
-            )
+        template_id = f"fix:{target}"
+        result = self._render(template_id, intent, target)
+        if result is not None:
+            if result.success:
+                result.changes.append(f"Added fix for {target}")
+                # Built-in tests only fit the built-in source, not overrides
+                builtin = self.FIX_TEMPLATES.get(target, {})
+                if builtin.get("tests") and self.registry.get(template_id).source == builtin["code"]:
+                    result.tests = list(builtin["tests"])
+            return result
 
         # Generic fix template
         return MutationResult(
@@ -135,14 +311,11 @@ class Mutator:
         """
         target = intent.target or "general"
 
-        if target in self.PROMPT_TEMPLATES:
-            template = self.PROMPT_TEMPLATES[target]
-            return MutationResult(
-                success=True,
-                prompt=template["prompt"].format(target=target),
-                description=template["description"],
-                changes=[f"Added optimization for {target}"],
-            )
+        result = self._render(f"optimize:{target}", intent, target)
+        if result is not None:
+            if result.success:
+                result.changes.append(f"Added optimization for {target}")
+            return result
 
         return MutationResult(
             success=True,
@@ -0,0 +1,228 @@
+"""Parallel replay of archived JSONL logs through the GEP loop."""
+import argparse
+import json
+import mmap
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, Optional
+
+from app.services.gep_loop import GEPLoop, LoopResult
+
+# Default chunk size; large enough to amortize IPC, small enough to balance workers
+DEFAULT_CHUNK_BYTES = 8 * 1024 * 1024
+
+# Per-process loop, created by the pool initializer
+_worker_loop: Optional[GEPLoop] = None
+
+
+@dataclass
+class ReplayStats:
+    """Throughput and outcome counts of a replay run."""
+    lines: int = 0
+    chunks: int = 0
+    elapsed_seconds: float = 0.0
+    status_counts: Counter = field(default_factory=Counter)
+
+    @property
+    def lines_per_sec(self) -> float:
+        """Lines processed per wall-clock second."""
+        return self.lines / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+
+def chunk_offsets(path: str, chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> list[tuple[int, int]]:
+    """Split a file into byte ranges that end on line boundaries.
+
+    Args:
+        path: Path to a JSONL file.
+        chunk_bytes: Target size of each chunk.
+
+    Returns:
+        List of (start, end) byte offsets covering the whole file.
+    """
+    if chunk_bytes < 1:
+        raise ValueError("chunk_bytes must be at least 1")
+
+    size = os.path.getsize(path)
+    if size == 0:
+        return []
+
+    offsets = []
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start = 0
+        while start < size:
+            end = min(start + chunk_bytes, size)
+            if end < size:
+                newline = mm.find(b"\n", end - 1)
+                end = size if newline == -1 else newline + 1
+            offsets.append((start, end))
+            start = end
+    return offsets
+
+
+def _init_worker() -> None:
+    """Create the GEP loop once per worker process."""
+    global _worker_loop
+    _worker_loop = GEPLoop()
+
+
+def _replay_chunk(
+    path: str,
+    start: int,
+    end: int,
+    statuses: Optional[frozenset[str]] = None,
+) -> tuple[Counter, list[LoopResult]]:
+    """Run one chunk of a JSONL file through the GEP loop.
+
+    Lines are read straight from the memory map one at a time.
+
+    Args:
+        path: Path to the JSONL file.
+        start: Chunk start offset.
+        end: Chunk end offset (exclusive, on a line boundary).
+        statuses: Only return results with these statuses; all if None.
+
+    Returns:
+        Tuple of (status counts, results) for the chunk, in file order.
+    """
+    loop = _worker_loop or GEPLoop()
+    counts: Counter = Counter()
+    results = []
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        position = start
+        while position < end:
+            newline = mm.find(b"\n", position, end)
+            line_end = end if newline == -1 else newline
+            line = mm[position:line_end]
+            position = line_end + 1
+
+            if not line.strip():
+                continue
+            try:
+                result = loop.process(json.loads(line))
+            except ValueError as e:
+                result = LoopResult(status="failed", error=f"Invalid JSON line: {e}")
+
+            counts[result.status] += 1
+            if statuses is None or result.status in statuses:
+                results.append(result)
+
+    return counts, results
+
+
+def iter_replay(
+    path: str,
+    workers: Optional[int] = None,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+    statuses: Optional[Iterable[str]] = None,
+    stats: Optional[ReplayStats] = None,
+) -> Iterator[LoopResult]:
+    """Replay a JSONL log file through the GEP loop in a process pool.
+
+    The file is memory-mapped and split into chunks on line boundaries; each
+    chunk is processed by a worker and results are yielded in input order.
+    At most ``2 * workers`` chunks are in flight at once.
+
+    Args:
+        path: Path to the JSONL file.
+        workers: Number of worker processes; defaults to the CPU count.
+        chunk_bytes: Target chunk size in bytes.
+        statuses: Only yield results with these statuses; all if None.
+        stats: Optional ReplayStats to update as chunks complete.
+
+    Yields:
+        LoopResult for each (matching) line, in file order.
+    """
+    workers = workers or os.cpu_count() or 1
+    wanted = frozenset(statuses) if statuses is not None else None
+    stats = stats if stats is not None else ReplayStats()
+    offsets = chunk_offsets(path, chunk_bytes)
+    started = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        pending: list[Future] = []
+        next_chunk = 0
+        while next_chunk < len(offsets) or pending:
+            while next_chunk < len(offsets) and len(pending) < 2 * workers:
+                start, end = offsets[next_chunk]
+                pending.append(pool.submit(_replay_chunk, path, start, end, wanted))
+                next_chunk += 1
+
+            counts, results = pending.pop(0).result()
+            stats.chunks += 1
+            stats.lines += sum(counts.values())
+            stats.status_counts.update(counts)
+            stats.elapsed_seconds = time.perf_counter() - started
+            yield from results
+
+
+def replay_file(
+    path: str,
+    workers: Optional[int] = None,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+    statuses: Optional[Iterable[str]] = None,
+) -> tuple[ReplayStats, list[LoopResult]]:
+    """Replay a JSONL log file and collect the results.
+
+    Args:
+        path: Path to the JSONL file.
+        workers: Number of worker processes; defaults to the CPU count.
+        chunk_bytes: Target chunk size in bytes.
+        statuses: Only collect results with these statuses; all if None.
+
+    Returns:
+        Tuple of (ReplayStats, results in input order).
+    """
+    stats = ReplayStats()
+    results = list(iter_replay(path, workers, chunk_bytes, statuses, stats))
+    return stats, results
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Command-line entry point for log replay."""
+    parser = argparse.ArgumentParser(
+        description="Replay a JSONL log file through the GEP loop.",
+    )
+    parser.add_argument("path", help="JSONL file with one log entry per line")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="worker processes")
+    parser.add_argument(
+        "--chunk-mb", type=float, default=DEFAULT_CHUNK_BYTES / (1024 * 1024),
+        help="chunk size in MiB",
+    )
+    parser.add_argument(
+        "-o", "--output", default=None,
+        help="write gene data of successful results to this JSONL file",
+    )
+    args = parser.parse_args(argv)
+
+    stats = ReplayStats()
+    results = iter_replay(
+        args.path,
+        workers=args.workers,
+        chunk_bytes=max(1, int(args.chunk_mb * 1024 * 1024)),
+        statuses={"success"},
+        stats=stats,
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as out:
+            for result in results:
+                out.write(json.dumps(result.gene_data) + "\n")
+    else:
+        for _ in results:
+            pass
+
+    counts = ", ".join(f"{status}={count}" for status, count in sorted(stats.status_counts.items()))
+    print(
+        f"Replayed {stats.lines} lines in {stats.chunks} chunks, "
+        f"{stats.elapsed_seconds:.2f}s ({stats.lines_per_sec:,.0f} lines/sec): {counts}",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,312 @@
+"""Process-pool sandbox for running untrusted validation code."""
+import math
+import multiprocessing
+import os
+import queue
+import resource
+import signal
+import threading
+from multiprocessing.connection import Connection
+from typing import Any, Optional
+
+from app.services.validator import (
+    SANDBOX_CRASH,
+    SANDBOX_ERROR,
+    ValidationResult,
+    run_code,
+    run_test,
+    run_with_tests,
+)
+
+# Job kinds a sandbox worker can run
+JOBS = {
+    "code": run_code,
+    "tests": run_with_tests,
+    "test": run_test,
+}
+
+# Modules imported once by the fork server so new workers start warm
+PRELOAD_MODULES = ["app.services.sandbox"]
+
+
+def _default_start_method() -> Optional[str]:
+    """Prefer a preloaded fork server; fall back to the platform default."""
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return "forkserver"
+    return None
+
+
+def _address_space_bytes() -> int:
+    """Return the current virtual memory size of this process, if known."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return 0
+
+
+def _cpu_seconds_used() -> float:
+    """Return CPU time consumed by this process so far."""
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _set_soft_limit(limit: int, value: int) -> None:
+    """Set a soft rlimit, clamped to the hard limit."""
+    _, hard = resource.getrlimit(limit)
+    if hard != resource.RLIM_INFINITY:
+        value = min(value, hard)
+    resource.setrlimit(limit, (value, hard))
+
+
+def _worker_main(conn: Connection, memory_bytes: Optional[int]) -> None:
+    """Serve validation jobs received over a pipe until told to stop.
+
+    Jobs are ``(kind, args, cpu_seconds)`` tuples; None stops the worker.
+
+    Args:
+        conn: Pipe to the parent process.
+        memory_bytes: Address space the worker may allocate beyond its
+            size at startup, or None for no limit.
+    """
+    # Ctrl-C is handled by the parent, which tears the pool down
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    if memory_bytes is not None:
+        _set_soft_limit(resource.RLIMIT_AS, _address_space_bytes() + memory_bytes)
+
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, OSError):
+            return
+        if job is None:
+            return
+
+        kind, args, cpu_seconds = job
+        if cpu_seconds is not None:
+            # RLIMIT_CPU counts the whole process lifetime, so extend it per job
+            _set_soft_limit(resource.RLIMIT_CPU, math.ceil(_cpu_seconds_used()) + cpu_seconds)
+        try:
+            result = JOBS[kind](*args)
+        except BaseException as e:
+            result = ValidationResult(
+                passed=False,
+                error=f"{SANDBOX_ERROR}: {type(e).__name__}: {e}",
+            )
+        conn.send(result)
+
+
+class _Worker:
+    """A sandbox process and the parent end of its pipe."""
+
+    def __init__(self, context: Any, memory_bytes: Optional[int]):
+        self.jobs = 0
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main,
+            args=(child_conn, memory_bytes),
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+
+    def kill(self) -> None:
+        """Terminate the process immediately."""
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+    def stop(self, timeout: float = 1.0) -> None:
+        """Ask the process to exit, killing it if it does not."""
+        try:
+            self.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout)
+        self.kill()
+
+
+class SandboxPool:
+    """Pool of worker processes that run validation jobs with hard limits.
+
+    Each job runs in a separate process under a CPU-time rlimit and an
+    address-space rlimit, and is bounded by a wall-clock timeout. A worker
+    that exceeds the timeout or dies is killed and replaced, so one runaway
+    mutation cannot block the pool. Jobs submitted from different threads
+    run in parallel, one per worker.
+
+    Workers are long-lived: each serves up to ``max_jobs_per_worker`` jobs
+    and is then recycled in the background. With the ``forkserver`` start
+    method (the default where available) replacements are forked from a
+    server that has already imported the validator, so they start warm
+    instead of paying interpreter and import startup.
+    """
+
+    def __init__(
+        self,
+        size: Optional[int] = None,
+        memory_bytes: Optional[int] = 256 * 1024 * 1024,
+        cpu_seconds: Optional[int] = None,
+        start_method: Optional[str] = "default",
+        max_jobs_per_worker: Optional[int] = 100,
+    ):
+        """Initialize pool; workers start on first use or ``warm_up``.
+
+        Args:
+            size: Number of worker processes; defaults to the CPU count.
+            memory_bytes: Extra address space each worker may allocate, or
+                None for no limit.
+            cpu_seconds: CPU time per job; defaults to the job timeout
+                rounded up plus one second.
+            start_method: multiprocessing start method; "default" prefers a
+                preloaded fork server, None uses the platform default.
+            max_jobs_per_worker: Jobs a worker serves before it is recycled,
+                or None to keep workers until they fail.
+        """
+        if start_method == "default":
+            start_method = _default_start_method()
+
+        self.size = size or os.cpu_count() or 1
+        self.memory_bytes = memory_bytes
+        self.cpu_seconds = cpu_seconds
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self._context = multiprocessing.get_context(start_method)
+        if start_method == "forkserver":
+            self._context.set_forkserver_preload(PRELOAD_MODULES)
+        self._idle: queue.Queue[_Worker] = queue.Queue()
+        self._workers: set[_Worker] = set()
+        self._lock = threading.Lock()
+        self._started = False
+        self._closed = False
+        self.timeouts = 0
+        self.crashes = 0
+        self.recycled = 0
+
+    def __enter__(self) -> "SandboxPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def start(self) -> None:
+        """Start all worker processes."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Sandbox pool is closed")
+            if self._started:
+                return
+            for _ in range(self.size):
+                self._idle.put(self._spawn())
+            self._started = True
+
+    def warm_up(self) -> None:
+        """Start all workers and run a no-op job on each.
+
+        Call at application startup so the first real validations do not
+        pay process startup.
+        """
+        self.start()
+        workers = [self._idle.get() for _ in range(self.size)]
+        try:
+            for worker in workers:
+                worker.conn.send(("code", ("pass",), None))
+            for worker in workers:
+                worker.conn.recv()
+        finally:
+            for worker in workers:
+                self._idle.put(worker)
+
+    def run(self, kind: str, args: tuple, timeout: float) -> ValidationResult:
+        """Run a validation job in a worker, waiting for a free one.
+
+        Args:
+            kind: Job kind, a key of JOBS.
+            args: Arguments for the job function.
+            timeout: Wall-clock seconds the job may take.
+
+        Returns:
+            The job's ValidationResult, or a failed result with
+            ``timed_out=True`` if the worker had to be killed.
+        """
+        if kind not in JOBS:
+            raise ValueError(f"Unknown sandbox job: {kind}")
+        self.start()
+
+        worker = self._idle.get()
+        replacement = None
+        try:
+            cpu_seconds = self.cpu_seconds or math.ceil(timeout) + 1
+            worker.jobs += 1
+            worker.conn.send((kind, args, cpu_seconds))
+            if worker.conn.poll(timeout):
+                result = worker.conn.recv()
+                if self.max_jobs_per_worker and worker.jobs >= self.max_jobs_per_worker:
+                    threading.Thread(target=self._recycle, args=(worker,), daemon=True).start()
+                    worker = None
+                return result
+
+            self.timeouts += 1
+            replacement = worker
+            return ValidationResult(
+                passed=False,
+                error=f"Timed out after {timeout}s",
+                timed_out=True,
+            )
+        except (EOFError, OSError):
+            replacement = worker
+            worker.process.join(0.1)
+            return self._crash_result(worker)
+        finally:
+            if replacement is not None:
+                worker = self._replace(replacement)
+            if worker is not None:
+                self._idle.put(worker)
+
+    def close(self) -> None:
+        """Stop all workers."""
+        with self._lock:
+            self._closed = True
+            workers = list(self._workers)
+            self._workers.clear()
+        for worker in workers:
+            worker.stop()
+
+    def _spawn(self) -> _Worker:
+        """Start a new worker process."""
+        worker = _Worker(self._context, self.memory_bytes)
+        self._workers.add(worker)
+        return worker
+
+    def _recycle(self, worker: _Worker) -> None:
+        """Retire a worker that reached its job limit and add a fresh one."""
+        with self._lock:
+            self._workers.discard(worker)
+            if not self._closed:
+                self.recycled += 1
+                self._idle.put(self._spawn())
+        worker.stop()
+
+    def _replace(self, worker: _Worker) -> Optional[_Worker]:
+        """Kill a worker and start a replacement unless the pool is closed."""
+        worker.kill()
+        with self._lock:
+            self._workers.discard(worker)
+            if self._closed:
+                return None
+            return self._spawn()
+
+    def _crash_result(self, worker: _Worker) -> ValidationResult:
+        """Describe a worker that died while running a job."""
+        self.crashes += 1
+        exitcode = worker.process.exitcode
+        if exitcode == -signal.SIGXCPU:
+            return ValidationResult(
+                passed=False,
+                error="CPU time limit exceeded",
+                timed_out=True,
+            )
+        return ValidationResult(
+            passed=False,
+            error=f"{SANDBOX_CRASH} (exit code {exitcode})",
+        )
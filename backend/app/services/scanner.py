@@ -1,21 +1,203 @@
 """Scanner service for log analysis and pattern detection."""
+import sys
+import time
 from dataclasses import dataclass, field
-from typing import Optional
+from datetime import datetime
+from typing import AsyncIterable, AsyncIterator, Callable, Optional, Sequence
 from collections import Counter
 
+from app.services.matcher import PatternMatcher
 
-@dataclass
+
+@dataclass(slots=True)
 class ScanResult:
-    """Result of scanning a log entry."""
+    """Result of scanning a log entry.
+
+    Compact scanners return ``patterns`` as a tuple and share ``context``
+    dicts between results; neither may be modified.
+    """
     has_issue: bool = False
     issue_type: Optional[str] = None
-    patterns: list[str] = field(default_factory=list)
+    patterns: Sequence[str] = field(default_factory=list)
     context: dict = field(default_factory=dict)
     raw_log: Optional[dict] = None
 
 
+class StagnationDetector:
+    """Detects repeated error patterns one log entry at a time.
+
+    Per-pattern counts are kept over a sliding window, either the last
+    ``window_size`` error entries (count window) or the last
+    ``window_seconds`` (time window). Both windows are fixed-size ring
+    buffers, so each entry costs O(1) work and memory stays bounded no matter
+    how long the detector runs.
+
+    The time window is split into ``buckets`` slots, so entries expire with a
+    granularity of ``window_seconds / buckets``.
+    """
+
+    def __init__(
+        self,
+        patterns: list[str],
+        threshold: int = 3,
+        window_seconds: float = 300.0,
+        window_size: Optional[int] = None,
+        buckets: int = 60,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize detector.
+
+        Args:
+            patterns: Patterns that indicate stagnation when repeated.
+            threshold: Occurrences within the window to consider stagnation.
+            window_seconds: Length of the time window.
+            window_size: If given, use a count window of this many error
+                entries instead of the time window.
+            buckets: Number of slots in the time window ring buffer.
+            clock: Time source for entries without a usable timestamp.
+        """
+        if window_size is not None and window_size < 1:
+            raise ValueError("window_size must be at least 1")
+        if window_size is None and (window_seconds <= 0 or buckets < 1):
+            raise ValueError("window_seconds and buckets must be positive")
+
+        self.threshold = threshold
+        self.window_seconds = window_seconds
+        self.window_size = window_size
+        self.clock = clock
+        self._matcher = PatternMatcher(patterns)
+
+        self._counts: dict[str, int] = {pattern: 0 for pattern in self._matcher.patterns}
+        self._total_errors = 0
+        self._active: set[str] = set()
+
+        if window_size is not None:
+            # Count window: one slot per error entry
+            self._entries: list[tuple[str, ...]] = [()] * window_size
+            self._position = 0
+        else:
+            # Time window: one slot per bucket of width window_seconds / buckets
+            self._bucket_width = window_seconds / buckets
+            self._bucket_counts: list[dict[str, int]] = [{} for _ in range(buckets)]
+            self._bucket_errors = [0] * buckets
+            self._head: Optional[int] = None
+
+    def observe(self, log_entry: dict) -> ScanResult:
+        """Feed one log entry into the window.
+
+        Args:
+            log_entry: Log entry with level, message and optional timestamp.
+
+        Returns:
+            Stagnation ScanResult when a pattern reaches the threshold with
+            this entry, otherwise a ScanResult without an issue. A pattern is
+            reported again only after its count has dropped below the
+            threshold.
+        """
+        if self.window_size is None:
+            self._advance(self._entry_time(log_entry))
+
+        if log_entry.get("level") != "ERROR":
+            return ScanResult(has_issue=False)
+
+        matched = tuple(self._matcher.find_all(log_entry.get("message", "")))
+        if self.window_size is not None:
+            self._push_entry(matched)
+        else:
+            self._push_bucket(matched)
+
+        for pattern in matched:
+            count = self._counts[pattern]
+            if count >= self.threshold and pattern not in self._active:
+                self._active.add(pattern)
+                return ScanResult(
+                    has_issue=True,
+                    issue_type="stagnation",
+                    patterns=[pattern],
+                    context={"count": count, "total_errors": self._total_errors},
+                )
+
+        return ScanResult(has_issue=False)
+
+    def counts(self) -> dict[str, int]:
+        """Return current per-pattern counts within the window."""
+        return {pattern: count for pattern, count in self._counts.items() if count}
+
+    def _push_entry(self, matched: tuple[str, ...]) -> None:
+        """Add an error entry to the count window, evicting the oldest."""
+        evicted = self._entries[self._position]
+        if self._total_errors == self.window_size:
+            self._total_errors -= 1
+        self._release(evicted)
+
+        self._entries[self._position] = matched
+        self._position = (self._position + 1) % self.window_size
+        self._total_errors += 1
+        for pattern in matched:
+            self._counts[pattern] += 1
+
+    def _push_bucket(self, matched: tuple[str, ...]) -> None:
+        """Add an error entry to the current time bucket."""
+        slot = self._head % len(self._bucket_counts)
+        bucket = self._bucket_counts[slot]
+        self._bucket_errors[slot] += 1
+        self._total_errors += 1
+        for pattern in matched:
+            bucket[pattern] = bucket.get(pattern, 0) + 1
+            self._counts[pattern] += 1
+
+    def _advance(self, now: float) -> None:
+        """Move the time window forward, expiring buckets that fell out."""
+        bucket_index = int(now // self._bucket_width)
+        if self._head is None:
+            self._head = bucket_index
+            return
+        if bucket_index <= self._head:
+            # Late entries are counted in the current bucket
+            return
+
+        buckets = len(self._bucket_counts)
+        for index in range(max(self._head + 1, bucket_index - buckets + 1), bucket_index + 1):
+            slot = index % buckets
+            bucket = self._bucket_counts[slot]
+            for pattern, count in bucket.items():
+                self._counts[pattern] -= count
+                if self._counts[pattern] < self.threshold:
+                    self._active.discard(pattern)
+            bucket.clear()
+            self._total_errors -= self._bucket_errors[slot]
+            self._bucket_errors[slot] = 0
+        self._head = bucket_index
+
+    def _release(self, patterns: tuple[str, ...]) -> None:
+        """Decrement counts for patterns leaving the count window."""
+        for pattern in patterns:
+            self._counts[pattern] -= 1
+            if self._counts[pattern] < self.threshold:
+                self._active.discard(pattern)
+
+    def _entry_time(self, log_entry: dict) -> float:
+        """Get entry time in epoch seconds, falling back to the clock."""
+        timestamp = log_entry.get("timestamp")
+        if isinstance(timestamp, (int, float)):
+            return float(timestamp)
+        if isinstance(timestamp, str):
+            try:
+                return datetime.fromisoformat(timestamp).timestamp()
+            except ValueError:
+                pass
+        return self.clock()
+
+
 class Scanner:
-    """Scans logs to detect errors and stagnation patterns."""
+    """Scans logs to detect errors and stagnation patterns.
+
+    In compact mode results share their pieces instead of allocating them
+    per entry: patterns are interned tuples, contexts come from a bounded
+    cache keyed by source and level, and entries without an issue all get
+    the same ScanResult. With ``keep_raw_log=False`` results do not keep
+    the log entry alive, so a large batch holds only what the results need.
+    """
 
     # Known error patterns to detect
     ERROR_PATTERNS = [
@@ -39,14 +221,47 @@ class Scanner:
         "RateLimitError",
     ]
 
-    def __init__(self, stagnation_threshold: int = 3):
+    # Distinct pattern tuples and contexts shared by a compact scanner
+    SHARED_CACHE_SIZE = 4096
+
+    def __init__(
+        self,
+        stagnation_threshold: int = 3,
+        error_patterns: Optional[list[str]] = None,
+        stagnation_window_seconds: float = 300.0,
+        stagnation_window_size: Optional[int] = None,
+        compact: bool = False,
+        keep_raw_log: bool = True,
+    ):
         """Initialize scanner.
 
         Args:
             stagnation_threshold: Number of repeated errors to consider stagnation.
+            error_patterns: Patterns to detect; defaults to ERROR_PATTERNS.
+            stagnation_window_seconds: Time window for incremental stagnation
+                detection in ``observe``.
+            stagnation_window_size: If given, use a count window of this many
+                error entries for ``observe`` instead of the time window.
+            compact: Return results with shared, immutable patterns and
+                contexts.
+            keep_raw_log: Keep a reference to the log entry in
+                ``ScanResult.raw_log``.
         """
+        self.compact = compact
+        self.keep_raw_log = keep_raw_log
+        self._pattern_tuples: dict[tuple[str, ...], tuple[str, ...]] = {}
+        self._contexts: dict[tuple, dict] = {}
+        self._clean = ScanResult(has_issue=False)
         self.stagnation_threshold = stagnation_threshold
-        self._error_history: list[str] = []
+        self.stagnation_detector = StagnationDetector(
+            self.STAGNATION_PATTERNS,
+            threshold=stagnation_threshold,
+            window_seconds=stagnation_window_seconds,
+            window_size=stagnation_window_size,
+        )
+        self._matcher = PatternMatcher(
+            self.ERROR_PATTERNS if error_patterns is None else error_patterns
+        )
 
     def scan(self, log_entry: dict) -> ScanResult:
         """Scan a single log entry for issues.
@@ -60,6 +275,7 @@ class Scanner:
         level = log_entry.get("level", "").upper()
         message = log_entry.get("message", "")
         source = log_entry.get("source", "")
+        raw_log = log_entry if self.keep_raw_log else None
 
         # Check for error level
         if level == "ERROR":
@@ -67,9 +283,9 @@ class Scanner:
             return ScanResult(
                 has_issue=True,
                 issue_type="error",
-                patterns=patterns,
-                context={"source": source, "level": level},
-                raw_log=log_entry,
+                patterns=self._pattern_tuple(patterns) if self.compact else patterns,
+                context=self._context(source, level),
+                raw_log=raw_log,
             )
 
         # Check for warning with known patterns
@@ -79,17 +295,43 @@ class Scanner:
                 return ScanResult(
                     has_issue=True,
                     issue_type="warning",
-                    patterns=patterns,
-                    context={"source": source, "level": level},
-                    raw_log=log_entry,
+                    patterns=self._pattern_tuple(patterns) if self.compact else patterns,
+                    context=self._context(source, level),
+                    raw_log=raw_log,
                 )
 
         # No issue detected
+        if self.compact and raw_log is None:
+            return self._clean
         return ScanResult(
             has_issue=False,
-            raw_log=log_entry,
+            raw_log=raw_log,
         )
 
+    async def scan_stream(self, log_entries: AsyncIterable[dict]) -> AsyncIterator[ScanResult]:
+        """Scan log entries from an async source one at a time.
+
+        Args:
+            log_entries: Async iterable of log entries.
+
+        Yields:
+            ScanResult for each entry, in input order.
+        """
+        async for log_entry in log_entries:
+            yield self.scan(log_entry)
+
+    def observe(self, log_entry: dict) -> ScanResult:
+        """Feed one log entry into the incremental stagnation detector.
+
+        Args:
+            log_entry: Log entry to record.
+
+        Returns:
+            Stagnation ScanResult as soon as a pattern crosses the threshold
+            within the window, otherwise a ScanResult without an issue.
+        """
+        return self.stagnation_detector.observe(log_entry)
+
     def detect_stagnation(self, logs: list[dict]) -> ScanResult:
         """Detect stagnation patterns from multiple log entries.
 
@@ -132,8 +374,35 @@ class Scanner:
         Returns:
             List of detected patterns.
         """
-        patterns = []
-        for pattern in self.ERROR_PATTERNS:
-            if pattern in message:
-                patterns.append(pattern)
-        return patterns
+        return self._matcher.find_all(message)
+
+    def _context(self, source: str, level: str) -> dict:
+        """Build the context of an issue, shared between results if compact.
+
+        Only string sources and levels are shared; any other value (a dict
+        source, say) gets a context of its own, as in non-compact mode.
+        """
+        if not self.compact or type(source) is not str or type(level) is not str:
+            return {"source": source, "level": level}
+        key = (source, level)
+        context = self._contexts.get(key)
+        if context is None:
+            context = {"source": _intern(source), "level": sys.intern(level)}
+            if len(self._contexts) < self.SHARED_CACHE_SIZE:
+                self._contexts[key] = context
+        return context
+
+    def _pattern_tuple(self, patterns: list[str]) -> tuple[str, ...]:
+        """Return patterns as a tuple shared by results with the same patterns."""
+        key = tuple(patterns)
+        shared = self._pattern_tuples.get(key)
+        if shared is None:
+            shared = key
+            if len(self._pattern_tuples) < self.SHARED_CACHE_SIZE:
+                self._pattern_tuples[key] = key
+        return shared
+
+
+def _intern(value: object) -> object:
+    """Intern strings; other values are returned unchanged."""
+    return sys.intern(value) if type(value) is str else value
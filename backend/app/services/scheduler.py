@@ -0,0 +1,155 @@
+"""Priority scheduler for evolution signals."""
+import heapq
+import itertools
+import queue
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Optional
+
+from app.services.signal import EvolutionSignal
+
+
+class SignalScheduler:
+    """Bounded priority queue of evolution signals with aging.
+
+    Signals are served highest priority first. A waiting signal gains
+    ``aging_rate`` priority points per second, so low-priority work is
+    eventually served even under a steady stream of high-priority signals.
+    Because every entry ages at the same rate, the aged ordering equals
+    ordering by ``priority - aging_rate * enqueued_at``, which is fixed at
+    insertion time and can be kept in a plain heap. Ties are served FIFO.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        aging_rate: float = 0.1,
+        clock: Callable[[], float] = time.monotonic,
+        wait_samples: int = 1024,
+    ):
+        """Initialize scheduler.
+
+        Args:
+            max_size: Maximum number of queued signals; ``put`` blocks when full.
+            aging_rate: Priority points a signal gains per second of waiting.
+            clock: Time source.
+            wait_samples: Number of recent wait times kept for percentiles.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self.max_size = max_size
+        self.aging_rate = aging_rate
+        self.clock = clock
+        self._heap: list[tuple[float, int, float, Any]] = []
+        self._sequence = itertools.count()
+        self._closed = False
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+        self.enqueued = 0
+        self.dequeued = 0
+        self.max_depth = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._wait_samples: deque[float] = deque(maxlen=wait_samples)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._heap)
+
+    def put(self, signal: EvolutionSignal, item: Any, timeout: Optional[float] = None) -> None:
+        """Queue an item under the priority of its signal.
+
+        Args:
+            signal: Signal whose priority orders the item.
+            item: Work item handed to ``get`` callers; must not be None.
+            timeout: Seconds to wait for space; waits forever if None.
+
+        Raises:
+            queue.Full: If no space became available within the timeout.
+            RuntimeError: If the scheduler is closed.
+        """
+        with self._not_full:
+            if not self._not_full.wait_for(
+                lambda: self._closed or len(self._heap) < self.max_size, timeout
+            ):
+                raise queue.Full
+            if self._closed:
+                raise RuntimeError("Scheduler is closed")
+
+            now = self.clock()
+            key = -(signal.priority - self.aging_rate * now)
+            heapq.heappush(self._heap, (key, next(self._sequence), now, item))
+            self.enqueued += 1
+            self.max_depth = max(self.max_depth, len(self._heap))
+            self._not_empty.notify()
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Any]:
+        """Take the most urgent item, waiting if the queue is empty.
+
+        Args:
+            timeout: Seconds to wait for an item; waits forever if None.
+
+        Returns:
+            The next item, or None once the scheduler is closed and drained.
+
+        Raises:
+            queue.Empty: If no item arrived within the timeout.
+        """
+        with self._not_empty:
+            if not self._not_empty.wait_for(lambda: self._closed or self._heap, timeout):
+                raise queue.Empty
+            if not self._heap:
+                return None
+
+            _, _, enqueued_at, item = heapq.heappop(self._heap)
+            wait = self.clock() - enqueued_at
+            self.dequeued += 1
+            self._wait_total += wait
+            self._wait_max = max(self._wait_max, wait)
+            self._wait_samples.append(wait)
+            self._not_full.notify()
+            return item
+
+    def close(self) -> None:
+        """Stop accepting items; ``get`` returns None once drained."""
+        with self._lock:
+            self._closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+
+    def reopen(self) -> None:
+        """Accept items again after ``close``."""
+        with self._lock:
+            self._closed = False
+
+    def stats(self) -> dict:
+        """Return queue depth and wait-time statistics.
+
+        Returns:
+            Dictionary with current and maximum depth, enqueue/dequeue counts
+            and mean, p50, p99 and max wait in milliseconds.
+        """
+        with self._lock:
+            samples = sorted(self._wait_samples)
+            depth = len(self._heap)
+            mean = self._wait_total / self.dequeued if self.dequeued else 0.0
+
+        def percentile(fraction: float) -> float:
+            if not samples:
+                return 0.0
+            return samples[min(len(samples) - 1, int(fraction * len(samples)))]
+
+        return {
+            "depth": depth,
+            "max_depth": self.max_depth,
+            "enqueued": self.enqueued,
+            "dequeued": self.dequeued,
+            "wait_ms_mean": mean * 1000,
+            "wait_ms_p50": percentile(0.50) * 1000,
+            "wait_ms_p99": percentile(0.99) * 1000,
+            "wait_ms_max": self._wait_max * 1000,
+        }
@@ -1,22 +1,28 @@
 """Signal generation service."""
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Optional, Sequence
 
 from app.services.scanner import ScanResult
 
 
-@dataclass
+@dataclass(slots=True)
 class EvolutionSignal:
     """Signal for evolution action."""
     signal_type: str  # repair, improve, innovate
-    patterns: list[str] = field(default_factory=list)
+    patterns: Sequence[str] = field(default_factory=list)
     context: dict = field(default_factory=dict)
     priority: int = 1
     source: Optional[str] = None
+    occurrences: int = 1
 
 
 class SignalGenerator:
-    """Generates evolution signals from scan results."""
+    """Generates evolution signals from scan results.
+
+    By default each signal gets its own copy of the scan result's patterns
+    and context. Compact generators share them instead, with patterns as
+    an immutable tuple, for use with a compact ``Scanner``.
+    """
 
     # Priority mappings
     PRIORITY_MAP = {
@@ -32,6 +38,14 @@ class SignalGenerator:
         "warning": "improve",
     }
 
+    def __init__(self, compact: bool = False):
+        """Initialize generator.
+
+        Args:
+            compact: Share patterns and context with the scan result.
+        """
+        self.compact = compact
+
     def generate(self, scan_result: ScanResult) -> EvolutionSignal:
         """Generate an evolution signal from a scan result.
 
@@ -57,10 +71,16 @@ class SignalGenerator:
         if "TimeoutError" in scan_result.patterns:
             priority += 1
 
+        if self.compact:
+            # tuple() returns an existing tuple itself
+            patterns, context = tuple(scan_result.patterns), scan_result.context
+        else:
+            patterns, context = list(scan_result.patterns), scan_result.context.copy()
+
         return EvolutionSignal(
             signal_type=signal_type,
-            patterns=scan_result.patterns.copy(),
-            context=scan_result.context.copy(),
+            patterns=patterns,
+            context=context,
             priority=min(priority, 10),  # Cap at 10
             source=scan_result.context.get("source"),
         )
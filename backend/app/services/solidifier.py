@@ -1,14 +1,19 @@
 """Solidifier service for creating genes from validated mutations."""
 import hashlib
-from datetime import datetime
 from typing import Optional
 
 from app.services.mutator import MutationResult
 from app.services.validator import ValidationResult
+from app.services.gene_index import action_tag, target_tag
 
 
 class Solidifier:
-    """Solidifies validated mutations into genes."""
+    """Solidifies validated mutations into genes.
+
+    Genes are content addressed: the ID and the default name both derive
+    from a hash of the code and prompt, so every worker solidifies the same
+    mutation into the same gene.
+    """
 
     def __init__(self, prefix: str = "auto"):
         """Initialize solidifier.
@@ -17,7 +22,6 @@ class Solidifier:
             prefix: Prefix for auto-generated gene names.
         """
         self.prefix = prefix
-        self._counter = 0
 
     def solidify(
         self,
@@ -38,15 +42,14 @@ class Solidifier:
         if not mutation.success or not validation.passed:
             return None
 
-        # Generate unique name if not provided
-        if not name:
-            self._counter += 1
-            name = f"{self.prefix}_gene_{self._counter}_{datetime.now().strftime('%Y%m%d%H%M%S')}"
-
         # Generate ID from content hash
         content = (mutation.code or "") + (mutation.prompt or "")
         gene_id = hashlib.sha256(content.encode()).hexdigest()[:16]
 
+        # Name derives from content too, so repeats are idempotent
+        if not name:
+            name = f"{self.prefix}_gene_{gene_id}"
+
         # Create gene data
         gene_data = {
             "id": f"gene_{gene_id}",
@@ -57,6 +60,7 @@ class Solidifier:
             "status": "validated",
             "success_rate": self._calculate_success_rate(validation),
             "context_tags": self._extract_tags(mutation),
+            "cost_profile": self._cost_profile(validation),
         }
 
         return gene_data
@@ -79,6 +83,24 @@ class Solidifier:
 
         return passed / total if total > 0 else 0.0
 
+    def _cost_profile(self, validation: ValidationResult) -> dict:
+        """Collect the resource usage measured during validation.
+
+        Args:
+            validation: Validation result.
+
+        Returns:
+            Dictionary of wall and CPU time, peak memory and executed lines;
+            metrics the validator did not measure are omitted.
+        """
+        profile = {
+            "execution_time_ms": validation.execution_time_ms,
+            "cpu_time_ms": validation.cpu_time_ms,
+            "peak_memory_bytes": validation.peak_memory_bytes,
+            "lines_executed": validation.lines_executed,
+        }
+        return {key: value for key, value in profile.items() if value is not None}
+
     def _extract_tags(self, mutation: MutationResult) -> list[str]:
         """Extract context tags from mutation.
 
@@ -96,6 +118,12 @@ class Solidifier:
         if mutation.prompt:
             tags.append("prompt")
 
+        if mutation.target:
+            tags.append(target_tag(mutation.target))
+
+        if mutation.action:
+            tags.append(action_tag(mutation.action))
+
         # Extract from description
         desc_lower = mutation.description.lower()
         if "fix" in desc_lower or "repair" in desc_lower:
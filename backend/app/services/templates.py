@@ -0,0 +1,360 @@
+"""Compiled mutation templates with typed parameters."""
+import logging
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import MutationTemplate
+
+logger = logging.getLogger(__name__)
+
+# Placeholders look like ${name}; plain braces are left alone for code
+PLACEHOLDER = re.compile(r"\$\{(\w+)\}")
+
+# Parameter types a template may declare
+PARAM_TYPES = {"int": int, "float": float, "str": str}
+
+
+@dataclass(frozen=True)
+class TemplateParam:
+    """A typed template parameter."""
+    name: str
+    type: type
+    default: Any
+
+    def coerce(self, value: Any) -> Any:
+        """Convert a context value to the parameter type.
+
+        Raises:
+            ValueError: If the value cannot be converted.
+        """
+        if type(value) is self.type:
+            return value
+        if isinstance(value, bool) or value is None:
+            raise ValueError(f"Invalid value for {self.name}: {value!r}")
+        try:
+            return self.type(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid value for {self.name}: {value!r}") from None
+
+
+@dataclass
+class CompiledTemplate:
+    """A template parsed once into a %-format string.
+
+    Literal ``%`` characters are escaped and every ``${name}`` placeholder
+    becomes a ``%s`` slot, so rendering is a single C-level format call.
+    """
+    template_id: str
+    source: str
+    kind: str = "code"
+    description: str = ""
+    params: tuple[TemplateParam, ...] = ()
+    version: int = 0
+    _format: str = field(default="", repr=False)
+    _slots: tuple[int, ...] = field(default=(), repr=False)
+
+    @classmethod
+    def compile(
+        cls,
+        template_id: str,
+        source: str,
+        params: Optional[dict[str, dict]] = None,
+        kind: str = "code",
+        description: str = "",
+        version: int = 0,
+    ) -> "CompiledTemplate":
+        """Parse a template source.
+
+        Args:
+            template_id: Registry key of the template.
+            source: Template text with ``${name}`` placeholders.
+            params: Parameter declarations, ``{name: {"type": "int",
+                "default": 3}}``; undeclared placeholders are strings
+                without a default.
+            kind: "code" or "prompt".
+            description: Description of the mutations it produces.
+            version: Registry version, part of render cache keys.
+
+        Returns:
+            The compiled template.
+
+        Raises:
+            ValueError: If a parameter type is unknown.
+        """
+        declared = params or {}
+        names: list[str] = []
+        for name in PLACEHOLDER.findall(source):
+            if name not in names:
+                names.append(name)
+        for name in declared:
+            if name not in names:
+                names.append(name)
+
+        compiled_params = []
+        for name in names:
+            spec = declared.get(name, {})
+            type_name = spec.get("type", "str")
+            if type_name not in PARAM_TYPES:
+                raise ValueError(f"Unknown parameter type for {name}: {type_name}")
+            compiled_params.append(TemplateParam(name, PARAM_TYPES[type_name], spec.get("default")))
+
+        position = {name: i for i, name in enumerate(names)}
+        slots = []
+        pieces = []
+        last = 0
+        for match in PLACEHOLDER.finditer(source):
+            pieces.append(source[last:match.start()].replace("%", "%%"))
+            pieces.append("%s")
+            slots.append(position[match.group(1)])
+            last = match.end()
+        pieces.append(source[last:].replace("%", "%%"))
+
+        return cls(
+            template_id=template_id,
+            source=source,
+            kind=kind,
+            description=description,
+            params=tuple(compiled_params),
+            version=version,
+            _format="".join(pieces),
+            _slots=tuple(slots),
+        )
+
+    def bind(self, context: Optional[dict] = None) -> tuple:
+        """Resolve parameter values from a context.
+
+        Args:
+            context: Values by parameter name; missing ones use defaults.
+
+        Returns:
+            Parameter values in declaration order.
+
+        Raises:
+            ValueError: If a value is invalid or a parameter has no value.
+        """
+        context = context or {}
+        values = []
+        for param in self.params:
+            value = context.get(param.name, param.default)
+            if value is None:
+                raise ValueError(f"Missing value for {param.name}")
+            values.append(param.coerce(value))
+        return tuple(values)
+
+    def render_values(self, values: tuple) -> str:
+        """Render bound parameter values.
+
+        Code templates render every value as a Python literal, so a string
+        taken from a log cannot inject code; prompt templates insert
+        strings verbatim.
+        """
+        literal = repr if self.kind == "code" else self._literal
+        return self._format % tuple(literal(values[slot]) for slot in self._slots)
+
+    def render(self, context: Optional[dict] = None) -> str:
+        """Render the template from a context."""
+        return self.render_values(self.bind(context))
+
+    @staticmethod
+    def _literal(value: Any) -> str:
+        # Prompt values: numbers render as literals, strings verbatim
+        return value if isinstance(value, str) else repr(value)
+
+
+class TemplateRegistry:
+    """Thread-safe registry of compiled templates with a render cache.
+
+    Renders are cached by template id, template version and bound
+    parameter values. Re-registering a template bumps its version, so
+    cached renders of the old source are never served again; they age out
+    of the LRU. Templates stored in the database can be loaded and
+    re-loaded at runtime with ``load``.
+    """
+
+    def __init__(self, cache_size: int = 4096):
+        """Initialize registry.
+
+        Args:
+            cache_size: Maximum number of cached renders.
+        """
+        if cache_size < 1:
+            raise ValueError("cache_size must be at least 1")
+
+        self.cache_size = cache_size
+        self._templates: dict[str, CompiledTemplate] = {}
+        self._builtins: dict[str, dict] = {}
+        self._loaded: dict[str, Any] = {}
+        self._cache: OrderedDict[tuple, str] = OrderedDict()
+        self._version = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, template_id: str) -> bool:
+        return template_id in self._templates
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        state["_cache"] = OrderedDict()  # renders are cheap to rebuild
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def register(
+        self,
+        template_id: str,
+        source: str,
+        params: Optional[dict[str, dict]] = None,
+        kind: str = "code",
+        description: str = "",
+        builtin: bool = False,
+    ) -> CompiledTemplate:
+        """Compile and register a template, replacing any previous version.
+
+        Args:
+            template_id: Registry key, e.g. ``fix:database_connection``.
+            source: Template text with ``${name}`` placeholders.
+            params: Parameter declarations, see ``CompiledTemplate.compile``.
+            kind: "code" or "prompt".
+            description: Description of the mutations it produces.
+            builtin: Remember the template as the fallback restored when a
+                database override is removed.
+
+        Returns:
+            The compiled template.
+        """
+        spec = {"source": source, "params": params, "kind": kind, "description": description}
+        with self._lock:
+            self._version += 1
+            template = CompiledTemplate.compile(template_id, version=self._version, **spec)
+            self._templates[template_id] = template
+            if builtin:
+                self._builtins[template_id] = spec
+        return template
+
+    def register_default(self, template_id: str, source: str, **kwargs: Any) -> None:
+        """Register a built-in template unless one is already registered."""
+        if template_id not in self._templates:
+            self.register(template_id, source, builtin=True, **kwargs)
+        else:
+            self._builtins.setdefault(template_id, {"source": source, **kwargs})
+
+    def unregister(self, template_id: str) -> None:
+        """Remove a template if present."""
+        with self._lock:
+            self._templates.pop(template_id, None)
+            self._builtins.pop(template_id, None)
+
+    def get(self, template_id: str) -> Optional[CompiledTemplate]:
+        """Return a compiled template, or None."""
+        return self._templates.get(template_id)
+
+    def render(self, template_id: str, context: Optional[dict] = None) -> str:
+        """Render a template with parameters taken from a context.
+
+        Args:
+            template_id: Registry key of the template.
+            context: Values by parameter name, e.g. ``Intent.context``.
+
+        Returns:
+            Rendered text.
+
+        Raises:
+            KeyError: If the template is not registered.
+            ValueError: If a parameter value is invalid or missing.
+        """
+        template = self._templates[template_id]
+        values = template.bind(context)
+        key = (template_id, template.version, values)
+        with self._lock:
+            rendered = self._cache.get(key)
+            if rendered is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return rendered
+            self.misses += 1
+
+        rendered = template.render_values(values)
+        with self._lock:
+            self._cache[key] = rendered
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return rendered
+
+    def cache_info(self) -> dict:
+        """Return render cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, current size and maximum size.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._cache),
+                "max_size": self.cache_size,
+            }
+
+    async def load(self, session: AsyncSession) -> int:
+        """Sync templates with the database.
+
+        Rows that are new or changed since the last load are recompiled.
+        A row that does not compile is logged and skipped, keeping the
+        version already registered, until the row changes again. Templates
+        whose rows were deleted revert to their built-in version, or are
+        removed if they have none.
+
+        Args:
+            session: Database session.
+
+        Returns:
+            Number of templates added, changed or removed.
+        """
+        result = await session.execute(select(MutationTemplate))
+        rows = result.scalars().all()
+
+        changed = 0
+        seen = set()
+        for row in rows:
+            seen.add(row.id)
+            if self._loaded.get(row.id) == row.updated_at:
+                continue
+            self._loaded[row.id] = row.updated_at
+            try:
+                self.register(
+                    row.id,
+                    row.source,
+                    params=row.params,
+                    kind=row.kind,
+                    description=row.description or "",
+                )
+            except (AttributeError, TypeError, ValueError) as e:
+                logger.warning("Skipping invalid mutation template %s: %s", row.id, e)
+                continue
+            changed += 1
+
+        for template_id in set(self._loaded) - seen:
+            del self._loaded[template_id]
+            builtin = self._builtins.get(template_id)
+            if builtin is not None:
+                self.register(template_id, builtin=True, **builtin)
+            else:
+                self.unregister(template_id)
+            changed += 1
+        return changed
+
+
+# Process-wide registry shared by mutators and refreshed from the database
+template_registry = TemplateRegistry()
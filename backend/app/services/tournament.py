@@ -0,0 +1,119 @@
+"""Mutation tournament: validate several candidates and keep the fittest."""
+from dataclasses import dataclass
+from typing import Optional
+
+from app.services.mutator import MutationResult
+from app.services.validator import ValidationResult, Validator
+
+
+@dataclass
+class Candidate:
+    """A mutation candidate with its validation and fitness score."""
+    mutation: MutationResult
+    validation: ValidationResult
+    fitness: float = 0.0
+    cost: float = 0.0
+
+
+class Tournament:
+    """Validates mutation candidates together and scores them.
+
+    Fitness is the test pass rate; a candidate that fails validation scores
+    0. Execution cost only breaks ties between equally fit candidates, so a
+    cheaper variant never beats one that passes more tests. Among variants
+    that pass the same tests the cheapest wins, e.g. the fewest retries, so
+    requirements such as how many failures a fix must survive belong in the
+    tests. Cost is the number of executed lines, which ranks candidates the
+    same on every run; candidates without a line count fall back to CPU time.
+
+    Only mutations that carry tests can be told apart: code without tests
+    is merely executed, which for a module of definitions costs the same
+    for every candidate, so all of them score alike and the first wins.
+
+    Code candidates are validated with ``Validator.validate_many``, so with a
+    sandbox pool of at least ``size`` workers the tournament takes about as
+    long as its slowest candidate.
+    """
+
+    def __init__(self, validator: Optional[Validator] = None, size: int = 4):
+        """Initialize tournament.
+
+        Args:
+            validator: Validator for the candidates; defaults to the one
+                passed to ``run``, such as the GEP loop's.
+            size: Number of candidates to generate per intent.
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1")
+
+        self.validator = validator
+        self.size = size
+
+    def run(self, mutations: list[MutationResult], validator: Optional[Validator] = None) -> list[Candidate]:
+        """Validate and score mutation candidates.
+
+        Args:
+            mutations: Candidates to compare.
+            validator: Validator to use if the tournament has none; an
+                in-process Validator counting executed lines if neither
+                is given.
+
+        Returns:
+            Candidates in the order given, each with its validation and fitness.
+        """
+        validator = self.validator or validator or Validator(measure=True)
+        validations: list[Optional[ValidationResult]] = [None] * len(mutations)
+        code_indexes = [i for i, mutation in enumerate(mutations) if mutation.code]
+        code_results = validator.validate_many(
+            [mutations[i].code for i in code_indexes],
+            [mutations[i].tests for i in code_indexes],
+        )
+        for i, result in zip(code_indexes, code_results):
+            validations[i] = result
+
+        for i, mutation in enumerate(mutations):
+            if validations[i] is not None:
+                continue
+            if mutation.prompt:
+                validations[i] = validator.validate_prompt(mutation.prompt)
+            else:
+                validations[i] = ValidationResult(passed=False, error="No code or prompt to validate")
+
+        return [
+            Candidate(
+                mutation=mutation,
+                validation=validation,
+                fitness=self.fitness(validation),
+                cost=self.cost(validation),
+            )
+            for mutation, validation in zip(mutations, validations)
+        ]
+
+    @staticmethod
+    def best(candidates: list[Candidate]) -> Candidate:
+        """Return the fittest candidate, then the cheapest; ties go to the earliest."""
+        return max(candidates, key=lambda candidate: (candidate.fitness, -candidate.cost))
+
+    @staticmethod
+    def cost(validation: ValidationResult) -> float:
+        """Return the execution cost of a validation."""
+        if validation.lines_executed is not None:
+            return float(validation.lines_executed)
+        return validation.cpu_time_ms or 0.0
+
+    @staticmethod
+    def fitness(validation: ValidationResult) -> float:
+        """Score a candidate.
+
+        Args:
+            validation: Validation of the candidate.
+
+        Returns:
+            Fitness between 0 and 1.
+        """
+        if not validation.passed:
+            return 0.0
+        if not validation.test_results:
+            return 1.0
+        passed = sum(1 for test in validation.test_results if test.get("passed"))
+        return passed / len(validation.test_results)
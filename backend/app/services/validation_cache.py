@@ -0,0 +1,219 @@
+"""Content-addressed cache of validation results."""
+import dataclasses
+import hashlib
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from app.services.validator import (
+    SANDBOX_CRASH,
+    SANDBOX_ERROR,
+    VALIDATOR_VERSION,
+    ValidationResult,
+)
+
+
+def validation_key(
+    kind: str,
+    code: str,
+    tests: Optional[list[str]] = None,
+    measured: bool = False,
+) -> str:
+    """Compute the cache key of a validation job.
+
+    Args:
+        kind: Validation kind ("code" or "tests").
+        code: Code under validation.
+        tests: Test snippets, if any.
+        measured: Whether the result records peak memory and executed lines.
+
+    Returns:
+        SHA-256 hex digest of the validator version, kind, code and tests.
+    """
+    job = [VALIDATOR_VERSION, kind, code, tests or []]
+    if measured:
+        job.append("measured")
+    payload = json.dumps(job, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _sandbox_failed(result: ValidationResult) -> bool:
+    """Whether a result reports a sandbox failure rather than the code's."""
+    return result.error is not None and result.error.startswith((SANDBOX_ERROR, SANDBOX_CRASH))
+
+
+class SQLiteCacheStore:
+    """On-disk tier for ValidationCache backed by a SQLite file."""
+
+    def __init__(self, path: str):
+        """Open or create the store.
+
+        Args:
+            path: SQLite database file path.
+        """
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS validation_results "
+                "(key TEXT PRIMARY KEY, result TEXT NOT NULL)"
+            )
+
+    def get(self, key: str) -> Optional[dict]:
+        """Load a stored result, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result FROM validation_results WHERE key = ?", (key,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set(self, key: str, result: dict) -> None:
+        """Store a result."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO validation_results (key, result) VALUES (?, ?)",
+                (key, json.dumps(result)),
+            )
+
+    def delete(self, key: str) -> None:
+        """Remove a stored result."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM validation_results WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        """Remove all stored results."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM validation_results")
+
+    def close(self) -> None:
+        """Close the database file."""
+        with self._lock:
+            self._conn.close()
+
+
+class ValidationCache:
+    """Bounded LRU of validation results keyed by content hash.
+
+    Results are keyed by ``validation_key`` so identical code and tests are
+    validated once per validator version. An optional persistent store acts
+    as a second tier that survives restarts. Timed-out results and sandbox
+    failures (a crashed worker, a MemoryError in the worker) are never
+    cached since they depend on load rather than content.
+    """
+
+    # Key function, exposed so callers need not import this module
+    key = staticmethod(validation_key)
+
+    def __init__(self, max_entries: int = 4096, store: Optional[SQLiteCacheStore] = None):
+        """Initialize cache.
+
+        Args:
+            max_entries: Maximum results kept in memory.
+            store: Optional persistent second tier.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.max_entries = max_entries
+        self.store = store
+        self._entries: OrderedDict[str, ValidationResult] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.store_hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[ValidationResult]:
+        """Look up a result.
+
+        Args:
+            key: Validation key.
+
+        Returns:
+            A copy of the cached result, or None.
+        """
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._copy(result)
+
+        stored = self.store.get(key) if self.store is not None else None
+        with self._lock:
+            if stored is None:
+                self.misses += 1
+                return None
+            result = ValidationResult(**stored)
+            self.store_hits += 1
+            self._remember(key, result)
+            return self._copy(result)
+
+    def put(self, key: str, result: ValidationResult) -> None:
+        """Store a result in memory and in the persistent tier.
+
+        Args:
+            key: Validation key.
+            result: Result to cache.
+        """
+        if result.timed_out or _sandbox_failed(result):
+            return
+        result = self._copy(result)
+        with self._lock:
+            self._remember(key, result)
+        if self.store is not None:
+            self.store.set(key, dataclasses.asdict(result))
+
+    def invalidate(self, key: str) -> None:
+        """Drop one result from both tiers.
+
+        Args:
+            key: Validation key, see ``validation_key``.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+        if self.store is not None:
+            self.store.delete(key)
+
+    def clear(self) -> None:
+        """Drop all results from both tiers."""
+        with self._lock:
+            self._entries.clear()
+        if self.store is not None:
+            self.store.clear()
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and size.
+
+        Returns:
+            Dictionary with memory and store hits, misses, hit rate and size.
+        """
+        with self._lock:
+            hits = self.hits + self.store_hits
+            lookups = hits + self.misses
+            return {
+                "hits": self.hits,
+                "store_hits": self.store_hits,
+                "misses": self.misses,
+                "hit_rate": hits / lookups if lookups else 0.0,
+                "size": len(self._entries),
+                "max_size": self.max_entries,
+            }
+
+    def _remember(self, key: str, result: ValidationResult) -> None:
+        """Insert into the LRU; caller holds the lock."""
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    @staticmethod
+    def _copy(result: ValidationResult) -> ValidationResult:
+        """Copy a result so callers cannot mutate cached state."""
+        return dataclasses.replace(
+            result,
+            test_results=[dict(test) for test in result.test_results],
+            timings_ms=dict(result.timings_ms),
+        )
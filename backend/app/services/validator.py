@@ -1,7 +1,27 @@
 """Validation service for sandbox execution."""
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Optional
+from functools import lru_cache
+from types import CodeType, FrameType
+from typing import TYPE_CHECKING, Any, Iterator, Optional
 import ast
+import sys
+import threading
+import time
+import tracemalloc
+
+if TYPE_CHECKING:
+    from app.services.sandbox import SandboxPool
+    from app.services.validation_cache import ValidationCache
+
+# Bump when validation semantics change so cached results are not reused
+VALIDATOR_VERSION = "3"
+
+# Error prefixes of results the sandbox produces when it, not the validated
+# code, failed; such results say nothing about the code and are not cached
+SANDBOX_ERROR = "Sandbox error"
+SANDBOX_CRASH = "Sandbox worker died"
 
 
 @dataclass
@@ -12,18 +32,362 @@ class ValidationResult:
     output: Optional[str] = None
     execution_time_ms: Optional[float] = None
     test_results: list[dict] = field(default_factory=list)
+    timed_out: bool = False
+    timings_ms: dict[str, float] = field(default_factory=dict)
+    cpu_time_ms: Optional[float] = None
+    peak_memory_bytes: Optional[int] = None
+    lines_executed: Optional[int] = None
+
+
+# Builtins available to mutation code during the restricted run
+RESTRICTED_BUILTINS = {
+    "print": print,
+    "len": len,
+    "range": range,
+    "str": str,
+    "int": int,
+    "float": float,
+    "list": list,
+    "dict": dict,
+    "True": True,
+    "False": False,
+    "None": None,
+}
+
+
+# Filenames of code objects compiled from mutation and test sources
+_COUNTED_FILES = frozenset({"<mutation>", "<test>"})
+
+# tracemalloc is process-wide; it runs while any meter is measuring and is
+# stopped afterwards only if a meter started it
+_tracemalloc_lock = threading.Lock()
+_tracemalloc_users = 0
+_started_tracemalloc = False
+
+
+def _elapsed_ms(start: float) -> float:
+    return (time.perf_counter() - start) * 1000
+
+
+class _ResourceMeter:
+    """Accumulates the cost of running mutation code.
+
+    CPU time is thread time, so concurrent validations in other threads are
+    not counted. It is always recorded; peak memory and executed lines only
+    when ``full`` is set, since they need process-wide state.
+
+    Peak memory is the tracemalloc peak above the allocation level at the
+    start of each measurement; it is exact in sandbox workers and
+    approximate when several threads validate in one process. Executed
+    lines are counted by a trace function that only follows frames compiled
+    from mutation and test sources; it replaces any tracer, such as a
+    debugger's or a coverage tool's, while the code runs.
+    """
+
+    def __init__(self, full: bool = False):
+        self.full = full
+        self.cpu_ns = 0
+        self.peak_bytes = 0
+        self.lines = 0
+
+    @contextmanager
+    def measure(self) -> Iterator[None]:
+        """Measure the enclosed block and add it to the totals."""
+        if not self.full:
+            start = time.thread_time_ns()
+            try:
+                yield
+            finally:
+                self.cpu_ns += time.thread_time_ns() - start
+            return
+
+        global _tracemalloc_users, _started_tracemalloc
+        with _tracemalloc_lock:
+            if _tracemalloc_users == 0 and not tracemalloc.is_tracing():
+                tracemalloc.start()
+                _started_tracemalloc = True
+            _tracemalloc_users += 1
+            tracemalloc.reset_peak()
+            base, _ = tracemalloc.get_traced_memory()
+
+        previous_trace = sys.gettrace()
+        start = time.thread_time_ns()
+        sys.settrace(self._trace)
+        try:
+            yield
+        finally:
+            sys.settrace(previous_trace)
+            self.cpu_ns += time.thread_time_ns() - start
+            with _tracemalloc_lock:
+                _, peak = tracemalloc.get_traced_memory()
+                self.peak_bytes = max(self.peak_bytes, peak - base)
+                _tracemalloc_users -= 1
+                if _tracemalloc_users == 0 and _started_tracemalloc:
+                    tracemalloc.stop()
+                    _started_tracemalloc = False
+
+    def apply(self, result: ValidationResult) -> ValidationResult:
+        """Record the totals on a result and return it."""
+        result.cpu_time_ms = self.cpu_ns / 1_000_000
+        if self.full:
+            result.peak_memory_bytes = self.peak_bytes
+            result.lines_executed = self.lines
+        return result
+
+    def _trace(self, frame: FrameType, event: str, arg: Any) -> Optional[Any]:
+        if frame.f_code.co_filename in _COUNTED_FILES:
+            return self._count_line
+        return None
+
+    def _count_line(self, frame: FrameType, event: str, arg: Any) -> Any:
+        if event == "line":
+            self.lines += 1
+        return self._count_line
+
+
+def _compile_module(code: str, timings: dict[str, float]) -> CodeType:
+    """Parse and compile mutation code once, recording phase timings.
+
+    Raises:
+        SyntaxError: If the code does not parse.
+    """
+    start = time.perf_counter()
+    tree = ast.parse(code)
+    timings["parse"] = _elapsed_ms(start)
+
+    start = time.perf_counter()
+    compiled = compile(tree, "<mutation>", "exec")
+    timings["compile"] = _elapsed_ms(start)
+    return compiled
+
+
+@lru_cache(maxsize=4096)
+def _compile_test(test: str) -> CodeType:
+    """Compile a test snippet; identical snippets are compiled once."""
+    return compile(test, "<test>", "exec")
+
+
+@lru_cache(maxsize=256)
+def _compile_module_cached(code: str) -> CodeType:
+    """Compile mutation code for isolated test runs, once per process."""
+    return compile(code, "<mutation>", "exec")
+
+
+def _run_test(index: int, test: str, exec_globals: dict, meter: _ResourceMeter) -> dict:
+    """Run one test snippet in a namespace and describe the outcome."""
+    start = time.perf_counter()
+    try:
+        with meter.measure():
+            exec(_compile_test(test), exec_globals)
+        return {
+            "test": index,
+            "passed": True,
+            "code": test,
+            "time_ms": _elapsed_ms(start),
+        }
+    except AssertionError as e:
+        error = str(e)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    return {
+        "test": index,
+        "passed": False,
+        "error": error,
+        "code": test,
+        "time_ms": _elapsed_ms(start),
+    }
+
+
+def _run_restricted(
+    compiled: CodeType,
+    timings: dict[str, float],
+    meter: _ResourceMeter,
+) -> ValidationResult:
+    """Execute compiled code with restricted builtins."""
+    try:
+        start = time.perf_counter()
+        with meter.measure():
+            exec(compiled, {"__builtins__": dict(RESTRICTED_BUILTINS)})
+        timings["exec"] = _elapsed_ms(start)
+
+        return meter.apply(ValidationResult(
+            passed=True,
+            execution_time_ms=timings["exec"],
+            timings_ms=timings,
+        ))
+
+    except Exception as e:
+        return meter.apply(ValidationResult(
+            passed=False,
+            error=f"Execution error: {type(e).__name__}: {e}",
+            timings_ms=timings,
+        ))
+
+
+def run_code(code: str, measure: bool = False) -> ValidationResult:
+    """Check syntax and execute code with restricted builtins in this process.
+
+    Args:
+        code: Code string to validate.
+        measure: Also record peak memory and executed lines.
+
+    Returns:
+        ValidationResult with pass/fail status.
+    """
+    timings: dict[str, float] = {}
+
+    # First check syntax
+    try:
+        compiled = _compile_module(code, timings)
+    except SyntaxError as e:
+        return ValidationResult(
+            passed=False,
+            error=f"Syntax error: {e}",
+            timings_ms=timings,
+        )
+
+    # Try to execute in restricted environment
+    return _run_restricted(compiled, timings, _ResourceMeter(measure))
+
+
+def run_with_tests(code: str, tests: list[str], measure: bool = False) -> ValidationResult:
+    """Execute code and test assertions in this process.
+
+    The code is parsed and compiled once; the same code object is used for
+    the restricted run and for the test namespace.
+
+    Args:
+        code: Code string to validate.
+        tests: List of test assertions.
+        measure: Also record peak memory and executed lines.
+
+    Returns:
+        ValidationResult with test results.
+    """
+    timings: dict[str, float] = {}
+
+    # First validate basic code
+    try:
+        compiled = _compile_module(code, timings)
+    except SyntaxError as e:
+        return ValidationResult(
+            passed=False,
+            error=f"Syntax error: {e}",
+            timings_ms=timings,
+        )
+    meter = _ResourceMeter(measure)
+    base_result = _run_restricted(compiled, timings, meter)
+    if not base_result.passed:
+        return base_result
+
+    # Run tests
+    test_results = []
+    all_passed = True
+
+    try:
+        # Create execution environment with code
+        exec_globals = {
+            "__builtins__": __builtins__,
+        }
+        start = time.perf_counter()
+        with meter.measure():
+            exec(compiled, exec_globals)
+        timings["test_setup"] = _elapsed_ms(start)
+
+        # Run each test
+        tests_start = time.perf_counter()
+        for i, test in enumerate(tests):
+            test_results.append(_run_test(i + 1, test, exec_globals, meter))
+            all_passed = all_passed and test_results[-1]["passed"]
+        timings["tests"] = _elapsed_ms(tests_start)
+
+        return meter.apply(ValidationResult(
+            passed=all_passed,
+            execution_time_ms=base_result.execution_time_ms,
+            test_results=test_results,
+            timings_ms=timings,
+        ))
+
+    except Exception as e:
+        return meter.apply(ValidationResult(
+            passed=False,
+            error=f"Test execution error: {e}",
+            test_results=test_results,
+            timings_ms=timings,
+        ))
+
+
+def run_test(code: str, test: str, measure: bool = False) -> ValidationResult:
+    """Run one test against a fresh module namespace in this process.
+
+    The module code object is compiled once per process and executed into
+    a new globals dictionary for every test, so tests cannot observe each
+    other's state.
+
+    Args:
+        code: Code string under test.
+        test: Test assertion.
+        measure: Also record peak memory and executed lines.
+
+    Returns:
+        ValidationResult with a single test result.
+    """
+    timings: dict[str, float] = {}
+    meter = _ResourceMeter(measure)
+    try:
+        compiled = _compile_module_cached(code)
+    except SyntaxError as e:
+        return ValidationResult(passed=False, error=f"Syntax error: {e}")
+
+    exec_globals = {"__builtins__": __builtins__}
+    start = time.perf_counter()
+    try:
+        with meter.measure():
+            exec(compiled, exec_globals)
+    except Exception as e:
+        return meter.apply(ValidationResult(
+            passed=False,
+            error=f"Test execution error: {e}",
+        ))
+    timings["test_setup"] = _elapsed_ms(start)
+
+    test_result = _run_test(1, test, exec_globals, meter)
+    timings["tests"] = test_result["time_ms"]
+    return meter.apply(ValidationResult(
+        passed=test_result["passed"],
+        test_results=[test_result],
+        timings_ms=timings,
+    ))
 
 
 class Validator:
     """Validates mutations in a sandbox environment."""
 
-    def __init__(self, timeout_seconds: int = 5):
+    def __init__(
+        self,
+        timeout_seconds: int = 5,
+        sandbox: Optional["SandboxPool"] = None,
+        cache: Optional["ValidationCache"] = None,
+        measure: bool = False,
+    ):
         """Initialize validator.
 
         Args:
-            timeout_seconds: Maximum execution time for validation.
+            timeout_seconds: Maximum execution time for validation. Enforced
+                only when a sandbox pool is used.
+            sandbox: Optional pool of worker processes to run code in; code
+                runs in the calling process if None.
+            cache: Optional cache of results keyed by code and tests.
+            measure: Record peak memory and executed lines of validated
+                code, not just CPU time. This traces the code and starts
+                tracemalloc in whichever process runs it, so without a
+                sandbox it slows validation and suspends any debugger or
+                coverage tracer in this process while the code runs.
         """
         self.timeout_seconds = timeout_seconds
+        self.sandbox = sandbox
+        self.cache = cache
+        self.measure = measure
 
     def validate_code(self, code: str) -> ValidationResult:
         """Validate code by checking syntax and executing.
@@ -34,115 +398,176 @@ class Validator:
         Returns:
             ValidationResult with pass/fail status.
         """
-        # First check syntax
-        try:
-            ast.parse(code)
-        except SyntaxError as e:
-            return ValidationResult(
-                passed=False,
-                error=f"Syntax error: {e}",
-            )
+        return self._run("code", (code,))
 
-        # Try to execute in restricted environment
-        try:
-            import time
-            start = time.time()
-
-            # Create restricted globals
-            restricted_globals = {
-                "__builtins__": {
-                    "print": print,
-                    "len": len,
-                    "range": range,
-                    "str": str,
-                    "int": int,
-                    "float": float,
-                    "list": list,
-                    "dict": dict,
-                    "True": True,
-                    "False": False,
-                    "None": None,
-                }
-            }
+    def validate_with_tests(
+        self,
+        code: str,
+        tests: list[str],
+        isolated: bool = False,
+        test_timeout: Optional[float] = None,
+        fail_fast: bool = False,
+    ) -> ValidationResult:
+        """Validate code with test cases.
 
-            exec(code, restricted_globals)
+        By default all tests share one module namespace and run one after
+        another. In isolated mode each test runs against a fresh namespace
+        as a separate job, spread across sandbox workers when a pool is
+        configured, so one slow test does not delay the others.
 
-            execution_time = (time.time() - start) * 1000
+        Args:
+            code: Code string to validate.
+            tests: List of test assertions.
+            isolated: Run every test as its own job in a fresh namespace.
+            test_timeout: Seconds each isolated test may take; defaults to
+                ``timeout_seconds``. Enforced only when sandboxed.
+            fail_fast: In isolated mode, stop scheduling tests after the
+                first failure; tests that did not run are reported skipped.
 
-            return ValidationResult(
-                passed=True,
-                execution_time_ms=execution_time,
-            )
+        Returns:
+            ValidationResult with test results.
+        """
+        if not isolated:
+            return self._run("tests", (code, tests))
+        return self._validate_isolated(code, tests, test_timeout or self.timeout_seconds, fail_fast)
 
-        except Exception as e:
-            return ValidationResult(
-                passed=False,
-                error=f"Execution error: {type(e).__name__}: {e}",
-            )
+    def validate_many(
+        self,
+        codes: list[str],
+        tests: Optional[list[list[str]]] = None,
+    ) -> list[ValidationResult]:
+        """Validate several code strings, in parallel when sandboxed.
 
-    def validate_with_tests(self, code: str, tests: list[str]) -> ValidationResult:
-        """Validate code with test cases.
+        Args:
+            codes: Code strings to validate.
+            tests: Optional test assertions per code string; codes with
+                tests are validated with ``validate_with_tests``.
+
+        Returns:
+            ValidationResults in the same order as the codes.
+        """
+        tests = tests or [[] for _ in codes]
+        if self.sandbox is None or len(codes) < 2:
+            return list(map(self._validate_one, codes, tests))
+        with ThreadPoolExecutor(max_workers=min(len(codes), self.sandbox.size)) as executor:
+            return list(executor.map(self._validate_one, codes, tests))
+
+    def _validate_one(self, code: str, tests: list[str]) -> ValidationResult:
+        """Validate code with its tests, if any."""
+        return self.validate_with_tests(code, tests) if tests else self.validate_code(code)
+
+    def _validate_isolated(
+        self,
+        code: str,
+        tests: list[str],
+        timeout: float,
+        fail_fast: bool,
+    ) -> ValidationResult:
+        """Run each test as a separate job and merge the results.
 
         Args:
-            code: Code string to validate.
+            code: Code string under test.
             tests: List of test assertions.
+            timeout: Seconds each test may take when sandboxed.
+            fail_fast: Stop scheduling tests after the first failure.
 
         Returns:
-            ValidationResult with test results.
+            ValidationResult with one test result per test, in order.
         """
-        # First validate basic code
-        base_result = self.validate_code(code)
+        base_result = self._run("code", (code,))
         if not base_result.passed:
             return base_result
 
-        # Run tests
+        start = time.perf_counter()
+        results: list[Optional[ValidationResult]] = [None] * len(tests)
+        if self.sandbox is None or len(tests) < 2:
+            for i, test in enumerate(tests):
+                results[i] = self._run("test", (code, test), timeout)
+                if fail_fast and not results[i].passed:
+                    break
+        else:
+            workers = min(len(tests), self.sandbox.size)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(self._run, "test", (code, test), timeout): i
+                    for i, test in enumerate(tests)
+                }
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+                    if fail_fast and not future.result().passed:
+                        executor.shutdown(wait=True, cancel_futures=True)
+                        break
+                for future, i in futures.items():
+                    if future.done() and not future.cancelled():
+                        results[i] = future.result()
+
+        timings = dict(base_result.timings_ms)
+        timings["tests"] = _elapsed_ms(start)
         test_results = []
-        all_passed = True
+        for i, (test, result) in enumerate(zip(tests, results), 1):
+            if result is None:
+                test_results.append({
+                    "test": i,
+                    "passed": False,
+                    "error": "Skipped after an earlier failure",
+                    "code": test,
+                    "skipped": True,
+                })
+            elif result.test_results:
+                test_results.append({**result.test_results[0], "test": i})
+            else:
+                test_results.append({
+                    "test": i,
+                    "passed": False,
+                    "error": result.error,
+                    "code": test,
+                    "timed_out": result.timed_out,
+                })
 
-        try:
-            # Create execution environment with code
-            exec_globals = {
-                "__builtins__": __builtins__,
-            }
-            exec(code, exec_globals)
+        ran = [base_result] + [result for result in results if result is not None]
+        return ValidationResult(
+            passed=all(test["passed"] for test in test_results),
+            execution_time_ms=base_result.execution_time_ms,
+            test_results=test_results,
+            timed_out=any(result.timed_out for result in ran),
+            timings_ms=timings,
+            cpu_time_ms=sum(result.cpu_time_ms or 0.0 for result in ran),
+            peak_memory_bytes=max(result.peak_memory_bytes or 0 for result in ran),
+            lines_executed=sum(result.lines_executed or 0 for result in ran),
+        )
 
-            # Run each test
-            for i, test in enumerate(tests):
-                try:
-                    exec(test, exec_globals)
-                    test_results.append({
-                        "test": i + 1,
-                        "passed": True,
-                        "code": test,
-                    })
-                except AssertionError as e:
-                    all_passed = False
-                    test_results.append({
-                        "test": i + 1,
-                        "passed": False,
-                        "error": str(e),
-                        "code": test,
-                    })
-                except Exception as e:
-                    all_passed = False
-                    test_results.append({
-                        "test": i + 1,
-                        "passed": False,
-                        "error": f"{type(e).__name__}: {e}",
-                        "code": test,
-                    })
+    def _run(self, kind: str, args: tuple, timeout: Optional[float] = None) -> ValidationResult:
+        """Run a validation job through the cache and sandbox, if configured.
 
-            return ValidationResult(
-                passed=all_passed,
-                test_results=test_results,
-            )
+        Args:
+            kind: "code", "tests" or "test".
+            args: Job arguments, (code,), (code, tests) or (code, test).
+            timeout: Seconds the job may take when sandboxed; defaults to
+                ``timeout_seconds``.
 
-        except Exception as e:
-            return ValidationResult(
-                passed=False,
-                error=f"Test execution error: {e}",
-                test_results=test_results,
-            )
+        Returns:
+            ValidationResult of the job.
+        """
+        key = None
+        if self.cache is not None:
+            key = self.cache.key(kind, *args, measured=self.measure)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        args = (*args, self.measure)
+        if self.sandbox is not None:
+            result = self.sandbox.run(kind, args, timeout or self.timeout_seconds)
+        elif kind == "code":
+            result = run_code(*args)
+        elif kind == "test":
+            result = run_test(*args)
+        else:
+            result = run_with_tests(*args)
+
+        if key is not None:
+            self.cache.put(key, result)
+        return result
 
     def validate_prompt(self, prompt: str) -> ValidationResult:
         """Validate a prompt template.
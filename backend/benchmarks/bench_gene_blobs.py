@@ -0,0 +1,87 @@
+"""Benchmark content-addressed gene text: storage and list scans.
+
+Solidifies many genes that share a few implementation bodies, as error
+storms do, into a file-backed SQLite database. Run from the backend
+directory:
+
+    python -m benchmarks.bench_gene_blobs
+"""
+import asyncio
+import os
+import tempfile
+import time
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import selectinload
+
+from app.models import Base, Blob, Gene
+from app.services.gene_store import GeneWriter
+
+GENES = 10_000
+BODIES = 5
+BODY_LINES = 60
+PAGE = 100
+
+
+def _make_genes() -> list[dict]:
+    bodies = [
+        "".join(f"def step_{b}_{i}(value):\n    return value + {i}\n" for i in range(BODY_LINES))
+        for b in range(BODIES)
+    ]
+    return [
+        {
+            "id": f"gene_{i:08d}",
+            "name": f"auto_gene_{i:08d}",
+            "description": "Generated fix",
+            "implementation": bodies[i % BODIES],
+            "status": "validated",
+            "success_rate": 1.0,
+            "context_tags": ["auto-generated", "code"],
+        }
+        for i in range(GENES)
+    ]
+
+
+async def _scan(session: AsyncSession, with_text: bool) -> float:
+    query = select(Gene)
+    if with_text:
+        query = query.options(selectinload(Gene.implementation_blob))
+    start = time.perf_counter()
+    for offset in range(0, GENES, PAGE):
+        result = await session.execute(query.offset(offset).limit(PAGE))
+        genes = result.scalars().all()
+        if with_text:
+            [gene.implementation for gene in genes]
+        session.expunge_all()
+    return (time.perf_counter() - start) * 1000
+
+
+async def main() -> None:
+    genes = _make_genes()
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "genes.db")
+        engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)()
+
+        await GeneWriter(max_rows=500).write_batch(session, genes)
+        inline = sum(len(gene["implementation"].encode()) for gene in genes)
+        stored = (await session.execute(select(func.sum(func.length(Blob.data))))).scalar()
+        blob_count = (await session.execute(select(func.count()).select_from(Blob))).scalar()
+        print(f"inline text: {inline / 1e6:8.2f}MB for {GENES} genes")
+        print(f"blob table:  {stored / 1e3:8.2f}KB in {blob_count} blobs ({inline / stored:,.0f}x smaller)")
+        print(f"database file: {os.path.getsize(path) / 1e6:.2f}MB")
+
+        summary = await _scan(session, with_text=False)
+        full = await _scan(session, with_text=True)
+        print(f"list scan, summaries: {summary:8.1f}ms")
+        print(f"list scan, with text: {full:8.1f}ms")
+
+        await session.close()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,74 @@
+"""Benchmark gene persistence: one round trip per gene vs bulk upsert.
+
+Uses a file-backed SQLite database in a temporary directory. Run from the
+backend directory:
+
+    python -m benchmarks.bench_gene_writer
+"""
+import asyncio
+import os
+import tempfile
+import time
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.models import Base, Gene
+from app.services.gene_store import GeneWriter
+from app.services.mutator import MutationResult
+from app.services.solidifier import Solidifier
+from app.services.validator import ValidationResult
+
+GENES = 5000
+DUPLICATES = 4  # each gene is solidified this many times
+
+
+def _make_genes() -> list[dict]:
+    solidifier = Solidifier()
+    validation = ValidationResult(passed=True)
+    return [
+        solidifier.solidify(MutationResult(success=True, code=f"value = {i % GENES}"), validation)
+        for i in range(GENES * DUPLICATES)
+    ]
+
+
+async def _fresh_session(path: str) -> tuple:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    return engine, async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)()
+
+
+async def _per_gene(session: AsyncSession, genes: list[dict]) -> None:
+    seen = set()
+    for gene in genes:
+        # Check-then-insert, one round trip each, as a naive writer would
+        if gene["id"] in seen or await session.get(Gene, gene["id"]) is not None:
+            continue
+        seen.add(gene["id"])
+        session.add(Gene(**gene))
+        await session.commit()
+
+
+async def _bulk(session: AsyncSession, genes: list[dict]) -> None:
+    writer = GeneWriter()
+    for start in range(0, len(genes), 500):
+        await writer.write_batch(session, genes[start:start + 500])
+
+
+async def main() -> None:
+    genes = _make_genes()
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "genes.db")
+        for name, func in (("per gene", _per_gene), ("bulk upsert", _bulk)):
+            engine, session = await _fresh_session(path)
+            start = time.perf_counter()
+            await func(session, genes)
+            elapsed = time.perf_counter() - start
+            await session.close()
+            await engine.dispose()
+            print(f"{name:>12}: {elapsed * 1000:8.1f}ms  {len(genes) / elapsed:10,.0f} genes/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,39 @@
+"""Benchmark isolated, parallel test execution against the shared-namespace run.
+
+Each test sleeps briefly to stand in for a slow assertion, so the speedup
+shows on machines with few cores. Run from the backend directory:
+
+    python -m benchmarks.bench_isolated_tests
+"""
+import time
+
+from app.services.sandbox import SandboxPool
+from app.services.validator import Validator
+
+TESTS = 16
+CODE = "def slow(x):\n    import time\n    time.sleep(0.05)\n    return x\n"
+SUITE = [f"assert slow({i}) == {i}" for i in range(TESTS)]
+
+
+def _wall_ms(func) -> float:
+    start = time.perf_counter()
+    result = func()
+    assert result.passed, result
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    for workers in (1, 2, 4, 8):
+        with SandboxPool(size=workers) as pool:
+            pool.warm_up()
+            validator = Validator(sandbox=pool)
+            shared = _wall_ms(lambda: validator.validate_with_tests(CODE, SUITE))
+            isolated = _wall_ms(lambda: validator.validate_with_tests(CODE, SUITE, isolated=True))
+        print(
+            f"workers={workers}: shared={shared:7.1f}ms  isolated={isolated:7.1f}ms  "
+            f"speedup={shared / isolated:4.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Benchmark sequential vs multi-process batch processing.
+
+Speedup depends on the number of cores; on one core the pool can only
+add overhead, which shows how far chunking amortizes IPC.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_parallel
+"""
+import os
+import time
+
+from app.services.gep_loop import GEPLoop
+
+ENTRIES = 4000
+
+
+def _logs() -> list[dict]:
+    return [
+        {"level": "ERROR" if i % 4 else "INFO", "message": f"KeyError: 'k{i}'"}
+        for i in range(ENTRIES)
+    ]
+
+
+def main() -> None:
+    logs = _logs()
+    workers = os.cpu_count() or 1
+    print(f"cores: {workers}")
+
+    start = time.perf_counter()
+    GEPLoop().process_batch(logs)
+    sequential = time.perf_counter() - start
+    print(f"{'process_batch':>28}: {ENTRIES / sequential:>8,.0f}/s")
+
+    for chunk_size in (1, 16, None):
+        start = time.perf_counter()
+        GEPLoop().process_batch_parallel(logs, workers=workers, chunk_size=chunk_size)
+        elapsed = time.perf_counter() - start
+        label = f"parallel, chunk={chunk_size or 'auto'}"
+        print(f"{label:>28}: {ENTRIES / elapsed:>8,.0f}/s  speedup={sequential / elapsed:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Benchmark sequential vs pipelined GEP loop throughput.
+
+Validation waits on a sandbox process, so it is simulated here by a
+fixed sleep on top of the real validator.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_pipeline
+"""
+import asyncio
+import time
+
+from app.services.gep_loop import GEPLoop
+from app.services.validator import Validator
+
+ENTRIES = 400
+VALIDATE_SECONDS = 0.005
+
+
+class SlowValidator(Validator):
+    """Validator that waits as if it were calling a sandbox."""
+
+    def validate_code(self, code: str):
+        time.sleep(VALIDATE_SECONDS)
+        return super().validate_code(code)
+
+
+def _logs() -> list[dict]:
+    return [
+        {"level": "ERROR" if i % 4 else "INFO", "message": f"KeyError: 'k{i}'"}
+        for i in range(ENTRIES)
+    ]
+
+
+async def _pipeline(loop: GEPLoop, logs: list[dict], workers: int) -> None:
+    async for _ in loop.process_pipeline(logs, concurrency={"validate": workers}):
+        pass
+
+
+def main() -> None:
+    logs = _logs()
+
+    start = time.perf_counter()
+    GEPLoop(validator=SlowValidator()).process_batch(logs)
+    sequential = time.perf_counter() - start
+    print(f"{'process_batch':>22}: {ENTRIES / sequential:>8,.0f}/s")
+
+    for workers in (1, 4, 16):
+        start = time.perf_counter()
+        asyncio.run(_pipeline(GEPLoop(validator=SlowValidator()), logs, workers))
+        elapsed = time.perf_counter() - start
+        print(
+            f"{f'pipeline, validate={workers}':>22}: {ENTRIES / elapsed:>8,.0f}/s  "
+            f"speedup={sequential / elapsed:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
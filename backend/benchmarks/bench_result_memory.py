@@ -0,0 +1,57 @@
+"""Benchmark peak memory of holding a large batch of loop results.
+
+Each mode processes the same million log entries in a fresh process and
+reports its peak RSS. Entries are generated lazily, as if read from a
+file, so they stay in memory only as long as a result refers to them.
+Most are INFO lines; the errors are served from the gene index after
+their first occurrence, so the run measures result objects rather than
+validation.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_result_memory
+"""
+import resource
+import subprocess
+import sys
+import time
+from typing import Iterator
+
+from app.services.gene_index import GeneIndex
+from app.services.gep_loop import GEPLoop
+
+ENTRIES = 1_000_000
+MODES = ("default", "compact")
+
+
+def _logs() -> Iterator[dict]:
+    for i in range(ENTRIES):
+        if i % 10 < 7:
+            yield {"level": "INFO", "message": f"request {i} served", "source": "api"}
+        elif i % 10 < 9:
+            yield {"level": "ERROR", "message": f"KeyError: 'k{i}'", "source": "api"}
+        else:
+            yield {"level": "WARNING", "message": f"TimeoutError after {i}ms", "source": "worker"}
+
+
+def _run(mode: str) -> None:
+    loop = GEPLoop(gene_index=GeneIndex(), compact=mode == "compact")
+    start = time.perf_counter()
+    results = loop.process_batch(_logs())
+    elapsed = time.perf_counter() - start
+    peak_mib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    statuses = loop.stats()["statuses"]
+    print(f"{mode:>8}: peak RSS {peak_mib:>7,.0f} MiB  {len(results) / elapsed:>8,.0f}/s  {statuses}")
+
+
+def main() -> None:
+    if len(sys.argv) > 1:
+        _run(sys.argv[1])
+        return
+    print(f"entries: {ENTRIES:,}")
+    for mode in MODES:
+        subprocess.run([sys.executable, "-m", "benchmarks.bench_result_memory", mode], check=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Benchmark sandbox validation latency: cold spawn vs warm pre-forked pool.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_sandbox
+"""
+import multiprocessing
+import statistics
+import time
+
+from app.services.mutator import Mutator
+from app.services.sandbox import SandboxPool
+from app.services.validator import run_code
+
+COLD_RUNS = 30
+WARM_RUNS = 1000
+CODE = Mutator.FIX_TEMPLATES["data_access"]["code"]
+
+
+def _cold_job(conn, code: str) -> None:
+    conn.send(run_code(code))
+
+
+def _cold_validate(context, code: str) -> None:
+    parent, child = context.Pipe()
+    process = context.Process(target=_cold_job, args=(child, code))
+    process.start()
+    parent.recv()
+    process.join()
+
+
+def _summary(name: str, latencies: list[float]) -> str:
+    latencies = sorted(latencies)
+    p99 = latencies[min(len(latencies) - 1, int(0.99 * len(latencies)))]
+    return (
+        f"{name:>22}: p50={statistics.median(latencies):8.2f}ms  "
+        f"p99={p99:8.2f}ms  n={len(latencies)}"
+    )
+
+
+def _measure(func, runs: int) -> list[float]:
+    latencies = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def main() -> None:
+    spawn = multiprocessing.get_context("spawn")
+    print(_summary("cold spawn per job", _measure(lambda: _cold_validate(spawn, CODE), COLD_RUNS)))
+
+    with SandboxPool(size=1, max_jobs_per_worker=None) as pool:
+        pool.warm_up()
+        warm = _measure(lambda: pool.run("code", (CODE,), 5), WARM_RUNS)
+    print(_summary("warm pool", warm))
+
+    with SandboxPool(size=1, max_jobs_per_worker=50) as pool:
+        pool.warm_up()
+        recycled = _measure(lambda: pool.run("code", (CODE,), 5), WARM_RUNS)
+        count = pool.recycled
+    print(_summary("warm pool, recycle/50", recycled) + f"  recycled={count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Benchmark Scanner pattern extraction: Aho-Corasick automaton vs substring loop.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_scanner
+"""
+import random
+import string
+import time
+
+from app.services.matcher import PatternMatcher
+from app.services.scanner import Scanner
+
+MESSAGES = 2_000
+
+
+def _make_patterns(count: int, rng: random.Random) -> list[str]:
+    patterns = list(Scanner.ERROR_PATTERNS)
+    while len(patterns) < count:
+        word = "".join(rng.choices(string.ascii_letters, k=rng.randint(6, 14)))
+        patterns.append(word + "Error")
+    return patterns[:count]
+
+
+def _make_messages(patterns: list[str], rng: random.Random) -> list[str]:
+    messages = []
+    for _ in range(MESSAGES):
+        words = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9))) for _ in range(12)]
+        words.insert(rng.randrange(len(words)), rng.choice(patterns))
+        messages.append(" ".join(words))
+    return messages
+
+
+def _substring_loop(patterns: list[str], message: str) -> list[str]:
+    found = []
+    for pattern in patterns:
+        if pattern in message:
+            found.append(pattern)
+    return found
+
+
+def main() -> None:
+    rng = random.Random(42)
+    print(f"{'patterns':>8}  {'loop msg/s':>12}  {'automaton msg/s':>16}  {'speedup':>7}")
+    for count in (10, 100, 1000):
+        patterns = _make_patterns(count, rng)
+        messages = _make_messages(patterns, rng)
+        matcher = PatternMatcher(patterns, automaton_threshold=0)
+
+        start = time.perf_counter()
+        expected = [_substring_loop(patterns, m) for m in messages]
+        loop_rate = MESSAGES / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        actual = [matcher.find_all(m) for m in messages]
+        matcher_rate = MESSAGES / (time.perf_counter() - start)
+
+        assert actual == expected
+        print(f"{count:>8}  {loop_rate:>12,.0f}  {matcher_rate:>16,.0f}  {matcher_rate / loop_rate:>6.2f}x")
+    print(f"Scanner switches to the automaton at {PatternMatcher.AUTOMATON_THRESHOLD} patterns.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Benchmark mutation template rendering on one core.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_templates
+"""
+import random
+import time
+
+from app.services.intent import Intent
+from app.services.mutator import Mutator
+from app.services.templates import TemplateRegistry
+
+MUTATIONS = 200_000
+
+
+def _make_intents(rng: random.Random) -> list[Intent]:
+    targets = ["database_connection", "api_timeout", "data_access"]
+    return [
+        Intent(
+            action="fix",
+            target=rng.choice(targets),
+            context={"retries": rng.randint(1, 5), "timeout": rng.choice([10, 30, 60])},
+        )
+        for _ in range(MUTATIONS)
+    ]
+
+
+def _rate(func, count: int) -> float:
+    start = time.perf_counter()
+    func()
+    return count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    rng = random.Random(7)
+    intents = _make_intents(rng)
+    registry = TemplateRegistry()
+    mutator = Mutator(registry=registry)
+    template = registry.get("fix:database_connection")
+    context = {"retries": 5, "delay": 0.5}
+
+    def render_uncached():
+        for _ in range(MUTATIONS):
+            template.render(context)
+
+    def render_cached():
+        for _ in range(MUTATIONS):
+            registry.render("fix:database_connection", context)
+
+    def mutate():
+        for intent in intents:
+            mutator.mutate(intent)
+
+    print(f"{'render, compiled':>22}: {_rate(render_uncached, MUTATIONS):>10,.0f}/s")
+    print(f"{'render, cached':>22}: {_rate(render_cached, MUTATIONS):>10,.0f}/s")
+    print(f"{'Mutator.mutate':>22}: {_rate(mutate, MUTATIONS):>10,.0f}/s")
+    print(f"render cache: {registry.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
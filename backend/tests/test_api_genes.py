@@ -1,6 +1,15 @@
 """Test Gene API endpoints."""
+import asyncio
+
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.exc import InvalidRequestError
+
+from app.api.genes import WITH_TEXT
+from app.models import Blob, Gene
+
+from app.services.gene_index import gene_index
 
 
 class TestGeneList:
@@ -154,6 +163,60 @@ class TestGeneUpdate:
         assert response.status_code == 404
 
 
+class TestGeneBlobs:
+    """Test implementation and prompt text is stored as shared blobs."""
+
+    def test_text_round_trips_and_is_deduplicated(self, client: TestClient, db_session):
+        """Test identical bodies share one blob and lists omit the text."""
+        body = "def handler(event):\n    return event\n" * 50
+        ids = [
+            client.post(
+                "/api/v1/genes",
+                json={"name": f"copy_{i}", "implementation": body, "prompt_template": "Say {word}"},
+            ).json()["id"]
+            for i in range(3)
+        ]
+
+        gene = client.get(f"/api/v1/genes/{ids[0]}").json()
+        assert gene["implementation"] == body
+        assert gene["prompt_template"] == "Say {word}"
+
+        updated = client.put(f"/api/v1/genes/{ids[0]}", json={"status": "validated"}).json()
+        assert updated["implementation"] == body
+        changed = client.put(f"/api/v1/genes/{ids[1]}", json={"implementation": "pass"}).json()
+        assert changed["implementation"] == "pass"
+
+        listed = client.get("/api/v1/genes").json()
+        assert "implementation" not in listed[0]
+        assert {g["implementation_hash"] for g in listed if g["id"] != ids[1]} == {
+            gene["implementation_hash"]
+        }
+
+        blobs = asyncio.get_event_loop().run_until_complete(
+            db_session.execute(select(Blob))
+        ).scalars().all()
+        assert len(blobs) == 3
+        stored = next(b for b in blobs if b.hash == gene["implementation_hash"])
+        assert stored.encoding == "zlib"
+        assert len(stored.data) < stored.size
+
+
+    async def test_unloaded_text_raises(self, db_session):
+        """Test reading text the query did not load fails instead of reading None."""
+        db_session.add(Gene(id="g1", name="with_code", implementation="pass"))
+        await db_session.commit()
+        db_session.expunge_all()
+
+        gene = (await db_session.execute(select(Gene).where(Gene.id == "g1"))).scalar_one()
+        with pytest.raises(InvalidRequestError):
+            gene.implementation
+        assert gene.prompt_template is None  # no blob to load
+        db_session.expunge_all()
+
+        gene = (await db_session.execute(select(Gene).where(Gene.id == "g1").options(*WITH_TEXT))).scalar_one()
+        assert gene.implementation == "pass"
+
+
 class TestGeneDelete:
     """Test gene delete endpoint."""
 
@@ -178,3 +241,34 @@ class TestGeneDelete:
         """Test deleting a non-existent gene."""
         response = client.delete("/api/v1/genes/nonexistent")
         assert response.status_code == 404
+
+
+class TestGeneIndexSync:
+    """Test the gene reuse index follows API changes."""
+
+    def test_index_tracks_create_update_delete(self, client: TestClient):
+        """Test validated genes with a target tag are indexed until changed."""
+        gene_index.clear()
+        response = client.post(
+            "/api/v1/genes",
+            json={
+                "name": "retry_connect",
+                "implementation": "def f(): pass",
+                "status": "validated",
+                "success_rate": 0.9,
+                "context_tags": ["fix", "target:database_connection"],
+            },
+        )
+        gene_id = response.json()["id"]
+        assert gene_index.lookup("database_connection")["id"] == gene_id
+
+        client.put(f"/api/v1/genes/{gene_id}", json={"success_rate": 0.5})
+        assert gene_index.lookup("database_connection") is None
+        assert gene_index.lookup("database_connection", min_success_rate=0.5)["id"] == gene_id
+
+        client.put(f"/api/v1/genes/{gene_id}", json={"status": "deprecated"})
+        assert gene_index.lookup("database_connection", min_success_rate=0.0) is None
+
+        client.put(f"/api/v1/genes/{gene_id}", json={"status": "validated"})
+        client.delete(f"/api/v1/genes/{gene_id}")
+        assert len(gene_index) == 0
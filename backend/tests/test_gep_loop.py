@@ -1,14 +1,37 @@
 """Test GEP Loop services."""
+import asyncio
+import pickle
+import queue
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
 import pytest
 from datetime import datetime
+from sqlalchemy import select
 
-from app.services.scanner import Scanner, ScanResult
+from app.services.scanner import Scanner, ScanResult, StagnationDetector
+from app.services.matcher import PatternMatcher
 from app.services.signal import SignalGenerator, EvolutionSignal
 from app.services.intent import IntentClassifier, Intent
 from app.services.mutator import Mutator, MutationResult
 from app.services.validator import Validator, ValidationResult
+from app.services.sandbox import SandboxPool
+from app.services.validation_cache import SQLiteCacheStore, ValidationCache, validation_key
+from app.services.tournament import Candidate, Tournament
+from app.services.templates import CompiledTemplate, TemplateRegistry
+from app.models import Gene, MutationTemplate
+from app.services.bloom import BloomFilter
+from app.services.gene_store import GeneWriter
+from app.services.mutation_backend import BatchingMutator, FakeBackend, MutationBackend
 from app.services.solidifier import Solidifier
-from app.services.gep_loop import GEPLoop
+from app.services.gep_loop import GEPLoop, PIPELINE_CONCURRENCY
+from app.services.dedup import Deduplicator, normalize_message, fingerprint
+from app.services.scheduler import SignalScheduler
+from app.services.coalescer import SignalCoalescer
+from app.services.gene_index import GeneIndex
+from app.services.metrics import LatencyHistogram, LoopMetrics
 
 
 class TestScanner:
@@ -35,6 +58,33 @@ class TestScanner:
         assert result.issue_type == "error"
         assert "ConnectionError" in result.patterns
 
+    def test_compact_scan_shares_results(self):
+        """Test compact scans share patterns and contexts and drop raw logs."""
+        scanner = Scanner(compact=True, keep_raw_log=False)
+        first = scanner.scan({"level": "ERROR", "message": "KeyError: 'a'", "source": "api"})
+        second = scanner.scan({"level": "error", "message": "KeyError: 'b'", "source": "api"})
+
+        assert first.patterns == ("KeyError", "Error")
+        assert first.patterns is second.patterns
+        assert first.context is second.context
+        assert first.raw_log is None
+        assert scanner.scan({"level": "INFO"}) is scanner.scan({"level": "DEBUG"})
+
+        signal = SignalGenerator(compact=True).generate(first)
+        assert signal.patterns is first.patterns
+        assert signal.context is first.context
+
+    def test_compact_scan_unhashable_source(self):
+        """Test compact scans keep a context of their own for a dict source."""
+        scanner = Scanner(compact=True)
+        log = {"level": "ERROR", "message": "ConnectionError: refused", "source": {"svc": "db"}}
+        first = scanner.scan(log)
+        second = scanner.scan(log)
+
+        assert first.has_issue is True
+        assert first.context == {"source": {"svc": "db"}, "level": "ERROR"}
+        assert first.context is not second.context
+
     def test_scan_stagnation_pattern(self):
         """Test detecting stagnation (repeated failures)."""
         scanner = Scanner()
@@ -59,6 +109,98 @@ class TestScanner:
         result = scanner.scan(log_entry)
         assert result.has_issue is False
 
+    def test_extract_patterns_matches_substring_loop(self):
+        """Test compiled matcher returns the same patterns and order as `in` checks."""
+        scanner = Scanner()
+        messages = [
+            "ConnectionError: Failed to connect to database",
+            "TimeoutError after 30s, ConnectionRefused",
+            "KeyError: 'missing_key' NotFoundError",
+            "all good",
+            "",
+        ]
+        for message in messages:
+            expected = [p for p in Scanner.ERROR_PATTERNS if p in message]
+            assert scanner._extract_patterns(message) == expected
+
+    def test_custom_error_patterns(self):
+        """Test scanner with custom patterns."""
+        scanner = Scanner(error_patterns=["DiskFull", "OOMKilled"])
+        result = scanner.scan({"level": "WARNING", "message": "pod OOMKilled"})
+        assert result.has_issue is True
+        assert result.patterns == ["OOMKilled"]
+
+    def test_pattern_matcher_automaton_overlapping(self):
+        """Test automaton finds overlapping patterns in pattern-list order."""
+        matcher = PatternMatcher(["she", "he", "hers", "his"], automaton_threshold=0)
+        assert matcher.uses_automaton is True
+        assert matcher.find_all("ushers") == ["she", "he", "hers"]
+        assert matcher.find_all("TimeoutError") == []
+        automaton = PatternMatcher(Scanner.ERROR_PATTERNS, automaton_threshold=0)
+        for message in ["TimeoutError: ConnectionError", "Failed NotFound", "ok"]:
+            expected = [p for p in Scanner.ERROR_PATTERNS if p in message]
+            assert automaton.find_all(message) == expected
+
+    async def test_scan_stream(self):
+        """Test scanning an async source yields results in order."""
+        scanner = Scanner()
+
+        async def source():
+            yield {"level": "ERROR", "message": "TimeoutError"}
+            yield {"level": "INFO", "message": "ok"}
+
+        results = [result async for result in scanner.scan_stream(source())]
+        assert [r.has_issue for r in results] == [True, False]
+
+
+class TestStagnationDetector:
+    """Test incremental sliding-window stagnation detection."""
+
+    def test_observe_fires_on_threshold(self):
+        """Test stagnation is reported on the entry that crosses the threshold."""
+        scanner = Scanner()
+        log = {"level": "ERROR", "message": "TimeoutError: API call timed out"}
+
+        assert scanner.observe(log).has_issue is False
+        assert scanner.observe(log).has_issue is False
+        result = scanner.observe(log)
+        assert result.has_issue is True
+        assert result.issue_type == "stagnation"
+        assert result.patterns == ["TimeoutError"]
+        assert result.context == {"count": 3, "total_errors": 3}
+        # Already reported while above threshold
+        assert scanner.observe(log).has_issue is False
+
+    def test_count_window_evicts_oldest(self):
+        """Test count window only remembers the last window_size errors."""
+        detector = StagnationDetector(["TimeoutError"], threshold=2, window_size=2)
+        timeout = {"level": "ERROR", "message": "TimeoutError"}
+        other = {"level": "ERROR", "message": "KeyError"}
+
+        detector.observe(timeout)
+        detector.observe(other)
+        assert detector.observe(timeout).has_issue is False
+        assert detector.observe(timeout).has_issue is True
+        detector.observe(other)
+        detector.observe(other)
+        assert detector.counts() == {}
+        assert len(detector._entries) == 2
+
+    def test_time_window_expires_entries(self):
+        """Test time window forgets errors older than window_seconds."""
+        detector = StagnationDetector(["ConnectionError"], threshold=2, window_seconds=60)
+        log = {"level": "ERROR", "message": "ConnectionError"}
+
+        detector.observe({**log, "timestamp": 0})
+        assert detector.observe({**log, "timestamp": 120}).has_issue is False
+        result = detector.observe({**log, "timestamp": "1970-01-01T00:02:30+00:00"})
+        assert result.has_issue is True
+        assert result.context["count"] == 2
+
+        detector.observe({"level": "INFO", "message": "ok", "timestamp": 1000})
+        assert detector.counts() == {}
+        assert detector.observe({**log, "timestamp": 1001}).has_issue is False
+
 
 class TestSignalGenerator:
     """Test signal generation service."""
@@ -120,6 +262,41 @@ class TestIntentClassifier:
         intent = classifier.classify(signal)
         assert intent.action == "optimize"
 
+    def test_classify_memoizes_normalized_key(self):
+        """Test repeated signals hit the memo regardless of pattern order."""
+        classifier = IntentClassifier()
+        first = EvolutionSignal(
+            signal_type="repair", patterns=["TimeoutError", "ConnectionError"],
+            priority=10, context={"source": "a"},
+        )
+        second = EvolutionSignal(
+            signal_type="repair", patterns=["ConnectionError", "TimeoutError"],
+            priority=10, context={"source": "b"},
+        )
+
+        a = classifier.classify(first)
+        b = classifier.classify(second)
+        assert (a.action, a.target, a.confidence) == (b.action, b.target, b.confidence)
+        assert a.target == "database_connection"
+        assert b.context["source"] == "b"
+        assert classifier.cache_info()["hits"] == 1
+        assert classifier.cache_info()["misses"] == 1
+
+    def test_classify_batch_matches_classify(self):
+        """Test batch classification resolves each distinct key once."""
+        classifier = IntentClassifier()
+        signals = [
+            EvolutionSignal(signal_type="repair", patterns=["KeyError"], priority=10),
+            EvolutionSignal(signal_type="improve", patterns=["Timeout"], priority=5),
+        ] * 50
+
+        intents = classifier.classify_batch(signals)
+        assert len(intents) == 100
+        assert classifier.cache_info()["misses"] == 2
+        assert classifier.cache_info()["hits"] == 0
+        expected = IntentClassifier().classify(signals[1])
+        assert intents[-1] == expected
+
 
 class TestMutator:
     """Test mutation generation service."""
@@ -155,6 +332,123 @@ class TestMutator:
         assert result.success is True
 
 
+    def test_mutate_candidates_sweeps_parameters(self):
+        """Test candidates are the template plus distinct parameter variants."""
+        mutator = Mutator()
+        intent = Intent(action="fix", target="database_connection")
+
+        candidates = mutator.mutate_candidates(intent, count=3)
+        assert len(candidates) == 3
+        assert candidates[0].code == mutator.mutate(intent).code
+        assert len({c.code for c in candidates}) == 3
+        assert "def safe_connect(retries=3, delay=0.5):" in candidates[1].code
+        assert all(c.target == "database_connection" for c in candidates)
+
+    def test_mutate_candidates_without_sweep(self):
+        """Test intents without a sweep yield a single candidate."""
+        mutator = Mutator()
+        intent = Intent(action="optimize", target="api_timeout")
+        assert len(mutator.mutate_candidates(intent, count=4)) == 1
+
+
+class TestTemplateRegistry:
+    """Test compiled, cached mutation templates."""
+
+    def test_render_typed_parameters(self):
+        """Test placeholders are filled with coerced values and defaults."""
+        template = CompiledTemplate.compile(
+            "fix:demo",
+            "def f(n=${n}, ratio=${ratio}):\n    return '%d of %s' % (n, ${name})\n",
+            params={"n": {"type": "int", "default": 3}, "ratio": {"type": "float", "default": 0.5}},
+        )
+        assert [p.name for p in template.params] == ["n", "ratio", "name"]
+        assert template.render({"n": "7", "name": "jobs"}) == (
+            "def f(n=7, ratio=0.5):\n    return '%d of %s' % (n, 'jobs')\n"
+        )
+        with pytest.raises(ValueError, match="n"):
+            template.render({"n": "many", "name": "jobs"})
+        with pytest.raises(ValueError, match="name"):
+            template.render({})
+
+    def test_code_strings_render_as_literals(self):
+        """Test a string parameter cannot break out of its code literal."""
+        template = CompiledTemplate.compile("fix:demo", "name = ${name}\n")
+        payload = "x'\nimport os\nos.remove('data')\n"
+        code = template.render({"name": payload})
+        namespace = {}
+        exec(compile(code, "<template>", "exec"), namespace)
+        assert namespace["name"] == payload
+        assert code.count("\n") == 1
+
+        prompt = CompiledTemplate.compile("optimize:demo", "When processing ${target}:", kind="prompt")
+        assert prompt.render({"target": "api"}) == "When processing api:"
+
+    def test_render_cache_and_reregister(self):
+        """Test renders are cached per version and replaced on re-register."""
+        registry = TemplateRegistry()
+        registry.register("fix:demo", "x = ${x}", params={"x": {"type": "int", "default": 1}})
+        assert registry.render("fix:demo") == "x = 1"
+        assert registry.render("fix:demo", {"x": 1}) == "x = 1"
+        assert registry.cache_info()["hits"] == 1
+
+        registry.register("fix:demo", "y = ${x}", params={"x": {"type": "int", "default": 1}})
+        assert registry.render("fix:demo") == "y = 1"
+
+    def test_mutator_uses_registry_overrides(self):
+        """Test registry templates override built-ins and read intent context."""
+        registry = TemplateRegistry()
+        registry.register(
+            "fix:data_access",
+            "def lookup(retries=${retries}): pass",
+            params={"retries": {"type": "int", "default": 2}},
+            description="Custom data access fix",
+        )
+        mutator = Mutator(registry=registry)
+
+        result = mutator.mutate(Intent(action="fix", target="data_access", context={"retries": 4}))
+        assert result.code == "def lookup(retries=4): pass"
+        assert result.description == "Custom data access fix"
+        bad = mutator.mutate(Intent(action="fix", target="data_access", context={"retries": "x"}))
+        assert bad.success is False
+        assert "fix:database_connection" in registry
+
+    async def test_hot_reload_from_database(self, db_session):
+        """Test changed and deleted database templates are picked up."""
+        registry = TemplateRegistry()
+        mutator = Mutator(registry=registry)
+        intent = Intent(action="fix", target="database_connection")
+        builtin = mutator.mutate(intent).code
+
+        row = MutationTemplate(id="fix:database_connection", source="retry(${retries})",
+                               params={"retries": {"type": "int", "default": 9}})
+        db_session.add(row)
+        await db_session.commit()
+        assert await registry.load(db_session) == 1
+        assert await registry.load(db_session) == 0
+        assert mutator.mutate(intent).code == "retry(9)"
+
+        await db_session.delete(row)
+        await db_session.commit()
+        assert await registry.load(db_session) == 1
+        assert mutator.mutate(intent).code == builtin
+
+
+    async def test_load_skips_invalid_rows(self, db_session):
+        """Test a row that does not compile leaves the other templates loading."""
+        registry = TemplateRegistry()
+        registry.register("fix:bad", "old(${x})")
+        db_session.add_all([
+            MutationTemplate(id="fix:bad", source="f(${x})", params={"x": {"type": "bool"}}),
+            MutationTemplate(id="fix:good", source="g(${x})", params={"x": {"type": "int", "default": 1}}),
+        ])
+        await db_session.commit()
+
+        assert await registry.load(db_session) == 1
+        assert registry.render("fix:good") == "g(1)"
+        assert registry.render("fix:bad", {"x": "y"}) == "old('y')"
+        assert await registry.load(db_session) == 0
+
+
 class TestValidator:
     """Test sandbox validation service."""
 
@@ -190,6 +484,383 @@ class TestValidator:
         result = validator.validate_with_tests(code, tests)
         assert result.passed is True
 
+    def test_validate_with_tests_parses_once(self, monkeypatch):
+        """Test code is parsed once and phase timings are recorded."""
+        import app.services.validator as validator_module
+
+        parses = []
+        parse = validator_module.ast.parse
+        monkeypatch.setattr(
+            validator_module.ast, "parse", lambda source: parses.append(source) or parse(source)
+        )
+        validator = Validator()
+        tests = ["assert mul(2, 3) == 6", "assert mul(0, 5) == 1"]
+
+        result = validator.validate_with_tests("def mul(a, b): return a * b", tests)
+        assert len(parses) == 1
+        assert result.passed is False
+        assert set(result.timings_ms) == {"parse", "compile", "exec", "test_setup", "tests"}
+        assert all("time_ms" in test for test in result.test_results)
+
+        hits = validator_module._compile_test.cache_info().hits
+        validator.validate_with_tests("def mul(a, b): return a * b", tests)
+        assert validator_module._compile_test.cache_info().hits == hits + 2
+
+    def test_validation_records_resource_usage(self):
+        """Test CPU time, peak memory and executed lines are measured."""
+        validator = Validator(measure=True)
+        code = "def grow(n):\n    items = []\n    for i in range(n):\n        items.append(str(i))\n    return items\n"
+
+        small = validator.validate_with_tests(code, ["assert len(grow(10)) == 10"])
+        large = validator.validate_with_tests(code, ["assert len(grow(10000)) == 10000"])
+        assert small.passed and large.passed
+        assert small.cpu_time_ms >= 0
+        assert large.lines_executed > small.lines_executed > 0
+        assert large.peak_memory_bytes > small.peak_memory_bytes
+
+    def test_validation_keeps_host_tracemalloc(self):
+        """Test validation leaves tracing on when the host started it."""
+        tracemalloc.start()
+        try:
+            result = Validator(measure=True).validate_code("items = [str(i) for i in range(1000)]")
+            assert result.passed
+            assert result.peak_memory_bytes > 0
+            assert tracemalloc.is_tracing()
+        finally:
+            tracemalloc.stop()
+
+        Validator(measure=True).validate_code("x = 1")
+        assert not tracemalloc.is_tracing()
+
+    def test_validation_meters_cpu_time_only_by_default(self):
+        """Test unmeasured validation leaves tracers and tracemalloc alone."""
+        traced = set()
+
+        def tracer(frame, event, arg):
+            traced.add(frame.f_code.co_filename)
+
+        sys.settrace(tracer)
+        try:
+            result = Validator().validate_with_tests("def f(): return 1", ["assert f() == 1"])
+        finally:
+            sys.settrace(None)
+        assert result.passed
+        assert {"<mutation>", "<test>"} <= traced
+        assert not tracemalloc.is_tracing()
+        assert result.cpu_time_ms >= 0
+        assert result.peak_memory_bytes is None
+        assert result.lines_executed is None
+
+    def test_isolated_tests_get_fresh_namespace(self):
+        """Test isolated tests cannot see state left by earlier tests."""
+        validator = Validator()
+        code = "items = []"
+        tests = ["items.append(1); assert items == [1]", "assert items == []"]
+
+        shared = validator.validate_with_tests(code, tests)
+        isolated = validator.validate_with_tests(code, tests, isolated=True)
+        assert shared.passed is False
+        assert isolated.passed is True
+        assert [test["test"] for test in isolated.test_results] == [1, 2]
+
+
+class TestSandboxPool:
+    """Test process-pool sandbox validation."""
+
+    @pytest.fixture
+    def sandbox(self):
+        pool = SandboxPool(size=2)
+        yield pool
+        pool.close()
+
+    def test_sandboxed_validation(self, sandbox):
+        """Test code and tests run in worker processes."""
+        validator = Validator(sandbox=sandbox)
+        assert validator.validate_code("x = 1 + 1").passed is True
+        assert validator.validate_code("raise ValueError('boom')").passed is False
+        result = validator.validate_with_tests(
+            "def add(a, b): return a + b", ["assert add(1, 2) == 3"]
+        )
+        assert result.passed is True
+
+    def test_timeout_kills_and_replaces_worker(self, sandbox):
+        """Test a hung mutation times out without blocking the pool."""
+        validator = Validator(timeout_seconds=0.5, sandbox=sandbox)
+        results = validator.validate_many(["while True: pass", "x = 1", "while True: pass"])
+
+        assert [r.timed_out for r in results] == [True, False, True]
+        assert results[0].passed is False
+        assert "Timed out" in results[0].error
+        assert sandbox.timeouts == 2
+        assert validator.validate_code("y = 2").passed is True
+
+    def test_memory_limit(self, sandbox):
+        """Test allocations beyond the memory limit fail inside the worker."""
+        validator = Validator(sandbox=sandbox)
+        result = validator.validate_with_tests("data = None", ["data = bytearray(1024 ** 3)"])
+        assert result.passed is False
+        assert "MemoryError" in result.test_results[0]["error"]
+
+    def test_isolated_tests_time_out_individually(self, sandbox):
+        """Test a hung test times out without failing the others."""
+        validator = Validator(sandbox=sandbox)
+        tests = ["assert f() == 1", "while True: pass", "assert f() + 1 == 2"]
+
+        result = validator.validate_with_tests(
+            "def f(): return 1", tests, isolated=True, test_timeout=0.5
+        )
+        assert result.passed is False
+        assert result.timed_out is True
+        assert [test["passed"] for test in result.test_results] == [True, False, True]
+        assert result.test_results[1]["timed_out"] is True
+
+    def test_isolated_tests_fail_fast(self, sandbox):
+        """Test fail-fast skips tests that had not started."""
+        validator = Validator(sandbox=sandbox)
+        tests = ["assert False, 'first'"] + ["import time; time.sleep(0.2)"] * 6
+
+        result = validator.validate_with_tests("x = 1", tests, isolated=True, fail_fast=True)
+        assert result.passed is False
+        assert result.test_results[0]["error"] == "first"
+        assert any(test.get("skipped") for test in result.test_results)
+
+    def test_workers_recycled_after_job_limit(self):
+        """Test warmed workers are replaced after max_jobs_per_worker jobs."""
+        with SandboxPool(size=1, max_jobs_per_worker=2) as pool:
+            pool.warm_up()
+            validator = Validator(sandbox=pool)
+            results = [validator.validate_code(f"x = {i}") for i in range(5)]
+            assert all(r.passed for r in results)
+            assert pool.recycled >= 2
+
+
+class TestValidationCache:
+    """Test content-addressed caching of validation results."""
+
+    def test_identical_code_validated_once(self, monkeypatch):
+        """Test repeated code is served from the cache."""
+        cache = ValidationCache()
+        validator = Validator(cache=cache)
+        calls = []
+        monkeypatch.setattr(
+            "app.services.validator.run_code",
+            lambda code, measure=False: calls.append(code) or ValidationResult(passed=True),
+        )
+
+        for _ in range(3):
+            assert validator.validate_code("x = 1").passed is True
+        validator.validate_code("x = 2")
+
+        assert calls == ["x = 1", "x = 2"]
+        stats = cache.stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 2
+        assert stats["hit_rate"] == 0.5
+
+    def test_key_covers_tests_and_kind(self):
+        """Test code, tests and kind all change the key."""
+        keys = {
+            validation_key("code", "x = 1"),
+            validation_key("code", "x = 2"),
+            validation_key("tests", "x = 1", ["assert x"]),
+            validation_key("tests", "x = 1", ["assert x == 1"]),
+        }
+        assert len(keys) == 4
+
+    def test_invalidate_and_lru_bound(self):
+        """Test explicit invalidation and LRU eviction."""
+        cache = ValidationCache(max_entries=1)
+        cache.put("a", ValidationResult(passed=True))
+        cache.put("b", ValidationResult(passed=True))
+        assert cache.get("a") is None
+        cache.invalidate("b")
+        assert cache.get("b") is None
+        cache.put("c", ValidationResult(passed=False, timed_out=True))
+        assert cache.get("c") is None
+
+    def test_sandbox_failures_not_cached(self):
+        """Test results of a failed sandbox rather than failed code are dropped."""
+        cache = ValidationCache()
+        cache.put("a", ValidationResult(passed=False, error="Sandbox worker died (exit code -9)"))
+        cache.put("b", ValidationResult(passed=False, error="Sandbox error: MemoryError: "))
+        cache.put("c", ValidationResult(passed=False, error="MemoryError: "))
+        assert cache.get("a") is None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+
+    def test_cached_results_are_copies(self):
+        """Test mutating a returned result leaves the cached one intact."""
+        cache = ValidationCache()
+        cache.put("a", ValidationResult(passed=True, timings_ms={"run": 1.0}))
+        cache.get("a").timings_ms["run"] = 9.0
+        assert cache.get("a").timings_ms == {"run": 1.0}
+
+    def test_sqlite_store_survives_restart(self, tmp_path):
+        """Test persisted results are found by a fresh cache."""
+        path = str(tmp_path / "validation.db")
+        key = validation_key("tests", "def f(): return 1", ["assert f() == 1"])
+        result = ValidationResult(passed=True, test_results=[{"test": 1, "passed": True}])
+        ValidationCache(store=SQLiteCacheStore(path)).put(key, result)
+
+        cache = ValidationCache(store=SQLiteCacheStore(path))
+        assert cache.get(key) == result
+        assert cache.get(key) == result
+        assert cache.stats()["store_hits"] == 1
+        assert cache.stats()["hits"] == 1
+
+
+class TestTournament:
+    """Test multi-candidate validation and fitness scoring."""
+
+    def test_fittest_candidate_wins(self):
+        """Test passing beats failing and cheaper breaks ties."""
+        tournament = Tournament()
+        mutations = [
+            MutationResult(success=True, code="raise ValueError('bad')"),
+            MutationResult(success=True, code="total = 0\nfor i in range(50):\n    total += i\n"),
+            MutationResult(success=True, code="total = 50 * 49 // 2"),
+        ]
+
+        candidates = tournament.run(mutations)
+        assert [c.mutation for c in candidates] == mutations
+        assert candidates[0].fitness == 0.0
+        assert candidates[1].fitness == candidates[2].fitness == 1.0
+        assert candidates[2].cost < candidates[1].cost
+        assert tournament.best(candidates) is candidates[2]
+
+    def test_pass_rate_outranks_cost(self):
+        """Test a cheaper candidate never beats one that passes more tests."""
+        resilient = Candidate(MutationResult(success=True), ValidationResult(passed=True), fitness=1.0, cost=50.0)
+        cheap = Candidate(MutationResult(success=True), ValidationResult(passed=False), fitness=0.0, cost=1.0)
+        assert Tournament.best([cheap, resilient]) is resilient
+
+    def test_template_tests_rank_swept_candidates(self):
+        """Test template tests reject weak variants and cost picks among the rest."""
+        mutator = Mutator()
+        mutations = mutator.mutate_candidates(Intent(action="fix", target="database_connection"), count=6)
+        assert all(m.tests for m in mutations)
+
+        candidates = Tournament().run(mutations)
+        assert all(len(c.validation.test_results) == 3 for c in candidates)
+        for candidate in candidates:
+            too_few_retries = "def safe_connect(retries=2," in candidate.mutation.code
+            assert candidate.validation.passed is not too_few_retries
+        more_retries = [c for c in candidates if "def safe_connect(retries=5," in c.mutation.code]
+        assert more_retries and all(c.cost > candidates[0].cost for c in more_retries)
+        assert Tournament.best(candidates) is candidates[0]
+
+    def test_api_timeout_candidates_are_swept(self):
+        """Test the timeout template is swept and its variants pass its tests."""
+        mutator = Mutator()
+        mutations = mutator.mutate_candidates(Intent(action="fix", target="api_timeout"), count=4)
+        assert [m.code.splitlines()[0] for m in mutations] == [
+            f"def call_with_timeout(api_func, timeout={timeout}):" for timeout in (30, 10, 60)
+        ]
+
+        candidates = Tournament().run(mutations)
+        assert all(c.validation.passed and c.fitness == 1.0 for c in candidates)
+        assert Tournament.best(candidates) is candidates[0]
+
+    def test_ties_keep_first_candidate(self):
+        """Test equally fit candidates resolve to the earliest."""
+        tournament = Tournament()
+        candidates = tournament.run([
+            MutationResult(success=True, prompt="Do the thing"),
+            MutationResult(success=True, prompt="Do the other thing"),
+        ])
+        assert candidates[0].fitness == candidates[1].fitness == 1.0
+        assert tournament.best(candidates) is candidates[0]
+
+
+class TestBatchingMutator:
+    """Test the async mutation front end."""
+
+    async def test_requests_are_batched(self):
+        """Test requests arriving together share backend calls."""
+        backend = FakeBackend(latency_seconds=0.01)
+        mutator = BatchingMutator(backend, max_batch_size=4, batch_window_seconds=0.01)
+        intents = [Intent(action="fix", target="data_access") for _ in range(10)]
+
+        results = await asyncio.gather(*(mutator.mutate(intent) for intent in intents))
+        assert all(r.success and r.target == "data_access" for r in results)
+        assert backend.batches == [4, 4, 2]
+        assert mutator.stats()["mean_batch_size"] == 10 / 3
+
+    def test_mutator_survives_consecutive_event_loops(self):
+        """Test one mutator serves requests from successive asyncio.run calls."""
+        backend = FakeBackend(latency_seconds=0.01)
+        mutator = BatchingMutator(backend, max_concurrency=1, max_batch_size=2, batch_window_seconds=0.05)
+        intent = Intent(action="fix", target="data_access")
+
+        async def abandoned():
+            # Leaves a pending batch and window timer behind on this loop
+            return await mutator.mutate(intent, deadline_seconds=0.001)
+
+        async def burst():
+            return await asyncio.gather(*(mutator.mutate(intent, deadline_seconds=1.0) for _ in range(5)))
+
+        assert asyncio.run(abandoned()).success is False
+        for _ in range(2):
+            assert all(result.success for result in asyncio.run(burst()))
+        assert backend.batches == [2, 2, 1, 2, 2, 1]
+
+    async def test_concurrency_is_bounded(self):
+        """Test no more than max_concurrency batches are in flight."""
+        backend = FakeBackend(latency_seconds=0.02)
+        mutator = BatchingMutator(backend, max_concurrency=2, max_batch_size=1)
+        intent = Intent(action="fix", target="data_access")
+
+        await asyncio.gather(*(mutator.mutate(intent) for _ in range(6)))
+        assert backend.max_in_flight == 2
+        assert len(backend.batches) == 6
+
+    async def test_deadline_and_backend_errors_fail_softly(self):
+        """Test missed deadlines and backend errors yield failed mutations."""
+        slow = BatchingMutator(FakeBackend(latency_seconds=1.0), deadline_seconds=0.05)
+        result = await slow.mutate(Intent(action="fix", target="data_access"))
+        assert result.success is False
+        assert "deadline" in result.description
+        assert slow.stats()["deadline_misses"] == 1
+
+        class BrokenBackend(MutationBackend):
+            async def generate_batch(self, intents):
+                raise RuntimeError("model unavailable")
+
+        broken = BatchingMutator(BrokenBackend())
+        result = await broken.mutate(Intent(action="fix", target="data_access"))
+        assert result.success is False
+        assert "model unavailable" in result.description
+
+
+    async def test_short_backend_results_fail_missing_intents(self):
+        """Test intents a backend returned no result for fail instead of hanging."""
+        class ShortBackend(MutationBackend):
+            async def generate_batch(self, intents):
+                return [MutationResult(success=True, code="x = 1")] if len(intents) > 1 else []
+
+        mutator = BatchingMutator(ShortBackend(), max_batch_size=2)
+        intents = [Intent(action="fix", target=f"t{i}") for i in range(3)]
+        results = await asyncio.wait_for(
+            asyncio.gather(*(mutator.mutate(intent) for intent in intents)), timeout=5
+        )
+        assert [r.success for r in results] == [True, False, False]
+        assert "returned 0 results for 1 intents" in results[2].description
+        assert results[1].target == "t1"
+
+        loop = GEPLoop(mutation_backend=BatchingMutator(ShortBackend()))
+        result = await asyncio.wait_for(
+            loop.process_async({"level": "ERROR", "message": "ConnectionError: refused"}), timeout=5
+        )
+        assert result.status == "failed"
+
+    def test_backend_must_implement_generate_batch(self):
+        """Test a backend without generate_batch cannot be created."""
+        class IncompleteBackend(MutationBackend):
+            pass
+
+        with pytest.raises(TypeError):
+            IncompleteBackend()
+
 
 class TestSolidifier:
     """Test gene solidification service."""
@@ -210,6 +881,340 @@ class TestSolidifier:
         assert gene_data["implementation"] == mutation.code
         assert gene_data["status"] == "validated"
 
+    def test_solidify_records_cost_profile(self):
+        """Test measured resource usage is persisted with the gene."""
+        solidifier = Solidifier()
+        mutation = MutationResult(success=True, code="x = 1", description="Constant")
+        validation = ValidationResult(
+            passed=True,
+            execution_time_ms=1.5,
+            cpu_time_ms=1.2,
+            peak_memory_bytes=2048,
+            lines_executed=1,
+        )
+
+        gene_data = solidifier.solidify(mutation, validation)
+        assert gene_data["cost_profile"] == {
+            "execution_time_ms": 1.5,
+            "cpu_time_ms": 1.2,
+            "peak_memory_bytes": 2048,
+            "lines_executed": 1,
+        }
+
+
+    def test_solidify_is_deterministic(self):
+        """Test separate solidifiers name the same mutation identically."""
+        mutation = MutationResult(success=True, code="x = 1", description="Constant")
+        validation = ValidationResult(passed=True)
+
+        first = Solidifier().solidify(mutation, validation)
+        second = Solidifier().solidify(mutation, validation)
+        assert first == second
+        assert first["name"] == f"auto_{first['id']}"
+
+
+class TestGeneWriter:
+    """Test bulk, idempotent gene persistence."""
+
+    def test_bloom_filter_membership(self):
+        """Test added keys are always found and others rarely are."""
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        bloom.update(f"gene_{i}" for i in range(1000))
+        assert all(f"gene_{i}" in bloom for i in range(1000))
+        false_positives = sum(f"other_{i}" in bloom for i in range(10000))
+        assert false_positives < 300
+
+    async def test_write_batch_is_idempotent(self, db_session):
+        """Test one batch inserts each gene once and repeats are skipped."""
+        solidifier = Solidifier()
+        validation = ValidationResult(passed=True)
+        genes = [
+            solidifier.solidify(MutationResult(success=True, code=f"x = {i % 3}"), validation)
+            for i in range(6)
+        ]
+        writer = GeneWriter()
+
+        inserted = await writer.write_batch(db_session, genes)
+        assert sorted(inserted) == sorted({gene["id"] for gene in genes})
+        assert await writer.write_batch(db_session, genes) == []
+        assert writer.stats() == {"written": 3, "skipped": 9, "known": 3}
+
+        # A fresh writer without the filter relies on ON CONFLICT
+        assert await GeneWriter().write_batch(db_session, genes[:3]) == []
+        seeded = GeneWriter()
+        assert await seeded.load(db_session) == 3
+        rows = (await db_session.execute(select(Gene))).scalars().all()
+        assert len(rows) == 3
+
+
+class TestDeduplicator:
+    """Test error fingerprinting and deduplication."""
+
+    def test_normalize_masks_variable_parts(self):
+        """Test numbers, UUIDs, hex, IPs and paths are masked."""
+        message = (
+            "ConnectionError: 10.0.0.12:5432 refused for request "
+            "3f2b8c1e-9d4a-4f6b-8a2e-1c5d7e9f0a3b at 0x7ffde4a1 "
+            "reading /var/lib/app/data.db after 3 retries"
+        )
+        assert normalize_message(message) == (
+            "ConnectionError: <ip> refused for request <uuid> at <hex> "
+            "reading <path> after <num> retries"
+        )
+
+    def test_fingerprint_ignores_hosts_and_ids(self):
+        """Test copies of the same error share a fingerprint."""
+        a = {"level": "ERROR", "message": "ConnectionError: db-1 10.0.0.1:5432 id=17"}
+        b = {"level": "ERROR", "message": "ConnectionError: db-2 10.0.0.9:6543 id=4242"}
+        c = {"level": "ERROR", "message": "TimeoutError: db-1 10.0.0.1:5432 id=17"}
+        assert fingerprint(a) == fingerprint(b)
+        assert fingerprint(a) != fingerprint(c)
+
+    def test_loop_reuses_result_within_ttl(self):
+        """Test duplicates skip mutation and reuse the earlier result."""
+        now = [0.0]
+        dedup = Deduplicator(ttl_seconds=10, clock=lambda: now[0])
+        loop = GEPLoop(deduplicator=dedup)
+        calls = []
+        mutate = loop.mutator.mutate
+        loop.mutator.mutate = lambda intent: calls.append(intent) or mutate(intent)
+
+        first = loop.process({"level": "ERROR", "message": "KeyError: 'user_1'"})
+        second = loop.process({"level": "ERROR", "message": "KeyError: 'user_2'"})
+        assert second is first
+        assert len(calls) == 1
+
+        now[0] = 11.0
+        loop.process({"level": "ERROR", "message": "KeyError: 'user_3'"})
+        assert len(calls) == 2
+
+        stats = dedup.stats()
+        assert stats["seen"] == 3
+        assert stats["deduplicated"] == 1
+        assert stats["unique"] == 2
+
+    def test_loop_skips_duplicates_without_reuse(self):
+        """Test duplicates are counted and skipped when reuse is disabled."""
+        loop = GEPLoop(deduplicator=Deduplicator(reuse_results=False))
+        loop.process({"level": "ERROR", "message": "KeyError: 'a1'"})
+        result = loop.process({"level": "ERROR", "message": "KeyError: 'a2'"})
+        assert result.status == "skipped"
+        assert "Duplicate" in result.error
+
+    def test_max_entries_bounds_cache(self):
+        """Test least recently used fingerprints are evicted."""
+        dedup = Deduplicator(max_entries=2)
+        for key in ["a", "b", "c"]:
+            dedup.put(key, key)
+        assert dedup.get("a") is None
+        assert dedup.get("c") == "c"
+        assert dedup.stats()["cached"] == 2
+
+
+class TestSignalScheduler:
+    """Test priority scheduling of evolution signals."""
+
+    def test_priority_order_and_fifo_ties(self):
+        """Test higher priority is served first, equal priority in arrival order."""
+        scheduler = SignalScheduler(aging_rate=0.0)
+        for name, priority in [("low", 2), ("high-1", 9), ("mid", 5), ("high-2", 9)]:
+            scheduler.put(EvolutionSignal(signal_type="repair", priority=priority), name)
+
+        assert [scheduler.get() for _ in range(4)] == ["high-1", "high-2", "mid", "low"]
+
+    def test_aging_prevents_starvation(self):
+        """Test a long-waiting low-priority signal overtakes fresh high-priority ones."""
+        now = [0.0]
+        scheduler = SignalScheduler(aging_rate=1.0, clock=lambda: now[0])
+        scheduler.put(EvolutionSignal(signal_type="improve", priority=2), "old-low")
+        now[0] = 10.0
+        scheduler.put(EvolutionSignal(signal_type="repair", priority=10), "new-high")
+
+        assert scheduler.get() == "old-low"
+        stats = scheduler.stats()
+        assert stats["dequeued"] == 1
+        assert stats["depth"] == 1
+        assert stats["wait_ms_max"] == 10000.0
+
+    def test_bounded_put_and_close(self):
+        """Test put times out when full and get drains after close."""
+        scheduler = SignalScheduler(max_size=1)
+        signal = EvolutionSignal(signal_type="repair")
+        scheduler.put(signal, "a")
+        with pytest.raises(queue.Full):
+            scheduler.put(signal, "b", timeout=0.01)
+
+        scheduler.close()
+        assert scheduler.get() == "a"
+        assert scheduler.get() is None
+
+
+class TestSignalCoalescer:
+    """Test coalescing of repeated signals."""
+
+    def test_merges_same_problem_within_window(self):
+        """Test matching signals merge with an occurrence count and boosted priority."""
+        now = [0.0]
+        coalescer = SignalCoalescer(window_seconds=5, clock=lambda: now[0])
+        for i in range(4):
+            ready = coalescer.add(
+                EvolutionSignal(signal_type="improve", patterns=["Timeout"], priority=5, source="api"),
+                item=i,
+            )
+            assert ready == []
+        coalescer.add(EvolutionSignal(signal_type="improve", patterns=["Timeout"], source="db"), item="db")
+
+        now[0] = 5.0
+        ready = coalescer.add(EvolutionSignal(signal_type="repair", patterns=["KeyError"]), item="late")
+        assert len(ready) == 2
+        merged, items = ready[0]
+        assert merged.occurrences == 4
+        assert merged.priority == 7
+        assert items == [0, 1, 2, 3]
+        assert ready[1][1] == ["db"]
+
+        flushed = coalescer.flush()
+        assert [items for _, items in flushed] == [["late"]]
+        assert coalescer.stats() == {"signals_in": 6, "signals_out": 3, "open_windows": 0}
+
+    def test_max_groups_closes_oldest_window(self):
+        """Test open windows stay bounded."""
+        coalescer = SignalCoalescer(max_groups=1)
+        coalescer.add(EvolutionSignal(signal_type="repair", patterns=["A"]), item="a")
+        ready = coalescer.add(EvolutionSignal(signal_type="repair", patterns=["B"]), item="b")
+        assert [items for _, items in ready] == [["a"]]
+        assert coalescer.pending() == 1
+
+    def test_loop_runs_once_per_problem(self):
+        """Test a burst of identical errors mutates once and shares the result."""
+        loop = GEPLoop()
+        calls = []
+        mutate = loop.mutator.mutate
+        loop.mutator.mutate = lambda intent: calls.append(intent) or mutate(intent)
+        logs = [{"level": "ERROR", "message": "KeyError: 'x'", "source": "api"}] * 50
+        logs.insert(10, {"level": "INFO", "message": "ok"})
+
+        results = loop.process_coalesced(logs)
+        assert len(results) == 51
+        assert len(calls) == 1
+        assert results[10].status == "skipped"
+        assert results[0].status == "success"
+        assert results[0].signal.occurrences == 50
+        assert results[-1] is results[0]
+
+
+class TestGeneIndex:
+    """Test validated gene lookup and reuse."""
+
+    def test_lookup_prefers_highest_success_rate(self):
+        """Test lookup returns the best gene carrying the requested tags."""
+        index = GeneIndex()
+        for gene_id, rate, tags in [
+            ("a", 0.85, ["target:api_timeout"]),
+            ("b", 0.99, ["target:api_timeout"]),
+            ("c", 0.95, ["target:api_timeout", "resilience"]),
+            ("d", 1.0, ["target:data_access"]),
+            ("e", 1.0, ["api_timeout"]),
+        ]:
+            index.upsert({"id": gene_id, "status": "validated", "success_rate": rate, "context_tags": tags})
+
+        assert index.lookup("api_timeout")["id"] == "b"
+        assert index.lookup("api_timeout", tags=["resilience"])["id"] == "c"
+        assert index.lookup("api_timeout", min_success_rate=0.999) is None
+        assert index.lookup("missing") is None
+        assert len(index) == 4
+
+        index.upsert({"id": "b", "status": "validated", "success_rate": 0.1, "context_tags": ["target:api_timeout"]})
+        assert index.lookup("api_timeout")["id"] == "c"
+        index.remove("c")
+        assert index.lookup("api_timeout")["id"] == "a"
+
+    def test_loop_reuses_solidified_gene(self):
+        """Test a second issue with the same target inherits the first gene."""
+        loop = GEPLoop(gene_index=GeneIndex())
+        calls = []
+        mutate = loop.mutator.mutate
+        loop.mutator.mutate = lambda intent: calls.append(intent) or mutate(intent)
+
+        first = loop.process({"level": "ERROR", "message": "ConnectionError: refused"})
+        second = loop.process({"level": "ERROR", "message": "ConnectionError: reset by peer"})
+        assert first.status == "success"
+        assert first.reused is False
+        assert "target:database_connection" in first.gene_data["context_tags"]
+        assert second.status == "success"
+        assert second.reused is True
+        assert second.mutation is None
+        assert second.gene_data["id"] == first.gene_data["id"]
+        assert len(calls) == 1
+
+    def test_loop_reuses_only_genes_of_the_intent_action(self):
+        """Test genes of another action or output kind are not inherited."""
+        index = GeneIndex()
+        for gene_id, tags in [
+            ("optimize", ["target:database_connection", "action:optimize", "code"]),
+            ("prompt", ["target:database_connection", "action:fix", "prompt"]),
+        ]:
+            index.upsert({"id": gene_id, "status": "validated", "success_rate": 1.0, "context_tags": tags})
+        loop = GEPLoop(gene_index=index)
+
+        first = loop.process({"level": "ERROR", "message": "ConnectionError: refused"})
+        assert first.status == "success"
+        assert first.reused is False
+        assert "action:fix" in first.gene_data["context_tags"]
+
+        second = loop.process({"level": "ERROR", "message": "ConnectionError: reset"})
+        assert second.reused is True
+        assert second.gene_data["id"] == first.gene_data["id"]
+
+    def test_loop_does_not_reuse_genes_for_unknown_target(self):
+        """Test unclassified signals are not served one shared gene."""
+        loop = GEPLoop(gene_index=GeneIndex())
+        first = loop.process({"level": "ERROR", "message": "RuntimeError: boom"})
+        second = loop.process({"level": "ERROR", "message": "RuntimeError: bang"})
+        assert first.intent.target == second.intent.target == "unknown"
+        assert first.reused is False
+        assert second.reused is False
+
+
+class TestLoopMetrics:
+    """Test latency histograms and loop metrics."""
+
+    def test_histogram_percentiles_within_precision(self):
+        """Test percentiles stay within the histogram's relative error."""
+        histogram = LatencyHistogram(significant_bits=8)
+        values = [(i * 7919) % 1_000_003 + 1 for i in range(20000)]
+        for value in values:
+            histogram.record(value)
+
+        values.sort()
+        for percent in (50, 90, 99, 99.9):
+            exact = values[round(len(values) * percent / 100) - 1]
+            assert abs(histogram.percentile(percent) - exact) / exact <= 2 ** -7
+        assert histogram.percentile(100) == histogram.max == values[-1]
+        assert histogram.min == values[0]
+        assert len(histogram._counts) < 2000
+
+    def test_histogram_small_values_exact(self):
+        """Test values below the sub-bucket range are kept exactly."""
+        histogram = LatencyHistogram(significant_bits=4)
+        for value in range(16):
+            histogram.record(value)
+        assert [histogram.percentile(p) for p in (25, 50, 100)] == [3, 7, 15]
+
+    def test_metrics_merge(self):
+        """Test merging adds counters and histograms."""
+        first, second = LoopMetrics(), LoopMetrics()
+        first.record("success", {"scan": 100, "signal": 50})
+        second.record("skipped", {"scan": 300})
+        second.record("failed", {})
+
+        first.merge(second)
+        snapshot = first.snapshot()
+        assert snapshot["statuses"] == {"success": 1, "failed": 1, "skipped": 1}
+        assert snapshot["stages"]["scan"]["count"] == 2
+        assert snapshot["stages"]["scan"]["max"] == 300
+        assert snapshot["stages"]["signal"]["count"] == 1
+
 
 class TestGEPLoop:
     """Test full GEP loop integration."""
@@ -219,6 +1224,49 @@ class TestGEPLoop:
         loop = GEPLoop()
         assert loop is not None
 
+    def test_gep_loop_tournament_records_candidates(self):
+        """Test tournament mode solidifies the fittest of several candidates."""
+        loop = GEPLoop(tournament=Tournament(size=3))
+        result = loop.process({"level": "ERROR", "message": "ConnectionError: refused"})
+
+        assert result.status == "success"
+        assert len(result.candidates) == 3
+        winner = Tournament.best(result.candidates)
+        assert result.mutation is winner.mutation
+        assert result.gene_data["implementation"] == winner.mutation.code
+
+    def test_gep_loop_tournament_uses_loop_validator(self):
+        """Test tournament candidates are validated by the loop's validator."""
+        class RecordingValidator(Validator):
+            def __init__(self):
+                super().__init__()
+                self.batches = []
+
+            def validate_many(self, codes, tests=None):
+                self.batches.append(len(codes))
+                return super().validate_many(codes, tests)
+
+        validator = RecordingValidator()
+        loop = GEPLoop(validator=validator, tournament=Tournament(size=3))
+        assert loop.process({"level": "ERROR", "message": "ConnectionError: refused"}).status == "success"
+        assert validator.batches == [3]
+
+    async def test_gep_loop_awaits_mutations_concurrently(self):
+        """Test async processing overlaps slow mutation backend calls."""
+        backend = FakeBackend(latency_seconds=0.2)
+        loop = GEPLoop(mutation_backend=BatchingMutator(backend, max_batch_size=4))
+        logs = [{"level": "ERROR", "message": f"KeyError: 'k{i}'"} for i in range(8)]
+
+        start = time.perf_counter()
+        results = await loop.process_batch_async(logs)
+        elapsed = time.perf_counter() - start
+
+        expected = GEPLoop().process_batch(logs)
+        assert [r.status for r in results] == [r.status for r in expected]
+        assert [r.scan_result.raw_log for r in results] == logs
+        assert elapsed < 0.2 * 8 / 2
+        assert sum(backend.batches) == 8
+
     def test_gep_loop_process_error(self):
         """Test processing an error through the loop."""
         loop = GEPLoop()
@@ -230,3 +1278,227 @@ class TestGEPLoop:
         result = loop.process(error_log)
         assert result is not None
         assert result.status in ["success", "failed", "skipped"]
+
+    async def test_gep_loop_process_stream_bounded(self):
+        """Test streaming entries keeps at most max_in_flight entries pending."""
+        loop = GEPLoop()
+        pulled = 0
+        max_ahead = 0
+        results = []
+
+        async def source():
+            nonlocal pulled
+            for i in range(50):
+                pulled += 1
+                yield {"level": "ERROR" if i % 2 else "INFO", "message": f"KeyError: {i}"}
+
+        async for result in loop.process_stream(source(), max_in_flight=4):
+            results.append(result)
+            max_ahead = max(max_ahead, pulled - len(results))
+
+        assert len(results) == 50
+        assert max_ahead <= 4
+        assert sum(1 for r in results if r.status == "skipped") == 25
+
+    async def test_gep_loop_process_pipeline(self):
+        """Test the staged pipeline gives the sequential statuses."""
+        loop = GEPLoop(tournament=Tournament(size=2))
+        logs = [
+            {"level": "WARNING", "message": "TimeoutError in worker"},
+            {"level": "INFO", "message": "ok"},
+            {"level": "ERROR", "message": "ConnectionError: refused"},
+            {"level": "ERROR", "message": "KeyError: 'x'"},
+        ] * 5
+
+        results = [r async for r in loop.process_pipeline(logs, concurrency={"validate": 3})]
+        expected = GEPLoop(tournament=Tournament(size=2)).process_batch(logs)
+        key = lambda r: (r.scan_result.raw_log["message"], r.status, len(r.candidates))
+        assert sorted(map(key, results)) == sorted(map(key, expected))
+
+    async def test_gep_loop_process_pipeline_backpressure(self):
+        """Test a slow Validate stage throttles how far the source is read."""
+        loop = GEPLoop()
+        pulled = 0
+        max_ahead = 0
+        results = []
+
+        async def source():
+            nonlocal pulled
+            for i in range(60):
+                pulled += 1
+                yield {"level": "ERROR", "message": f"KeyError: {i}"}
+
+        slow = loop.validator.validate_code
+
+        def validate_code(code):
+            time.sleep(0.002)
+            return slow(code)
+
+        loop.validator.validate_code = validate_code
+        async for result in loop.process_pipeline(source(), queue_size=2):
+            results.append(result)
+            max_ahead = max(max_ahead, pulled - len(results))
+
+        assert len(results) == 60
+        # Two slots per queue plus one entry held by each worker
+        assert max_ahead <= 2 * 6 + sum(PIPELINE_CONCURRENCY.values()) + 1
+
+    async def test_gep_loop_process_pipeline_process_pool(self):
+        """Test Validate can run in a process pool while other stages cannot."""
+        loop = GEPLoop()
+        logs = [{"level": "ERROR", "message": f"KeyError: 'k{i}'"} for i in range(4)]
+
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            results = [
+                r async for r in loop.process_pipeline(logs, executors={"validate": pool})
+            ]
+            with pytest.raises(ValueError):
+                async for _ in loop.process_pipeline(logs, executors={"solidify": pool}):
+                    pass
+
+        assert [r.status for r in results] == ["success"] * 4
+
+    def test_gep_loop_process_batch_parallel(self):
+        """Test parallel processing matches sequential results in input order."""
+        loop = GEPLoop(deduplicator=Deduplicator(), gene_index=GeneIndex())
+        logs = [
+            {"level": "WARNING", "message": "TimeoutError in worker"},
+            {"level": "INFO", "message": "ok"},
+            None,
+            {"level": "ERROR", "message": "ConnectionError: refused"},
+            {"level": "ERROR", "message": "KeyError: 'x'"},
+        ] * 4
+
+        results = loop.process_batch_parallel(logs, workers=2, chunk_size=3)
+        expected = GEPLoop(deduplicator=Deduplicator()).process_batch(logs)
+        assert [(r.status, r.error) for r in results] == [(r.status, r.error) for r in expected]
+        assert loop.deduplicator.stats()["cached"] == 3
+        assert loop.gene_index.lookup("api_timeout") is not None
+
+    def test_gep_loop_iter_parallel_as_completed(self):
+        """Test as-completed delivery yields every input index once."""
+        loop = GEPLoop()
+        logs = [{"level": "ERROR", "message": f"KeyError: 'k{i}'"} for i in range(10)]
+
+        pairs = list(loop.iter_parallel(logs, workers=2, chunk_size=4, ordered=False))
+        assert sorted(index for index, _ in pairs) == list(range(10))
+        assert all(result.scan_result.raw_log == logs[index] for index, result in pairs)
+
+    def test_gep_loop_pickles_for_workers(self):
+        """Test a loop with shared state can be copied to a worker process."""
+        loop = GEPLoop(deduplicator=Deduplicator(), gene_index=GeneIndex())
+        loop.process({"level": "ERROR", "message": "ConnectionError: refused"})
+
+        copy = pickle.loads(pickle.dumps(loop))
+        assert copy.scheduler is None
+        assert copy.process({"level": "ERROR", "message": "ConnectionError: refused"}).status == "success"
+        assert copy.deduplicator.stats()["deduplicated"] == 1
+
+    def test_gep_loop_stage_timings(self):
+        """Test results carry stage timings that feed the loop's stats."""
+        loop = GEPLoop()
+        success = loop.process({"level": "ERROR", "message": "ConnectionError: refused"})
+        skipped = loop.process({"level": "INFO", "message": "ok"})
+
+        assert list(success.timings) == [
+            "scan", "signal", "intent", "mutate", "validate", "solidify",
+        ]
+        assert all(elapsed > 0 for elapsed in success.timings.values())
+        assert list(skipped.timings) == ["scan"]
+
+        stats = loop.stats()
+        assert stats["statuses"] == {"success": 1, "failed": 0, "skipped": 1}
+        assert stats["stages"]["scan"]["count"] == 2
+        assert stats["stages"]["validate"]["count"] == 1
+        assert stats["stages"]["validate"]["max"] == success.timings["validate"]
+
+    def test_gep_loop_stats_across_modes(self):
+        """Test every processing mode records one status per entry."""
+        loop = GEPLoop(deduplicator=Deduplicator())
+        logs = [
+            {"level": "ERROR", "message": "KeyError: 'x'"},
+            {"level": "INFO", "message": "ok"},
+            None,
+        ] * 2
+
+        loop.process_batch(logs)
+        loop.process_scheduled(logs, workers=2)
+        loop.process_coalesced(logs)
+        loop.process_batch_parallel(logs, workers=2, chunk_size=2)
+        assert sum(loop.stats()["statuses"].values()) == 4 * len(logs)
+
+    def test_gep_loop_compact_results(self):
+        """Test compact mode gives the same outcomes without holding raw logs."""
+        logs = [
+            {"level": "WARNING", "message": "TimeoutError in worker", "source": "api"},
+            {"level": "INFO", "message": "ok"},
+            None,
+            {"level": "ERROR", "message": "ConnectionError: refused", "source": "db"},
+        ] * 2
+
+        results = GEPLoop(compact=True).process_batch(logs)
+        expected = GEPLoop().process_batch(logs)
+        assert [(r.status, r.error) for r in results] == [(r.status, r.error) for r in expected]
+        assert all(r.scan_result is None or r.scan_result.raw_log is None for r in results)
+        assert not hasattr(results[0], "__dict__")
+        assert pickle.loads(pickle.dumps(results[0])).signal.patterns == ("TimeoutError", "Error", "Timeout")
+
+    def test_gep_loop_iter_process_lazy(self):
+        """Test entries are pulled one at a time and skipped results filtered."""
+        loop = GEPLoop()
+        pulled = []
+
+        def logs():
+            for i in range(6):
+                pulled.append(i)
+                if i % 3:
+                    yield {"level": "INFO", "message": "ok"}
+                else:
+                    yield {"level": "ERROR", "message": f"KeyError: 'k{i}'"}
+
+        results = loop.iter_process(logs(), statuses={"success", "failed"})
+        assert pulled == []
+        assert next(results).status == "success"
+        assert pulled == [0]
+        assert [r.status for r in results] == ["success"]
+        assert pulled == list(range(6))
+        assert loop.stats()["statuses"]["skipped"] == 4
+
+    def test_gep_loop_process_scheduled(self):
+        """Test scheduled processing matches sequential results in input order."""
+        loop = GEPLoop(scheduler=SignalScheduler(max_size=2))
+        logs = [
+            {"level": "WARNING", "message": "TimeoutError in worker"},
+            {"level": "INFO", "message": "ok"},
+            {"level": "ERROR", "message": "ConnectionError: refused"},
+            {"level": "ERROR", "message": "KeyError: 'x'"},
+        ] * 5
+
+        results = loop.process_scheduled(logs, workers=3)
+        expected = GEPLoop().process_batch(logs)
+        assert [r.status for r in results] == [r.status for r in expected]
+        assert [r.scan_result.raw_log for r in results] == logs
+        stats = loop.scheduler.stats()
+        assert stats["dequeued"] == 15
+        assert stats["max_depth"] <= 2
+
+    def test_gep_loop_process_scheduled_dedups_in_flight(self):
+        """Test copies of an entry still in flight are validated only once."""
+        loop = GEPLoop(deduplicator=Deduplicator())
+        logs = [{"level": "ERROR", "message": "KeyError: 'x'"}] * 200
+
+        results = loop.process_scheduled(logs, workers=4)
+        assert len(results) == 200
+        assert {r.status for r in results} == {"success"}
+        assert loop.stats()["stages"]["validate"]["count"] == 1
+        assert loop.deduplicator.stats()["deduplicated"] == 199
+
+    async def test_gep_loop_process_pipeline_dedups_in_flight(self):
+        """Test copies of an entry still in the pipeline follow its result."""
+        loop = GEPLoop(deduplicator=Deduplicator())
+        logs = [{"level": "ERROR", "message": "KeyError: 'x'"}] * 50
+
+        results = [r async for r in loop.process_pipeline(logs, concurrency={"validate": 4})]
+        assert len(results) == 50
+        assert {r.status for r in results} == {"success"}
+        assert loop.stats()["stages"]["validate"]["count"] == 1
@@ -0,0 +1,75 @@
+"""Test JSONL log replay."""
+import json
+
+from app.services.replay import chunk_offsets, main, replay_file
+
+
+def _write_logs(path, count: int) -> list[dict]:
+    logs = []
+    for i in range(count):
+        level = "ERROR" if i % 3 == 0 else "INFO"
+        logs.append({"level": level, "message": f"KeyError: 'key_{i}'", "seq": i})
+    path.write_text("".join(json.dumps(log) + "\n" for log in logs))
+    return logs
+
+
+class TestReplay:
+    """Test memory-mapped parallel replay."""
+
+    def test_chunk_offsets_align_to_lines(self, tmp_path):
+        """Test chunks cover the file and end on newlines."""
+        path = tmp_path / "logs.jsonl"
+        _write_logs(path, 50)
+        data = path.read_bytes()
+
+        offsets = chunk_offsets(str(path), chunk_bytes=100)
+        assert len(offsets) > 1
+        assert offsets[0][0] == 0
+        assert offsets[-1][1] == len(data)
+        for (_, end), (start, _) in zip(offsets, offsets[1:]):
+            assert end == start
+            assert data[end - 1:end] == b"\n"
+
+    def test_chunk_offsets_empty_file(self, tmp_path):
+        """Test empty file yields no chunks."""
+        path = tmp_path / "empty.jsonl"
+        path.write_text("")
+        assert chunk_offsets(str(path)) == []
+
+    def test_replay_preserves_input_order(self, tmp_path):
+        """Test results are merged in input order across workers."""
+        path = tmp_path / "logs.jsonl"
+        logs = _write_logs(path, 60)
+        with path.open("a") as f:
+            f.write("\nnot json\n")
+
+        stats, results = replay_file(str(path), workers=2, chunk_bytes=256)
+        assert stats.lines == 61
+        assert stats.chunks > 1
+        assert stats.lines_per_sec > 0
+        assert sum(stats.status_counts.values()) == 61
+        assert [r.scan_result.raw_log["seq"] for r in results[:60]] == list(range(60))
+        assert results[-1].status == "failed"
+        assert "Invalid JSON" in results[-1].error
+
+    def test_replay_status_filter(self, tmp_path):
+        """Test only requested statuses are returned, but all are counted."""
+        path = tmp_path / "logs.jsonl"
+        _write_logs(path, 30)
+
+        stats, results = replay_file(str(path), workers=1, statuses={"skipped"})
+        assert stats.status_counts["skipped"] == 20
+        assert len(results) == 20
+        assert all(r.status == "skipped" for r in results)
+
+    def test_main_writes_genes(self, tmp_path, capsys):
+        """Test command writes gene data for successful results."""
+        path = tmp_path / "logs.jsonl"
+        _write_logs(path, 9)
+        output = tmp_path / "genes.jsonl"
+
+        assert main([str(path), "--workers", "1", "--output", str(output)]) == 0
+        genes = [json.loads(line) for line in output.read_text().splitlines()]
+        assert len(genes) == 3
+        assert all(g["status"] == "validated" for g in genes)
+        assert "lines/sec" in capsys.readouterr().err